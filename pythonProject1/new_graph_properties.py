@@ -41,15 +41,34 @@ class Graph:
     def __init__(self):
         self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
+        self.version = 0  # zvyšuje se s každou změnou grafu
+        self._node_order: Optional[Tuple[int, List[str], Dict[str, int]]] = None
     
     def add_node(self, identifier: str, weight: Optional[float] = None):
         """Přidá uzel do grafu"""
         self.nodes[identifier] = Node(identifier, weight)
+        self.version += 1
     
     def add_edge(self, from_node: str, to_node: str, directed: bool,
                  weight: Optional[float] = None, label: Optional[str] = None):
         """Přidá hranu do grafu"""
         self.edges.append(Edge(from_node, to_node, directed, weight, label))
+        self.version += 1
+
+    def _get_node_order(self) -> Tuple[int, List[str], Dict[str, int]]:
+        """Vrátí (verze, seřazené uzly, mapa uzel -> index), počítá se jednou pro každou verzi"""
+        if self._node_order is None or self._node_order[0] != self.version:
+            node_list = sorted(self.nodes.keys())
+            self._node_order = (self.version, node_list, {n: i for i, n in enumerate(node_list)})
+        return self._node_order
+
+    def get_node_list(self) -> List[str]:
+        """Vrátí kanonické pořadí uzlů (řádky/sloupce všech matic) - sdílený seznam, neměnit"""
+        return self._get_node_order()[1]
+
+    def get_node_index(self) -> Dict[str, int]:
+        """Vrátí kanonickou mapu uzel -> index (O(1) místo nodes.index())"""
+        return self._get_node_order()[2]
 
 
 def parse_graph_file(filename: str) -> Graph:
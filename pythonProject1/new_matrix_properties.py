@@ -14,7 +14,7 @@ def analyze_matrix_properties(graph):
     print(f"\n📊 ZÁKLADNÍ INFORMACE:")
     print(f"  Počet uzlů: {len(graph.nodes)}")
     print(f"  Počet hran: {len(graph.edges)}")
-    print(f"  Uzly: {sorted(graph.nodes.keys())}")
+    print(f"  Uzly: {graph.get_node_list()}")
     
     # Interaktivní menu pro matice
     while True:
@@ -455,8 +455,8 @@ def export_matrix_to_csv(matrix: List[List], filename: str, title: str, graph) -
             writer.writerow([f"# Rozměry: {len(matrix)}×{len(matrix[0]) if matrix else 0}"])
             writer.writerow([])  # Prázdný řádek
             
-            # Získat názvy uzlů
-            nodes = sorted(graph.nodes.keys())
+            # Získat názvy uzlů (sdílené pořadí řádků matic)
+            nodes = graph.get_node_list()
             
             # Vytvořit hlavičky pro sloupce (uzly)
             header_row = [''] + nodes
@@ -563,7 +563,7 @@ def offer_distance_search(graph, matrix: List[List[float]]):
 
 def find_distance_in_matrix(graph, matrix: List[List[float]], search_value: float) -> List[Tuple[str, str, float]]:
     """Vyhledá všechny spojení se zadanou vzdáleností"""
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
     results = []
     
     for i, row in enumerate(matrix):
@@ -579,13 +579,14 @@ def find_distance_in_matrix(graph, matrix: List[List[float]], search_value: floa
 
 def get_adjacency_matrix(graph) -> List[List[int]]:
     """Vytvoří matici sousednosti"""
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
+    index = graph.get_node_index()
     n = len(nodes)
     matrix = [[0] * n for _ in range(n)]
     
     for edge in graph.edges:
-        i = nodes.index(edge.from_node)
-        j = nodes.index(edge.to_node)
+        i = index[edge.from_node]
+        j = index[edge.to_node]
         
         if edge.directed:
             matrix[i][j] += 1
@@ -601,14 +602,15 @@ def get_signed_matrix(graph) -> List[List[int]]:
     if not any(edge.directed for edge in graph.edges):
         return None  # Pouze pro orientované grafy
     
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
+    index = graph.get_node_index()
     n = len(nodes)
     matrix = [[0] * n for _ in range(n)]
     
     for edge in graph.edges:
         if edge.directed:
-            i = nodes.index(edge.from_node)
-            j = nodes.index(edge.to_node)
+            i = index[edge.from_node]
+            j = index[edge.to_node]
             matrix[i][j] = 1
             matrix[j][i] = -1
     
@@ -680,7 +682,8 @@ def matrix_multiply(a: List[List], b: List[List]) -> List[List]:
 
 def get_incidence_matrix(graph) -> List[List[int]]:
     """Vytvoří matici incidence"""
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
+    index = graph.get_node_index()
     edges = graph.edges
     n = len(nodes)
     m = len(edges)
@@ -688,8 +691,8 @@ def get_incidence_matrix(graph) -> List[List[int]]:
     matrix = [[0] * m for _ in range(n)]
     
     for j, edge in enumerate(edges):
-        i_from = nodes.index(edge.from_node)
-        i_to = nodes.index(edge.to_node)
+        i_from = index[edge.from_node]
+        i_to = index[edge.to_node]
         
         if edge.directed:
             matrix[i_from][j] = 1
@@ -703,7 +706,8 @@ def get_incidence_matrix(graph) -> List[List[int]]:
 
 def get_distance_matrix(graph) -> List[List[float]]:
     """Vytvoří matici délek (Floyd-Warshall)"""
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
+    index = graph.get_node_index()
     n = len(nodes)
     
     # Inicializace
@@ -713,8 +717,8 @@ def get_distance_matrix(graph) -> List[List[float]]:
     
     # Přidat hrany
     for edge in graph.edges:
-        i = nodes.index(edge.from_node)
-        j = nodes.index(edge.to_node)
+        i = index[edge.from_node]
+        j = index[edge.to_node]
         weight = edge.weight if edge.weight is not None else 1.0
         
         if edge.directed:
@@ -741,14 +745,15 @@ def get_distance_matrix(graph) -> List[List[float]]:
 
 def get_predecessor_matrix(graph) -> List[List[int]]:
     """Vytvoří matici předchůdců"""
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
+    index = graph.get_node_index()
     n = len(nodes)
     matrix = [[0] * n for _ in range(n)]
     
     for edge in graph.edges:
         if edge.directed:
-            i = nodes.index(edge.from_node)
-            j = nodes.index(edge.to_node)
+            i = index[edge.from_node]
+            j = index[edge.to_node]
             matrix[j][i] = 1  # j má předchůdce i
     
     return matrix
@@ -777,7 +782,7 @@ def print_adjacency_list(graph):
     print("SEZNAM SOUSEDŮ (Dynamický seznam sousedů)")
     print(f"{'='*80}")
     
-    nodes = sorted(graph.nodes.keys())
+    nodes = graph.get_node_list()
     
     for node in nodes:
         neighbors = []
@@ -798,7 +803,7 @@ def print_node_edge_list(graph):
     print(f"{'='*80}")
     
     print(f"\n📋 UZLY ({len(graph.nodes)}):")
-    for node_name in sorted(graph.nodes.keys()):
+    for node_name in graph.get_node_list():
         node_obj = graph.nodes[node_name]
         weight_str = f" (váha: {node_obj.weight})" if node_obj.weight is not None else ""
         print(f"  • {node_name}{weight_str}")
@@ -0,0 +1,93 @@
+"""
+Regresní benchmark pro MatrixAnalyzer.get_adjacency_matrix().
+
+Ověřuje, že stavba matice sousednosti roste lineárně s počtem hran,
+že řídká matice (SparseMatrix) nealokuje n x n buněk a že výsledek
+odpovídá naivnímu výpočtu přes všechny dvojice uzlů.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_adjacency_matrix
+"""
+
+import random
+import sys
+import time
+
+from graph_analyzer.analyzers import MatrixAnalyzer
+from graph_analyzer.models import Graph, Node, Edge
+
+
+def random_graph(n, m, directions=('>', '-', '<'), seed=0):
+    """Vytvoří náhodný multigraf s n uzly a m hranami."""
+    rng = random.Random(seed)
+    nodes = {f"n{i}": Node(f"n{i}") for i in range(n)}
+    ids = list(nodes)
+    edges = [Edge(nodes[rng.choice(ids)], nodes[rng.choice(ids)], rng.choice(directions))
+             for _ in range(m)]
+    graph = Graph()
+    graph.load_from_data(nodes, edges)
+    return graph
+
+
+def naive_adjacency(graph):
+    """Referenční O(n²·deg) výpočet (původní implementace)."""
+    node_list = sorted(graph.nodes.keys())
+    matrix = []
+    for u_id in node_list:
+        row = []
+        for v_id in node_list:
+            count = 0
+            for edge in graph.out_edges(u_id):
+                if edge.v.identifier == v_id and (not graph.is_directed or edge.direction == '>'):
+                    count += 1
+            row.append(count)
+        matrix.append(row)
+    return matrix
+
+
+def timed(graph, dense=False, repeat=3):
+    """Vrátí nejlepší čas stavby matice sousednosti."""
+    analyzer = MatrixAnalyzer(graph)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        analyzer.get_adjacency_matrix(dense=dense)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    # Správnost proti naivní implementaci (orientované, neorientované i smíšené grafy)
+    for directions in (('-',), ('>',), ('<',), ('>', '-', '<')):
+        for seed in range(3):
+            graph = random_graph(40, 200, directions, seed)
+            matrix, _ = MatrixAnalyzer(graph).get_adjacency_matrix()
+            if matrix.to_dense() != naive_adjacency(graph):
+                print(f"CHYBA: matice se liší od naivního výpočtu ({directions}, seed={seed})")
+                return 1
+    print("Správnost: OK (shoda s naivním výpočtem)")
+
+    # Škálování s počtem hran při pevném n: čas na hranu by měl zůstat zhruba konstantní
+    n = 500
+    base = timed(random_graph(n, 0))
+    print(f"\nn = {n}, prázdná matice: {base * 1000:.1f} ms")
+    print(f"{'m':>8} {'čas [ms]':>10} {'(čas - prázdná) / m [µs]':>26}")
+    for m in (10_000, 20_000, 40_000, 80_000):
+        t = timed(random_graph(n, m))
+        print(f"{m:>8} {t * 1000:>10.1f} {max(t - base, 0) / m * 1e6:>26.3f}")
+
+    # Škálování s počtem uzlů při pevném m: řídká matice O(n + m), hustá navíc alokuje n²
+    m = 10_000
+    print(f"\nm = {m}")
+    print(f"{'n':>8} {'řídká [ms]':>12} {'hustá [ms]':>12} {'hustá / n² [ns]':>17}")
+    for n in (250, 500, 1000, 2000):
+        graph = random_graph(n, m)
+        t_sparse = timed(graph)
+        t_dense = timed(graph, dense=True)
+        print(f"{n:>8} {t_sparse * 1000:>12.1f} {t_dense * 1000:>12.1f} {t_dense / (n * n) * 1e9:>17.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Benchmark MatrixAnalyzer.get_adjacency_power(): čistý Python vs. NumPy.
+
+Ověřuje, že oba výpočty dávají totožné matice (včetně velkých exponentů,
+kdy čísla přesáhnou int64), a vypisuje časy obou variant.
+
+Spuštění z kořenového adresáře projektu (vyžaduje NumPy):
+
+    python3 -m benchmarks.bench_adjacency_power
+"""
+
+import sys
+import time
+
+from graph_analyzer.analyzers import MatrixAnalyzer
+from graph_analyzer.analyzers.numpy_support import has_numpy
+
+from .bench_adjacency_matrix import random_graph
+
+
+def timed_power(analyzer, k, use_numpy):
+    """Vrátí (výsledek, čas) výpočtu A^k zvoleným backendem."""
+    analyzer.use_numpy = use_numpy
+    start = time.perf_counter()
+    result, _ = analyzer.get_adjacency_power(k)
+    return result, time.perf_counter() - start
+
+
+def main():
+    if not has_numpy():
+        print("NumPy není nainstalováno - benchmark nelze spustit")
+        return 1
+
+    print(f"{'n':>6} {'m':>7} {'k':>4} {'Python [s]':>11} {'NumPy [s]':>10} {'bitů':>6}")
+    for n, m, k in ((100, 1000, 5), (300, 3000, 5), (300, 3000, 12), (100, 1000, 60)):
+        analyzer = MatrixAnalyzer(random_graph(n, m, ('>',), seed=1))
+        py_result, py_time = timed_power(analyzer, k, use_numpy=False)
+        np_result, np_time = timed_power(analyzer, k, use_numpy=True)
+        if not py_result.structurally_equal(np_result):
+            print(f"CHYBA: výsledky se liší (n={n}, m={m}, k={k})")
+            return 1
+        bits = max(py_result.data, default=0).bit_length()
+        print(f"{n:>6} {m:>7} {k:>4} {py_time:>11.3f} {np_time:>10.3f} {bits:>6}")
+    print("\nVýsledky obou backendů jsou totožné")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Benchmark bitově paralelního BFS (BitsetBFS) proti BFS z každého zdroje zvlášť.
+
+Ověřuje, že řádky vzdáleností i metriky zdrojů (excentricita, počet
+dosažených uzlů, součet vzdáleností) jsou shodné s klasickým BFS, a vypisuje
+časy pro backend s Python int i s NumPy (je-li nainstalováno).
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_bitset_bfs
+"""
+
+import sys
+import time
+
+from graph_analyzer.analyzers.bitset_bfs import BitsetBFS
+from graph_analyzer.analyzers.numpy_support import has_numpy
+from graph_analyzer.analyzers.path_analyzer import _bfs_row
+
+from .bench_adjacency_matrix import random_graph
+
+
+def check(csr, use_numpy):
+    """Porovná BitsetBFS s BFS z jednotlivých zdrojů; vrátí True při shodě."""
+    n = csr.node_count()
+    reference = [_bfs_row(csr.offsets, csr.targets, source) for source in range(n)]
+    for batch_size in (7, 64, 256):
+        result = BitsetBFS(csr.offsets, csr.targets, use_numpy, batch_size).run(range(n), rows=True)
+        if result['rows'] != reference:
+            return False
+        for i, row in enumerate(reference):
+            reached = [d for d in row if d >= 0]
+            if (result['eccentricity'][i], result['reached'][i], result['distance_sum'][i]) != \
+                    (max(reached), len(reached), sum(reached)):
+                return False
+    return True
+
+
+def timed(fn):
+    """Vrátí čas volání fn()."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    backends = [False] + ([True] if has_numpy() else [])
+    for directions in (('-',), ('>',), ('>', '-', '<')):
+        for seed in range(3):
+            csr = random_graph(150, 300, directions, seed).get_csr()
+            for use_numpy in backends:
+                if not check(csr, use_numpy):
+                    print(f"CHYBA: výsledky se liší ({directions}, seed={seed}, numpy={use_numpy})")
+                    return 1
+    print("Správnost: OK (shoda s BFS z každého zdroje)")
+    if not has_numpy():
+        print("NumPy není nainstalováno - měří se jen backend s Python int")
+
+    print(f"\n{'n':>6} {'m':>7} {'BFS/zdroj [s]':>14} {'Python int [s]':>15} {'NumPy [s]':>10}")
+    for n, m in ((1000, 10_000), (5000, 20_000)):
+        csr = random_graph(n, m, ('-',), seed=1).get_csr()
+        per_source = timed(lambda: [_bfs_row(csr.offsets, csr.targets, source) for source in range(n)])
+        python_int = timed(lambda: BitsetBFS(csr.offsets, csr.targets, use_numpy=False).run(range(n)))
+        numpy_time = (timed(lambda: BitsetBFS(csr.offsets, csr.targets, use_numpy=True).run(range(n)))
+                      if has_numpy() else float('nan'))
+        print(f"{n:>6} {m:>7} {per_source:>14.2f} {python_int:>15.2f} {numpy_time:>10.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
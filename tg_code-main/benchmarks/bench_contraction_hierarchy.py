@@ -0,0 +1,77 @@
+"""
+Benchmark contraction hierarchy proti Dijkstrovi pro dotazy na nejkratší cestu.
+
+Ověřuje, že délky cest z CH jsou shodné s obousměrnou Dijkstrou, a vypisuje
+dobu sestavení, počet zkratek a čas dávky náhodných dotazů (jednosměrná
+Dijkstra do všech uzlů, obousměrná Dijkstra, CH) včetně průměrného počtu
+uzavřených uzlů.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_contraction_hierarchy [POČET_DOTAZŮ]
+"""
+
+import random
+import sys
+
+from graph_analyzer.analyzers import PathAnalyzer
+from graph_analyzer.models import Graph, Node, Edge
+
+from .bench_distance_matrix import weighted_graph, timed
+
+
+def grid_graph(side, seed=0):
+    """Neorientovaná mřížka side × side s náhodnými váhami 1..20 (model silniční sítě)."""
+    rng = random.Random(seed)
+    nodes = {f"n{r}_{c}": Node(f"n{r}_{c}") for r in range(side) for c in range(side)}
+    edges = []
+    for r in range(side):
+        for c in range(side):
+            if c + 1 < side:
+                edges.append(Edge(nodes[f"n{r}_{c}"], nodes[f"n{r}_{c + 1}"], '-', rng.randint(1, 20)))
+            if r + 1 < side:
+                edges.append(Edge(nodes[f"n{r}_{c}"], nodes[f"n{r + 1}_{c}"], '-', rng.randint(1, 20)))
+    graph = Graph()
+    graph.load_from_data(nodes, edges)
+    return graph
+
+
+def run_queries(analyzer, pairs):
+    """Vrátí (délky cest, průměr uzavřených uzlů) pro všechny dvojice."""
+    costs = []
+    settled = 0
+    for start, end in pairs:
+        result = analyzer.find_shortest_path(start, end)
+        costs.append(result['cost'] if result else None)
+        settled += result['settled'] if result else 0
+    return costs, settled / len(pairs)
+
+
+def main():
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{'graf':>14} {'n':>6} {'sestavení [s]':>14} {'zkratek':>8} "
+          f"{'Dijkstra [s]':>13} {'obousm. [s]':>12} {'CH [s]':>8} {'uzavř. obousm./CH':>18}")
+    for label, graph in (('mřížka 40×40', grid_graph(40, seed=1)),
+                         ('mřížka 80×80', grid_graph(80, seed=1)),
+                         ('náhodný', weighted_graph(1000, 4000, seed=1))):
+        rng = random.Random(2)
+        ids = graph.get_node_list()
+        pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(queries)]
+        analyzer = PathAnalyzer(graph)
+
+        _, plain_time = timed(lambda: [analyzer.get_shortest_distances(start) for start, _ in pairs])
+        (reference, bi_settled), bi_time = timed(lambda: run_queries(analyzer, pairs))
+        hierarchy, build_time = timed(analyzer.build_hierarchy)
+        (costs, ch_settled), ch_time = timed(lambda: run_queries(analyzer, pairs))
+        if costs != reference:
+            print(f"CHYBA: délky cest z CH se liší od Dijkstry ({label})")
+            return 1
+        print(f"{label:>14} {len(ids):>6} {build_time:>14.2f} {hierarchy.shortcut_count:>8} "
+              f"{plain_time:>13.3f} {bi_time:>12.3f} {ch_time:>8.3f} "
+              f"{bi_settled:>9.0f}/{ch_settled:<8.0f}")
+    print("\nVšechny délky cest jsou shodné s Dijkstrou")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
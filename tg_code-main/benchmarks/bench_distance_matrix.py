@@ -0,0 +1,87 @@
+"""
+Benchmark PathAnalyzer.get_all_distances() proti Floyd–Warshallovi.
+
+Ověřuje, že matice vzdáleností z BFS/Dijkstry ze všech zdrojů (sériově
+i v procesech) je shodná s referenčním O(n³) Floyd–Warshallem, a vypisuje
+časy všech variant.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_distance_matrix [JOBS]
+"""
+
+import os
+import random
+import sys
+import time
+
+from graph_analyzer.analyzers import PathAnalyzer
+
+from .bench_adjacency_matrix import random_graph
+
+
+def floyd_warshall(graph):
+    """Referenční O(n³) výpočet nad hustou maticí (jako v project1)."""
+    csr = graph.get_csr()
+    n = csr.node_count()
+    INF = float('inf')
+    dist = [[INF] * n for _ in range(n)]
+    for u in range(n):
+        dist[u][u] = 0
+        for slot in range(csr.offsets[u], csr.offsets[u + 1]):
+            v = csr.targets[slot]
+            w = csr.weights[slot] if graph.is_weighted else 1
+            if w < dist[u][v]:
+                dist[u][v] = w
+    for k in range(n):
+        row_k = dist[k]
+        for i in range(n):
+            row_i = dist[i]
+            d_ik = row_i[k]
+            if d_ik == INF:
+                continue
+            for j in range(n):
+                candidate = d_ik + row_k[j]
+                if candidate < row_i[j]:
+                    row_i[j] = candidate
+    return dist
+
+
+def weighted_graph(n, m, seed=0):
+    """Náhodný orientovaný graf s celočíselnými váhami 1..20."""
+    graph = random_graph(n, m, ('>',), seed)
+    rng = random.Random(seed)
+    for edge in graph.edges:
+        edge.weight = rng.randint(1, 20)
+    graph.load_from_data(graph.nodes, graph.edges)
+    return graph
+
+
+def timed(fn):
+    """Vrátí (výsledek, čas) volání fn()."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    print(f"{'graf':>10} {'n':>6} {'m':>7} {'FW [s]':>9} {'1 proces [s]':>13} {f'{jobs} proc. [s]':>13}")
+    for label, make in (('neohodn.', lambda n, m: random_graph(n, m, ('>',), seed=1)),
+                        ('ohodn.', lambda n, m: weighted_graph(n, m, seed=1))):
+        for n, m in ((100, 1000), (200, 2000), (400, 4000)):
+            graph = make(n, m)
+            analyzer = PathAnalyzer(graph)
+            reference, fw_time = timed(lambda: floyd_warshall(graph))
+            serial, serial_time = timed(lambda: analyzer.get_all_distances())
+            parallel, parallel_time = timed(lambda: analyzer.get_all_distances(jobs))
+            if serial.to_dense() != reference or parallel.to_dense() != reference:
+                print(f"CHYBA: matice se liší od Floyd–Warshalla ({label}, n={n}, m={m})")
+                return 1
+            print(f"{label:>10} {n:>6} {m:>7} {fw_time:>9.3f} {serial_time:>13.3f} {parallel_time:>13.3f}")
+    print("\nVšechny matice jsou shodné s Floyd–Warshallem")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Benchmark směrově optimalizovaného BFS nad NumPy (FrontierBFS) proti frontě v Pythonu.
+
+Ověřuje, že vzdálenosti z jednoho zdroje, souvislost i počet komponent jsou
+shodné s BFS s frontou (`collections.deque`), a vypisuje časy obou variant
+na velkých náhodných grafech s malým průměrem. Řádek „jádro BFS“ měří
+samotný průchod nad CSR (pole vzdáleností), ostatní řádky celé volání
+analyzátoru včetně sestavení výsledného slovníku.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_frontier_bfs
+"""
+
+import sys
+import time
+
+from graph_analyzer.analyzers import GraphPropertiesAnalyzer, PathAnalyzer
+from graph_analyzer.analyzers.frontier_bfs import FrontierBFS
+from graph_analyzer.analyzers.numpy_support import has_numpy
+from graph_analyzer.analyzers.path_analyzer import _bfs_row
+
+from .bench_adjacency_matrix import random_graph
+
+
+def timed(fn, repeat=3):
+    """Vrátí (výsledek, nejlepší čas) volání fn()."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def analyzers(graph, use_numpy):
+    """Analyzátory s vynuceným backendem BFS."""
+    properties, paths = GraphPropertiesAnalyzer(graph), PathAnalyzer(graph)
+    properties.use_numpy = paths.use_numpy = use_numpy
+    return properties, paths
+
+
+def main():
+    if not has_numpy():
+        print("NumPy není nainstalováno - FrontierBFS nelze změřit")
+        return 0
+
+    print(f"{'graf':>10} {'n':>7} {'m':>7} {'úloha':>12} {'deque [s]':>10} {'NumPy [s]':>10} {'zrychlení':>10}")
+    for label, directions in (('neorient.', ('-',)), ('orient.', ('>',))):
+        for n, m in ((20_000, 100_000), (100_000, 500_000)):
+            graph = random_graph(n, m, directions, seed=1)
+            csr = graph.get_csr()
+            source = graph.get_node_list()[0]
+            python_props, python_paths = analyzers(graph, False)
+            numpy_props, numpy_paths = analyzers(graph, True)
+            tasks = (
+                ('jádro BFS', lambda: _bfs_row(csr.offsets, csr.targets, 0),
+                 lambda: FrontierBFS.from_csr(csr).run(0)['distances'].tolist()),
+                ('vzdálenosti', lambda: python_paths.get_shortest_distances(source),
+                 lambda: numpy_paths.get_shortest_distances(source)),
+                ('souvislost', python_props.is_connected_graph, numpy_props.is_connected_graph),
+                ('komponenty', python_props.count_components, numpy_props.count_components),
+            )
+            for task, python_fn, numpy_fn in tasks:
+                reference, python_time = timed(python_fn)
+                result, numpy_time = timed(numpy_fn)
+                if result != reference:
+                    print(f"CHYBA: výsledky se liší ({label}, n={n}, {task})")
+                    return 1
+                print(f"{label:>10} {n:>7} {m:>7} {task:>12} {python_time:>10.3f} {numpy_time:>10.3f} "
+                      f"{python_time / numpy_time:>9.1f}×")
+    print("\nVšechny výsledky jsou shodné s BFS s frontou")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
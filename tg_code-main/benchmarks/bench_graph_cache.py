@@ -0,0 +1,70 @@
+"""
+Benchmark načtení grafu z binární cache (.tgc) proti parsování.
+
+Vygeneruje soubor .tg (viz `bench_parallel_parser.write_graph`, včetně
+neplatných hran), první načtení zapíše cache a další se z ní sestaví
+přímo i s CSR. Ověří, že graf z cache odpovídá parsovanému (uzly, hrany,
+vlastnosti, CSR) a že se znovu vypíšou stejná varování parseru.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_graph_cache
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from graph_analyzer.commands import load_graph
+from .bench_parallel_parser import write_graph
+
+
+def timed_load(path, use_cache):
+    """Vrátí (graf, výstup varování, čas načtení včetně CSR)."""
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        graph = load_graph(path, use_cache=use_cache)
+        graph.get_csr()
+    return graph, output.getvalue(), time.perf_counter() - start
+
+
+def snapshot(graph):
+    """Porovnatelný obraz grafu (NaN vah se nahradí řetězcem)."""
+    csr = graph.get_csr()
+    return (
+        [(node.identifier, node.value) for node in graph.nodes.values()],
+        [(e.u.identifier, e.v.identifier, e.direction, e.weight, e.label) for e in graph.edges],
+        (graph.is_directed, graph.is_weighted, graph.has_negative_weights,
+         graph.has_loops, graph.has_multiple_edges),
+        csr.ids, list(csr.offsets), list(csr.targets), list(csr.edge_ids),
+        ['nan' if w != w else w for w in csr.weights],
+        list(csr.rev_offsets), list(csr.rev_sources), list(csr.rev_edge_ids),
+    )
+
+
+def main():
+    print(f"{'hran':>9} {'MB':>6} {'parsování [s]':>14} {'zápis [s]':>10} {'z cache [s]':>12} {'zrychlení':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, m in ((2_000, 20_000), (20_000, 200_000)):
+            path = os.path.join(tmp, f"graph_{m}.tg")
+            write_graph(path, n, m)
+            megabytes = os.path.getsize(path) / 1e6
+
+            reference, warnings, parse_time = timed_load(path, use_cache=False)
+            _, _, write_time = timed_load(path, use_cache=True)
+            graph, cached_warnings, hit_time = timed_load(path, use_cache=True)
+            if snapshot(graph) != snapshot(reference) or cached_warnings != warnings:
+                print(f"CHYBA: graf z cache se liší (hran={m})")
+                return 1
+            print(f"{m:>9} {megabytes:>6.1f} {parse_time:>14.2f} {write_time:>10.2f} {hit_time:>12.3f} "
+                  f"{parse_time / hit_time:>9.1f}×")
+    print("\nGraf i varování z cache jsou shodné s parsovaným grafem")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
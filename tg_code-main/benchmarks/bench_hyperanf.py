@@ -0,0 +1,77 @@
+"""
+Benchmark odhadu vzdáleností HyperANF proti přesným statistikám vzdáleností.
+
+Na menších grafech porovná průměrnou vzdálenost, efektivní průměr (90 %)
+a dolní mez průměru s přesnými hodnotami z bitově paralelního BFS
+(`get_distance_statistics`) pro různé počty registrů; ověří, že dolní mez
+průměru nikdy nepřekročí skutečný průměr. Na velkém grafu vypíše jen čas
+odhadu, kde je přesný výpočet všech dvojic neúnosný.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_hyperanf
+"""
+
+import sys
+import time
+
+from graph_analyzer.analyzers import PathAnalyzer
+
+from .bench_adjacency_matrix import random_graph
+
+
+def exact_summary(analyzer, quantile=0.9):
+    """Přesná průměrná vzdálenost, efektivní průměr a průměr z histogramu vzdáleností."""
+    stats = analyzer.get_distance_statistics()
+    n = analyzer.graph.get_csr().node_count()
+    # Funkce okolí: dvojice (x, x) a pak kumulativní histogram
+    neighborhood = [n]
+    for distance in range(1, max(stats['histogram'], default=0) + 1):
+        neighborhood.append(neighborhood[-1] + stats['histogram'].get(distance, 0))
+    target = quantile * neighborhood[-1]
+    effective = 0.0
+    for t in range(1, len(neighborhood)):
+        if neighborhood[t] >= target:
+            below = neighborhood[t - 1]
+            effective = t - 1 + (target - below) / (neighborhood[t] - below) if target > below else t - 1
+            break
+    return stats['average_distance'], effective, len(neighborhood) - 1
+
+
+def timed(fn):
+    """Vrátí (výsledek, čas) volání fn()."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'graf':>10} {'n':>6} {'registrů':>9} {'prům. vzd.':>17} {'efekt. průměr':>17} "
+          f"{'průměr':>9} {'přesně [s]':>11} {'HyperANF [s]':>13}")
+    n, m = 3000, 9000
+    for label, directions in (('neorient.', ('-',)), ('orient.', ('>',))):
+        graph = random_graph(n, m, directions, seed=2)
+        analyzer = PathAnalyzer(graph)
+        (average, effective, diameter), exact_time = timed(lambda: exact_summary(analyzer))
+        for registers in (16, 64, 256):
+            approx, approx_time = timed(lambda: analyzer.get_approximate_distances(registers))
+            if approx['diameter_lower_bound'] > diameter:
+                print(f"CHYBA: dolní mez průměru {approx['diameter_lower_bound']} > {diameter} ({label})")
+                return 1
+            print(f"{label:>10} {n:>6} {registers:>9} "
+                  f"{approx['average_distance']:>7.3f} / {average:<7.3f} "
+                  f"{approx['effective_diameter']:>7.3f} / {effective:<7.3f} "
+                  f"{approx['diameter_lower_bound']:>3} / {diameter:<3} {exact_time:>11.3f} {approx_time:>13.3f}")
+
+    print()
+    for n, m in ((100_000, 500_000),):
+        analyzer = PathAnalyzer(random_graph(n, m, ('-',), seed=1))
+        approx, approx_time = timed(lambda: analyzer.get_approximate_distances())
+        print(f"n={n}, m={m}: průměrná vzdálenost ≈ {approx['average_distance']:.3f}, "
+              f"efektivní průměr ≈ {approx['effective_diameter']:.3f}, "
+              f"průměr ≥ {approx['diameter_lower_bound']} ({approx['engine']}, {approx_time:.2f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Benchmark vzdáleností z více zdrojů: nejbližší zdroj jedním hledáním proti hledání z každého zdroje.
+
+Ověřuje, že `get_nearest_sources` dává pro každý uzel minimum přes řádky
+jednotlivých zdrojů a že přiřazený zdroj tuto vzdálenost skutečně má.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_multi_source [POČET_ZDROJŮ]
+"""
+
+import sys
+
+from graph_analyzer.analyzers import PathAnalyzer
+
+from .bench_adjacency_matrix import random_graph
+from .bench_distance_matrix import weighted_graph, timed
+
+
+def main():
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    print(f"{'graf':>10} {'n':>6} {'zdrojů':>7} {'nejbližší [s]':>14} {'každý zvlášť [s]':>17}")
+    INF = float('inf')
+    for label, graph in (('neohodn.', random_graph(20000, 100000, ('>',), seed=1)),
+                         ('ohodn.', weighted_graph(20000, 100000, seed=1))):
+        ids = graph.get_node_list()
+        sources = ids[::len(ids) // k][:k]
+        analyzer = PathAnalyzer(graph)
+        nearest, nearest_time = timed(lambda: analyzer.get_nearest_sources(sources))
+        rows, each_time = timed(lambda: [analyzer.get_shortest_distances(source) for source in sources])
+        for node_id in ids:
+            best = min(row.get(node_id, INF) for row in rows)
+            if nearest['distances'].get(node_id, INF) != best:
+                print(f"CHYBA: vzdálenost uzlu {node_id} se liší ({label})")
+                return 1
+            if best != INF and rows[sources.index(nearest['sources'][node_id])][node_id] != best:
+                print(f"CHYBA: uzlu {node_id} je přiřazen vzdálenější zdroj ({label})")
+                return 1
+        print(f"{label:>10} {len(ids):>6} {k:>7} {nearest_time:>14.3f} {each_time:>17.3f}")
+    print("\nVzdálenosti k nejbližšímu zdroji jsou shodné s minimem přes jednotlivé zdroje")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
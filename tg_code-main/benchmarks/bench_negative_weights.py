@@ -0,0 +1,53 @@
+"""
+Benchmark grafů se zápornými váhami: Johnson proti Floyd–Warshallovi, SPFA proti Bellman–Fordovi.
+
+Záporné váhy bez záporného cyklu vzniknou posunutím kladných vah náhodným
+potenciálem (w'(u, v) = w(u, v) + p(u) - p(v)). Ověřuje se shoda matice
+vzdáleností s Floyd–Warshallem a vypisují se časy a počet zpracování uzlů
+ve SPFA proti n - 1 kolům klasického Bellman–Forda (n · (n - 1)).
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_negative_weights
+"""
+
+import random
+import sys
+
+from graph_analyzer.analyzers import PathAnalyzer
+from graph_analyzer.analyzers.path_analyzer import _spfa
+
+from .bench_distance_matrix import floyd_warshall, weighted_graph, timed
+
+
+def negative_graph(n, m, seed=0):
+    """Náhodný orientovaný graf se zápornými váhami, ale bez záporného cyklu."""
+    graph = weighted_graph(n, m, seed)
+    rng = random.Random(seed)
+    potential = {node_id: rng.randint(0, 30) for node_id in graph.nodes}
+    for edge in graph.edges:
+        edge.weight += potential[edge.u.identifier] - potential[edge.v.identifier]
+    graph.load_from_data(graph.nodes, graph.edges)
+    return graph
+
+
+def main():
+    print(f"{'n':>6} {'m':>7} {'FW [s]':>9} {'Johnson [s]':>12} {'SPFA zprac.':>12} {'BF zprac.':>12}")
+    for n, m in ((100, 1000), (200, 2000), (400, 4000)):
+        graph = negative_graph(n, m, seed=1)
+        analyzer = PathAnalyzer(graph)
+        reference, fw_time = timed(lambda: floyd_warshall(graph))
+        matrix, johnson_time = timed(analyzer.get_all_distances)
+        if matrix.to_dense() != reference:
+            print(f"CHYBA: Johnson se liší od Floyd–Warshalla (n={n}, m={m})")
+            return 1
+        csr = graph.get_csr()
+        _, _, pops, _ = _spfa(csr.offsets, csr.targets, csr.weights, (0,))
+        print(f"{n:>6} {m:>7} {fw_time:>9.3f} {johnson_time:>12.3f} "
+              f"{pops:>12} {(n - 1) * n:>12}")
+    print("\nVšechny matice jsou shodné s Floyd–Warshallem")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
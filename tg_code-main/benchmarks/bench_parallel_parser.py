@@ -0,0 +1,106 @@
+"""
+Benchmark paralelního parsování (`GraphParser.iter_records(..., jobs)`).
+
+Vygeneruje velký soubor .tg (uzly na začátku, pak hrany s vahami
+a popisky i bez nich, občas neplatná hrana, hrana na neznámý uzel nebo
+pozdější redefinice uzlu) a ověří, že paralelní parser vrací stejné
+záznamy a stejná varování jako sériový. Vypisuje časy pro různé počty
+procesů a objem dat, který procesy posílají zpět (pickle výsledků
+2. fáze). Zrychlení se projeví jen na stroji s více jádry.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_parallel_parser
+"""
+
+import contextlib
+import io
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from graph_analyzer.utils import GraphParser
+from graph_analyzer.utils.graph_parser import _parse_edge_chunk, _scan_node_chunk
+
+
+def write_graph(path, n, m, seed=0):
+    """Zapíše náhodný graf s n uzly a m hranami ve formátu .tg."""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(f"u N{i} [{rng.randint(0, 9)}];\n")
+        for i in range(m):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if i % 50_000 == 1:
+                f.write(f"h N{u} > Missing{i};\n")    # neznámý uzel -> varování
+            elif i % 50_000 == 2:
+                f.write("h N0;\n")                    # neplatný formát -> varování
+            elif i % 50_000 == 3:
+                f.write(f"u N{u} redefined;\n")       # redefinice uzlu uprostřed hran
+            elif i % 50_000 == 4:
+                f.write(f"u Late{i};\nh Late{i} - N{v};\n")
+            elif i % 3:
+                f.write(f"h N{u} {rng.choice('>-<')} N{v} {rng.randint(1, 99)} :e{i % 7};\n")
+            else:
+                f.write(f"h N{u} {rng.choice('>-<')} N{v};\n")
+
+
+def parse(path, jobs):
+    """Vrátí (záznamy jako n-tice, výstup varování, čas)."""
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        records = list(GraphParser.iter_records(path, jobs))
+    elapsed = time.perf_counter() - start
+    rows = [(kind, item.identifier, item.value) if kind == GraphParser.NODE else
+            (kind, item.u.identifier, id(item.u), item.v.identifier, item.direction, item.weight, item.label)
+            for kind, item in records]
+    # Identita objektů uzlu se porovnává jen v rámci jednoho běhu (pořadí prvních výskytů)
+    first_seen = {}
+    rows = [row if row[0] == GraphParser.NODE else
+            row[:2] + (first_seen.setdefault(row[2], len(first_seen)),) + row[3:] for row in rows]
+    return rows, output.getvalue(), elapsed
+
+
+def returned_bytes(path, jobs):
+    """Velikost pickle výsledků 2. fáze (data, která procesy posílají zpět)."""
+    size = os.path.getsize(path)
+    bounds = GraphParser._chunk_bounds(path, size, jobs)
+    total, line_offset, position, table = 0, 0, 0, {}
+    for start, end in zip(bounds, bounds[1:]):
+        node_records, line_count = _scan_node_chunk((path, start, end))
+        edges = _parse_edge_chunk((path, start, end, line_offset, position, dict(table)))
+        total += len(pickle.dumps(edges, pickle.HIGHEST_PROTOCOL))
+        for star, identifier, value in node_records:
+            table[f"*_{position}" if identifier is None else identifier] = position
+            position += 1
+        line_offset += line_count
+    return total
+
+
+def main():
+    print(f"CPU: {os.cpu_count()}")
+    print(f"{'hran':>9} {'MB':>6} {'procesů':>8} {'čas [s]':>8} {'zrychlení':>10} {'zpět [MB]':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, m in ((20_000, 200_000), (100_000, 1_000_000)):
+            path = os.path.join(tmp, f"graph_{m}.tg")
+            write_graph(path, n, m)
+            megabytes = os.path.getsize(path) / 1e6
+            reference, warnings, serial = parse(path, 1)
+            print(f"{m:>9} {megabytes:>6.1f} {1:>8} {serial:>8.2f} {1.0:>9.1f}× {'-':>10}")
+            for jobs in (2, 4, 8):
+                rows, parallel_warnings, elapsed = parse(path, jobs)
+                if rows != reference or parallel_warnings != warnings:
+                    print(f"CHYBA: paralelní výsledek se liší (hran={m}, procesů={jobs})")
+                    return 1
+                print(f"{m:>9} {megabytes:>6.1f} {jobs:>8} {elapsed:>8.2f} {serial / elapsed:>9.1f}× "
+                      f"{returned_bytes(path, jobs) / 1e6:>10.1f}")
+    print("\nZáznamy i varování jsou shodné se sériovým parserem")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Benchmark prioritních front Dijkstry (heapq, 0-1 BFS, Dial, radix halda).
+
+Pro různé rozsahy celočíselných vah spustí Dijkstru z několika zdrojů se
+všemi použitelnými enginy, ověří shodu vzdáleností a vypíše časy spolu
+s enginem, který PathAnalyzer zvolí automaticky.
+
+Spuštění z kořenového adresáře projektu:
+
+    python3 -m benchmarks.bench_queue_engines [N] [M]
+"""
+
+import random
+import sys
+
+from graph_analyzer.analyzers import PathAnalyzer
+
+from .bench_adjacency_matrix import random_graph
+from .bench_distance_matrix import timed
+
+
+def integer_graph(n, m, max_weight, seed=0):
+    """Náhodný orientovaný graf s celočíselnými váhami 0..max_weight."""
+    graph = random_graph(n, m, ('>',), seed)
+    rng = random.Random(seed)
+    for edge in graph.edges:
+        edge.weight = rng.randint(0, max_weight)
+    graph.load_from_data(graph.nodes, graph.edges)
+    return graph
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else 5 * n
+    engines = ('heap', 'zero-one', 'dial', 'radix')
+    print(f"{'váhy':>10} {'auto':>9} " + " ".join(f"{engine + ' [s]':>13}" for engine in engines))
+    for max_weight in (1, 10, 100, 1000, 100000):
+        graph = integer_graph(n, m, max_weight, seed=1)
+        sources = graph.get_node_list()[::max(1, n // 10)]
+        analyzer = PathAnalyzer(graph)
+        auto = analyzer.get_queue_engine()
+        reference = None
+        cells = []
+        for engine in engines:
+            if engine == 'zero-one' and max_weight > 1:
+                cells.append(f"{'-':>13}")
+                continue
+            analyzer.queue_engine = engine
+            rows, elapsed = timed(lambda: [analyzer.get_shortest_distances(source) for source in sources])
+            if reference is None:
+                reference = rows
+            elif rows != reference:
+                print(f"CHYBA: engine {engine} dává jiné vzdálenosti (váhy 0..{max_weight})")
+                return 1
+            cells.append(f"{elapsed:>13.3f}")
+        print(f"{'0..' + str(max_weight):>10} {auto:>9} " + " ".join(cells))
+    print("\nVšechny enginy dávají shodné vzdálenosti")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
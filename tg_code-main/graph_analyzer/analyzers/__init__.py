@@ -1,5 +1,5 @@
 from .graph_properties_analyzer import GraphPropertiesAnalyzer
-from .path_analyzer import PathAnalyzer
+from .path_analyzer import PathAnalyzer, NegativeCycleError
 from .matrix_analyzer import MatrixAnalyzer
 
-__all__ = ['GraphPropertiesAnalyzer', 'PathAnalyzer', 'MatrixAnalyzer']
+__all__ = ['GraphPropertiesAnalyzer', 'PathAnalyzer', 'NegativeCycleError', 'MatrixAnalyzer']
@@ -0,0 +1,210 @@
+"""
+Bitově paralelní BFS z mnoha zdrojů najednou (neohodnocené grafy).
+"""
+
+from .numpy_support import get_numpy, has_numpy
+
+
+class BitsetBFS:
+    """
+    BFS, který v jednom průchodu po úrovních šíří až `batch_size` zdrojů.
+
+    Každý uzel nese bitovou množinu zdrojů, které ho už dosáhly (bit i = zdroj
+    `sources[i]`). V každé úrovni se množiny nově dosažených zdrojů pošlou po
+    hranách jednou operací OR, takže se hrany grafu projdou jednou za úroveň
+    místo jednou za každý zdroj. Bez NumPy jsou množiny Python int (libovolná
+    šířka), s NumPy pole uint64 slov (n × počet slov).
+
+    Počty nově dosažených uzlů na zdroj a úroveň se v čistém Pythonu sčítají
+    bitově řezanými čítači (counter[j] = j-tý bit počtu pro všechny zdroje
+    najednou), takže excentricity, součty vzdáleností i histogram nevyžadují
+    procházet jednotlivé dvojice (zdroj, uzel). Ty se rozbalují jen pro
+    `rows=True`.
+
+    Attributes:
+        offsets (array): Začátky řádků CSR
+        targets (array): Cílové indexy hran
+        use_numpy (bool): Zda se použije NumPy backend
+        batch_size (int): Počet zdrojů v jednom průchodu
+    """
+
+    # Zdrojů na jeden průchod (násobek šířky slova 64)
+    BATCH_SIZE = 256
+
+    def __init__(self, offsets, targets, use_numpy=None, batch_size=None):
+        """
+        Inicializace nad CSR polemi.
+
+        Args:
+            offsets (array): Začátky řádků CSR (délka n + 1)
+            targets (array): Cílové indexy hran
+            use_numpy (bool): None = použít NumPy, je-li nainstalováno
+            batch_size (int): Počet zdrojů v jednom průchodu (None = BATCH_SIZE)
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.use_numpy = has_numpy() if use_numpy is None else (use_numpy and has_numpy())
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self._pull = None  # NumPy: hrany seřazené podle cíle (pro OR přes předchůdce)
+
+    def node_count(self):
+        """Vrátí počet uzlů."""
+        return len(self.offsets) - 1
+
+    def run(self, sources, rows=False):
+        """
+        Spustí BFS ze všech zdrojů (po dávkách `batch_size`).
+
+        Args:
+            sources (list): Indexy zdrojových uzlů
+            rows (bool): Zda vrátit i řádky vzdáleností
+
+        Returns:
+            dict: {
+                'eccentricity': [nejvyšší dosažená úroveň pro každý zdroj],
+                'reached': [počet dosažených uzlů včetně zdroje],
+                'distance_sum': [součet vzdáleností k dosaženým uzlům],
+                'histogram': [počet dvojic (zdroj, uzel) ve vzdálenosti d],
+                'rows': [seznam vzdáleností pro každý zdroj, -1 = nedosažitelný] nebo None,
+                'sweeps': počet průchodů (dávek),
+            }
+        """
+        sources = list(sources)
+        result = {'eccentricity': [], 'reached': [], 'distance_sum': [], 'histogram': [],
+                  'rows': [] if rows else None, 'sweeps': 0}
+        sweep = self._sweep_numpy if self.use_numpy else self._sweep_python
+        for start in range(0, len(sources), self.batch_size):
+            batch = sources[start:start + self.batch_size]
+            level_counts, batch_rows = sweep(batch, rows)
+            result['sweeps'] += 1
+            self._collect(result, len(batch), level_counts)
+            if rows:
+                result['rows'].extend(batch_rows)
+        return result
+
+    @staticmethod
+    def _collect(result, width, level_counts):
+        """Převede počty po úrovních (level_counts[d][i]) na metriky zdrojů."""
+        eccentricity = [0] * width
+        reached = [0] * width
+        distance_sum = [0] * width
+        histogram = result['histogram']
+        for level, counts in enumerate(level_counts):
+            if len(histogram) <= level:
+                histogram.append(0)
+            for i, count in enumerate(counts):
+                if count:
+                    eccentricity[i] = level
+                    reached[i] += count
+                    distance_sum[i] += level * count
+                    histogram[level] += count
+        result['eccentricity'].extend(eccentricity)
+        result['reached'].extend(reached)
+        result['distance_sum'].extend(distance_sum)
+
+    def _sweep_python(self, batch, rows):
+        """Jeden průchod s bitovými množinami v Python int."""
+        offsets, targets = self.offsets, self.targets
+        n = self.node_count()
+        width = len(batch)
+        seen = [0] * n
+        frontier = {}
+        for i, source in enumerate(batch):
+            frontier[source] = frontier.get(source, 0) | (1 << i)
+        for v, mask in frontier.items():
+            seen[v] = mask
+        level_counts = [[1] * width]
+        dist_rows = None
+        if rows:
+            dist_rows = [[-1] * n for _ in range(width)]
+            for i, source in enumerate(batch):
+                dist_rows[i][source] = 0
+
+        level = 0
+        while frontier:
+            level += 1
+            gathered = {}
+            get = gathered.get
+            for u, mask in frontier.items():
+                for slot in range(offsets[u], offsets[u + 1]):
+                    v = targets[slot]
+                    gathered[v] = get(v, 0) | mask
+
+            frontier = {}
+            counters = []  # bitově řezané čítače nově dosažených uzlů
+            for v, mask in gathered.items():
+                new = mask & ~seen[v]
+                if not new:
+                    continue
+                seen[v] |= new
+                frontier[v] = new
+                carry = new
+                j = 0
+                while carry:
+                    if j == len(counters):
+                        counters.append(0)
+                    bit = counters[j]
+                    counters[j] = bit ^ carry
+                    carry &= bit
+                    j += 1
+                if rows:
+                    while new:
+                        low = new & -new
+                        dist_rows[low.bit_length() - 1][v] = level
+                        new ^= low
+            if frontier:
+                level_counts.append([sum(((counter >> i) & 1) << j for j, counter in enumerate(counters))
+                                     for i in range(width)])
+        return level_counts, dist_rows
+
+    def _pull_index(self):
+        """NumPy: předchůdci uzlů seřazení podle cíle a začátky neprázdných úseků."""
+        if self._pull is None:
+            np = get_numpy()
+            n = self.node_count()
+            offsets = np.asarray(self.offsets, dtype=np.int64)
+            targets = np.asarray(self.targets, dtype=np.int64)
+            sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+            order = np.argsort(targets, kind='stable')
+            in_degree = np.bincount(targets, minlength=n)
+            starts = np.concatenate(([0], np.cumsum(in_degree)[:-1]))
+            has_pred = in_degree > 0
+            self._pull = (sources[order], starts[has_pred], np.nonzero(has_pred)[0])
+        return self._pull
+
+    def _sweep_numpy(self, batch, rows):
+        """Jeden průchod s bitovými množinami jako pole uint64 (n × slova)."""
+        np = get_numpy()
+        n = self.node_count()
+        width = len(batch)
+        words = (width + 63) // 64
+        pred, starts, has_pred = self._pull_index()
+        seen = np.zeros((n, words), dtype=np.uint64)
+        idx = np.arange(width)
+        np.bitwise_or.at(seen, (np.asarray(batch), idx // 64),
+                         np.left_shift(np.uint64(1), (idx % 64).astype(np.uint64)))
+        frontier = seen.copy()
+        level_counts = [[1] * width]
+        dist_rows = None
+        if rows:
+            dist_rows = np.full((width, n), -1, dtype=np.int64)
+            dist_rows[idx, batch] = 0
+
+        level = 0
+        while True:
+            level += 1
+            gathered = np.zeros_like(frontier)
+            if len(starts):
+                gathered[has_pred] = np.bitwise_or.reduceat(frontier[pred], starts, axis=0)
+            new = gathered & ~seen
+            if not new.any():
+                break
+            seen |= new
+            frontier = new
+            # Bity po zdrojích: uint64 v pořadí little-endian -> bit i = zdroj i
+            bits = np.unpackbits(new.astype('<u8').view(np.uint8), axis=1, bitorder='little')[:, :width]
+            level_counts.append(bits.sum(axis=0, dtype=np.int64).tolist())
+            if rows:
+                nodes, source_idx = np.nonzero(bits)
+                dist_rows[source_idx, nodes] = level
+        return level_counts, dist_rows.tolist() if rows else None
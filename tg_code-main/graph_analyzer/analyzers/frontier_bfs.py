@@ -0,0 +1,222 @@
+"""
+Směrově optimalizované BFS nad poli NumPy (velké grafy s malým průměrem).
+"""
+
+from .numpy_support import get_numpy
+
+
+class FrontierBFS:
+    """
+    BFS po úrovních, kde je fronta celé úrovně pole indexů NumPy.
+
+    Každá úroveň se rozšíří jedním ze dvou kroků (Beamerovo směrově
+    optimalizované BFS):
+
+    - shora dolů: projdou se hrany z uzlů fronty a nenavštívené cíle tvoří
+      další úroveň (levné, dokud je fronta malá),
+    - zdola nahoru: projdou se hrany vedoucí do dosud nenavštívených uzlů
+      a uzel patří do další úrovně, leží-li některý jeho předchůdce ve
+      frontě (levné, když fronta pokrývá velkou část grafu).
+
+    Krok se volí podle počtu hran z fronty proti počtu hran do nenavštívených
+    uzlů (`ALPHA`). Hrany do nenavštívených uzlů se při krocích zdola nahoru
+    průběžně zužují, takže každá úroveň stojí jen několik vektorových operací
+    bez smyčky v interpretu.
+
+    Attributes:
+        offsets (ndarray): Začátky řádků CSR (int64, délka n + 1)
+        targets (ndarray): Cílové indexy hran
+    """
+
+    # Krok zdola nahoru se použije, když hrany z fronty × ALPHA převýší hrany do nenavštívených
+    ALPHA = 2
+
+    def __init__(self, offsets, targets):
+        """
+        Inicializace nad CSR polemi (array nebo ndarray, bez kopie, je-li to možné).
+
+        Args:
+            offsets (array): Začátky řádků CSR (délka n + 1)
+            targets (array): Cílové indexy hran
+        """
+        np = get_numpy()
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.targets = np.asarray(targets)
+        self._in_degree = None
+        self._sources = None  # počáteční uzel každé hrany
+
+    @classmethod
+    def from_csr(cls, csr, undirected=False, mask=None):
+        """
+        Sestaví BFS nad CSR grafu, případně jen nad podgrafem a bez orientace.
+
+        Args:
+            csr (CSRGraph): CSR pohled na graf (`Graph.get_csr()`)
+            undirected (bool): Zda hrany procházet v obou směrech (slabá souvislost)
+            mask (bytearray): 1 pro uzly, které se mají ponechat (None = všechny);
+                              ostatní uzly zůstanou bez hran
+
+        Returns:
+            FrontierBFS: BFS nad (pod)grafem
+        """
+        np = get_numpy()
+        offsets = np.asarray(csr.offsets, dtype=np.int64)
+        targets = np.asarray(csr.targets)
+        if undirected and csr.is_directed:
+            # Řádek uzlu = následníci a za nimi předchůdci (jako `CSRGraph.undirected_neighbors`)
+            rev_offsets = np.asarray(csr.rev_offsets, dtype=np.int64)
+            out_degree, in_degree = np.diff(offsets), np.diff(rev_offsets)
+            merged = offsets + rev_offsets
+            row_starts = merged[:-1]
+            neighbors = np.empty(len(targets) + len(csr.rev_sources), dtype=targets.dtype)
+            neighbors[np.repeat(row_starts - offsets[:-1], out_degree)
+                      + np.arange(len(targets))] = targets
+            neighbors[np.repeat(row_starts + out_degree - rev_offsets[:-1], in_degree)
+                      + np.arange(len(csr.rev_sources))] = np.asarray(csr.rev_sources)
+            offsets, targets = merged, neighbors
+        if mask is not None:
+            n = csr.node_count()
+            keep = np.frombuffer(bytes(mask), dtype=np.uint8).astype(bool)
+            sources = np.repeat(np.arange(n), np.diff(offsets))
+            kept = keep[sources] & keep[targets]
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources[kept], minlength=n), out=offsets[1:])
+            targets = targets[kept]
+        return cls(offsets, targets)
+
+    def node_count(self):
+        """Vrátí počet uzlů."""
+        return len(self.offsets) - 1
+
+    def _in_degrees(self):
+        """Vstupní stupně uzlů."""
+        np = get_numpy()
+        if self._in_degree is None:
+            self._in_degree = np.bincount(self.targets, minlength=self.node_count())
+        return self._in_degree
+
+    def _edge_sources(self):
+        """Počáteční uzel každé hrany (v pořadí pole `targets`)."""
+        np = get_numpy()
+        if self._sources is None:
+            n = self.node_count()
+            self._sources = np.repeat(np.arange(n, dtype=self.targets.dtype), np.diff(self.offsets))
+        return self._sources
+
+    def _top_down(self, frontier, dist, level):
+        """Krok shora dolů: označí nenavštívené následníky fronty a vrátí je."""
+        np = get_numpy()
+        starts = self.offsets[frontier]
+        degrees = self.offsets[frontier + 1] - starts
+        total = int(degrees.sum())
+        if not total:
+            return frontier[:0]
+        # Pozice hran všech uzlů fronty: začátek řádku + pořadí hrany v řádku
+        shift = np.repeat(starts - (np.cumsum(degrees) - degrees), degrees)
+        neighbors = self.targets[shift + np.arange(total, dtype=np.int64)]
+        neighbors = neighbors[dist[neighbors] < 0]
+        dist[neighbors] = level
+        return self._level_nodes(neighbors, dist, level)
+
+    def _level_nodes(self, reached, dist, level):
+        """Uzly nové úrovně bez opakování (řazení pro malé úrovně, jinak průchod polem)."""
+        np = get_numpy()
+        if len(reached) * 64 < len(dist):
+            return np.unique(reached)
+        return np.flatnonzero(dist == level)
+
+    def run(self, source):
+        """
+        Spustí BFS z jednoho nebo více zdrojů (všechny ve vzdálenosti 0).
+
+        Args:
+            source (int | list): Index zdrojového uzlu nebo seznam indexů
+
+        Returns:
+            dict: {
+                'distances': ndarray int32 vzdáleností (-1 = nedosažitelný),
+                'levels': počet úrovní (excentricita zdroje),
+                'bottom_up': počet kroků zdola nahoru,
+            }
+        """
+        np = get_numpy()
+        n = self.node_count()
+        dist = np.full(n, -1, dtype=np.int32)
+        frontier = np.unique(np.asarray(source, dtype=np.int64).reshape(-1))
+        dist[frontier] = 0
+        in_degree = self._in_degrees()
+        # Hrany vedoucí do nenavštívených uzlů (pro volbu směru)
+        unvisited_edges = len(self.targets) - int(in_degree[frontier].sum())
+        pending = None  # (cíle, zdroje) hran do nenavštívených uzlů v režimu zdola nahoru
+        level = 0
+        bottom_up = 0
+
+        while len(frontier):
+            frontier_edges = int((self.offsets[frontier + 1] - self.offsets[frontier]).sum())
+            level += 1
+            if frontier_edges * self.ALPHA > unvisited_edges and unvisited_edges:
+                if pending is None:
+                    # Pořadí hran nehraje roli; hrany do navštívených uzlů se odfiltrují po kroku
+                    pending = (self.targets, self._edge_sources())
+                reached = pending[0][dist[pending[1]] == level - 1]
+                reached = reached[dist[reached] < 0]
+                dist[reached] = level
+                frontier = self._level_nodes(reached, dist, level)
+                open_ = dist[pending[0]] < 0
+                pending = (pending[0][open_], pending[1][open_])
+                unvisited_edges = len(pending[0])
+                bottom_up += 1
+            else:
+                pending = None
+                frontier = self._top_down(frontier, dist, level)
+                if len(frontier):
+                    unvisited_edges -= int(in_degree[frontier].sum())
+        return {'distances': dist, 'levels': max(level - 1, 0), 'bottom_up': bottom_up}
+
+    def labels(self, mask=None):
+        """
+        Označí komponenty souvislosti (graf musí být symetrický, viz `from_csr`).
+
+        Největší komponentu obvykle zachytí první BFS z uzlu s nejvyšším
+        stupněm. Zbylé uzly se označí vektorovým min-label hookingem se
+        zkracováním ukazatelů, takže ani mnoho malých komponent nevyžaduje
+        jedno BFS na komponentu.
+
+        Args:
+            mask (bytearray): 1 pro uzly, které se mají označit (None = všechny)
+
+        Returns:
+            ndarray: Značka komponenty pro každý uzel (nejmenší index v komponentě,
+                     -1 pro uzly mimo masku)
+        """
+        np = get_numpy()
+        n = self.node_count()
+        keep = np.ones(n, dtype=bool) if mask is None else \
+            np.frombuffer(bytes(mask), dtype=np.uint8).astype(bool)
+        label = np.full(n, -1, dtype=np.int64)
+        if not keep.any():
+            return label
+        degrees = np.diff(self.offsets)
+        seed = int(np.argmax(np.where(keep, degrees, -1)))
+        reached = self.run(seed)['distances'] >= 0
+        label[reached] = int(np.flatnonzero(reached)[0])
+
+        rest = keep & ~reached
+        if rest.any():
+            sources = self._edge_sources()
+            inside = rest[sources]
+            sources, targets = sources[inside], self.targets[inside]
+            parent = np.arange(n, dtype=np.int64)
+            while True:
+                previous = parent.copy()
+                # Hooking: kořen stromu jednoho konce hrany převezme menší značku druhého
+                np.minimum.at(parent, parent[sources], parent[targets])
+                while True:
+                    grand = parent[parent]
+                    if np.array_equal(grand, parent):
+                        break
+                    parent = grand
+                if np.array_equal(parent, previous):
+                    break
+            label[rest] = parent[rest]
+        return label
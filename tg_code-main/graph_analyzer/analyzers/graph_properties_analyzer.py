@@ -4,10 +4,19 @@ Analyzátor pro základní vlastnosti grafu.
 
 import collections
 
+from .frontier_bfs import FrontierBFS
+from .numpy_support import has_numpy
+
 class GraphPropertiesAnalyzer:
     """
     Třída pro analýzu základních vlastností grafu.
+
+    Souvislost a komponenty velkých grafů se s NumPy počítají směrově
+    optimalizovaným BFS po celých úrovních (`FrontierBFS`).
     """
+
+    # Od tohoto počtu uzlů se souvislost a komponenty počítají nad poli NumPy
+    FRONTIER_MIN_NODES = 2048
     
     def __init__(self, graph):
         """
@@ -17,6 +26,10 @@ class GraphPropertiesAnalyzer:
             graph (Graph): Graf k analýze
         """
         self.graph = graph
+        # NumPy backend BFS pro souvislost a komponenty (vypnutím se vynutí fronta v Pythonu)
+        self.use_numpy = has_numpy()
+        # Maska skutečných uzlů: (verze grafu, bytearray)
+        self._real_mask = None
 
     def _is_placeholder(self, node_id):
         """Return True if node_id represents a placeholder node (binary-tree skip markers)."""
@@ -26,17 +39,67 @@ class GraphPropertiesAnalyzer:
         """Return set of node ids that are real (not placeholders)."""
         return {nid for nid in self.graph.nodes if not self._is_placeholder(nid)}
 
+    def _real_node_mask(self, csr):
+        """Return bytearray indexed by CSR node index, 1 for real (non-placeholder) nodes (cached, read-only)."""
+        if self._real_mask is None or self._real_mask[0] != csr.version:
+            self._real_mask = (csr.version, bytearray(0 if self._is_placeholder(nid) else 1 for nid in csr.ids))
+        return self._real_mask[1]
+
+    def _frontier_bfs(self, csr, real):
+        """
+        Vrátí NumPy BFS bez orientace nad skutečnými uzly, nebo None pro malé grafy.
+
+        Args:
+            csr (CSRGraph): CSR grafu
+            real (bytearray): Maska skutečných uzlů (`_real_node_mask`)
+
+        Returns:
+            FrontierBFS: BFS nad podgrafem skutečných uzlů nebo None (použije se fronta v Pythonu)
+        """
+        if not self.use_numpy or len(real) < self.FRONTIER_MIN_NODES:
+            return None
+        return FrontierBFS.from_csr(csr, undirected=True, mask=real if 0 in real else None)
+
+    def _component_labels(self, csr, real):
+        """Značka komponenty každého uzlu: nejmenší index v komponentě (-1 = placeholder)."""
+        bfs = self._frontier_bfs(csr, real)
+        if bfs is not None:
+            return bfs.labels(real).tolist()
+
+        label = [-1] * len(real)
+        for start in range(len(real)):
+            if real[start] and label[start] < 0:
+                label[start] = start
+                queue = collections.deque([start])
+
+                while queue:
+                    current = queue.popleft()
+
+                    for neighbor in csr.undirected_neighbors(current):
+                        if real[neighbor] and label[neighbor] < 0:
+                            label[neighbor] = start
+                            queue.append(neighbor)
+        return label
+
     # Node-level helper methods (convenience API)
     def get_successors(self, node_id):
         """Return list of successor node ids (edges u->v)."""
-        return [edge.v.identifier for edge in self.graph.adj.get(node_id, [])]
+        csr = self.graph.get_csr()
+        idx = csr.index_of.get(node_id)
+        if idx is None:
+            return []
+        return [csr.ids[t] for t in csr.successors(idx)]
 
     def get_predecessors(self, node_id):
         """Return list of predecessor node ids (edges u->v where v==node_id)."""
         if not self.graph.is_directed:
             # For undirected graphs predecessors == successors
             return self.get_successors(node_id)
-        return [edge.u.identifier for edge in self.graph.rev_adj.get(node_id, [])]
+        csr = self.graph.get_csr()
+        idx = csr.index_of.get(node_id)
+        if idx is None:
+            return []
+        return [csr.ids[s] for s in csr.predecessors(idx)]
 
     def get_neighbors(self, node_id):
         """Return list of neighbor node ids (ignoring orientation)."""
@@ -47,19 +110,20 @@ class GraphPropertiesAnalyzer:
 
     def incident_edges(self, node_id):
         """Return list of incident Edge objects for the given node id."""
-        edges = list(self.graph.adj.get(node_id, []))
-        # If reverse adjacency exists, include those as well
-        if hasattr(self.graph, 'rev_adj'):
-            edges += list(self.graph.rev_adj.get(node_id, []))
-        return edges
+        # Outgoing edges (u -> v form) followed by incoming directed edges
+        return self.graph.out_edges(node_id) + self.graph.in_edges(node_id)
 
     def out_degree(self, node_id):
-        return len(self.graph.adj.get(node_id, []))
+        csr = self.graph.get_csr()
+        idx = csr.index_of.get(node_id)
+        return 0 if idx is None else csr.out_degree(idx)
 
     def in_degree(self, node_id):
         if not self.graph.is_directed:
             return self.out_degree(node_id)
-        return len(self.graph.rev_adj.get(node_id, []))
+        csr = self.graph.get_csr()
+        idx = csr.index_of.get(node_id)
+        return 0 if idx is None else csr.in_degree(idx)
 
     def degree(self, node_id):
         if self.graph.is_directed:
@@ -93,36 +157,36 @@ class GraphPropertiesAnalyzer:
     def is_connected_graph(self):
         """Zjistí, zda je graf souvislý (ignoruje placeholder uzly)."""
         # FILTRUJ PLACEHOLDER UZLY
-        real_nodes = self._real_node_ids()
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
+        real_count = sum(real)
         
-        if not real_nodes:
+        if not real_count:
             return True
         
         # ZAČNI OD PRVNÍHO SKUTEČNÉHO UZLU
-        start_node_id = next(iter(real_nodes))
-        visited = set()
-        queue = collections.deque([start_node_id])
-        visited.add(start_node_id)
+        start = real.index(1)
+        bfs = self._frontier_bfs(csr, real)
+        if bfs is not None:
+            return int((bfs.run(start)['distances'] >= 0).sum()) == real_count
+
+        visited = bytearray(len(real))
+        visited[start] = 1
+        visited_count = 1
+        queue = collections.deque([start])
         
         while queue:
-            current_node_id = queue.popleft()
+            current = queue.popleft()
             
-            for edge in self.graph.adj[current_node_id]:
-                neighbor_id = edge.v.identifier
-                # POUZE SKUTEČNÉ UZLY
-                if neighbor_id in real_nodes and neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    queue.append(neighbor_id)
-            
-            if self.graph.is_directed:
-                for edge in self.graph.rev_adj[current_node_id]:
-                    neighbor_id = edge.u.identifier
-                    if neighbor_id in real_nodes and neighbor_id not in visited:
-                        visited.add(neighbor_id)
-                        queue.append(neighbor_id)
+            # POUZE SKUTEČNÉ UZLY (pro orientované grafy i po hranách proti směru)
+            for neighbor in csr.undirected_neighbors(current):
+                if real[neighbor] and not visited[neighbor]:
+                    visited[neighbor] = 1
+                    visited_count += 1
+                    queue.append(neighbor)
         
         # POROVNEJ S POČTEM SKUTEČNÝCH UZLŮ
-        return len(visited) == len(real_nodes)
+        return visited_count == real_count
 
     
     def is_complete_graph(self):
@@ -164,13 +228,17 @@ class GraphPropertiesAnalyzer:
         if not real_nodes:
             return True
 
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
+        real_indices = [idx for idx in range(len(real)) if real[idx]]
+
         if self.graph.is_directed:
             # Pro orientované grafy: k-regulární znamená stejný in-degree a out-degree pro všechny uzly
             in_degrees = []
             out_degrees = []
-            for node_id in real_nodes:
-                in_degree = len([e for e in self.graph.rev_adj.get(node_id, []) if e.u.identifier in real_nodes])
-                out_degree = len([e for e in self.graph.adj.get(node_id, []) if e.v.identifier in real_nodes])
+            for idx in real_indices:
+                in_degree = sum(real[s] for s in csr.predecessors(idx))
+                out_degree = sum(real[t] for t in csr.successors(idx))
                 in_degrees.append(in_degree)
                 out_degrees.append(out_degree)
             
@@ -185,8 +253,8 @@ class GraphPropertiesAnalyzer:
         else:
             # Pro neorientované grafy: všechny uzly mají stejný stupeň
             degrees = []
-            for node_id in real_nodes:
-                degrees.append(len([e for e in self.graph.adj.get(node_id, []) if e.v.identifier in real_nodes]))
+            for idx in real_indices:
+                degrees.append(sum(real[t] for t in csr.successors(idx)))
 
             if not degrees:
                 return True
@@ -199,28 +267,22 @@ class GraphPropertiesAnalyzer:
         if not self.graph.nodes:
             return True
         
-        # Use BFS to color the graph with two colors
-        color = {}
-        for node_id in self.graph.nodes:
-            if node_id not in color:
-                queue = collections.deque([node_id])
-                color[node_id] = 0
+        # Use BFS to color the graph with two colors (-1 = not colored yet)
+        csr = self.graph.get_csr()
+        color = [-1] * csr.node_count()
+        for start in range(csr.node_count()):
+            if color[start] < 0:
+                queue = collections.deque([start])
+                color[start] = 0
                 
                 while queue:
-                    u_id = queue.popleft()
+                    u = queue.popleft()
                     # Consider all neighbors regardless of edge direction for bipartiteness
-                    neighbors = set()
-                    for edge in self.graph.adj[u_id]:
-                        neighbors.add(edge.v.identifier)
-                    if self.graph.is_directed:
-                        for edge in self.graph.rev_adj[u_id]:
-                            neighbors.add(edge.u.identifier)
-                    
-                    for v_id in neighbors:
-                        if v_id not in color:
-                            color[v_id] = 1 - color[u_id]
-                            queue.append(v_id)
-                        elif color[v_id] == color[u_id]:
+                    for v in csr.undirected_neighbors(u):
+                        if color[v] < 0:
+                            color[v] = 1 - color[u]
+                            queue.append(v)
+                        elif color[v] == color[u]:
                             return False
         return True
 
@@ -269,38 +331,28 @@ class GraphPropertiesAnalyzer:
         if not self.graph.nodes:
             return 0
         
-        real_nodes = self._real_node_ids()
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
         
-        if not real_nodes:
+        if not any(real):
             return 0
 
-        visited = set()
-        components = 0
-        
-        for node_id in real_nodes:
-            if node_id not in visited:
-                components += 1
-                queue = collections.deque([node_id])
-                visited.add(node_id)
-                
-                while queue:
-                    current_node_id = queue.popleft()
-
-                    for edge in self.graph.adj[current_node_id]:
-                        neighbor_id = edge.v.identifier
+        # Každá komponenta má značku rovnou indexu svého nejmenšího uzlu
+        labels = self._component_labels(csr, real)
+        return sum(1 for idx, label in enumerate(labels) if label == idx)
 
-                        if neighbor_id in real_nodes and neighbor_id not in visited:
-                            visited.add(neighbor_id)
-                            queue.append(neighbor_id)
+    def get_component_labels(self):
+        """
+        Přiřadí každému skutečnému uzlu komponentu souvislosti (orientace hran se ignoruje).
 
-                    if self.graph.is_directed:
-                        for edge in self.graph.rev_adj[current_node_id]:
-                            neighbor_id = edge.u.identifier
-                            if neighbor_id not in visited:
-                                visited.add(neighbor_id)
-                                queue.append(neighbor_id)
-        
-        return components
+        Returns:
+            dict: {node_id: identifikátor prvního uzlu komponenty (v pořadí uzlů grafu)}
+        """
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
+        ids = csr.ids
+        return {ids[idx]: ids[label] for idx, label in enumerate(self._component_labels(csr, real))
+                if label >= 0}
     
     def has_cycles(self):
         """Zjistí, zda graf obsahuje cykly."""
@@ -316,49 +368,49 @@ class GraphPropertiesAnalyzer:
         """Detekce cyklů v orientovaném grafu pomocí DFS."""
         WHITE, GRAY, BLACK = 0, 1, 2
         # Only consider real nodes for cycle detection
-        real_nodes = self._real_node_ids()
-        color = {node_id: WHITE for node_id in real_nodes}
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
+        color = bytearray(len(real))
 
-        def dfs(node_id):
-            if color[node_id] == GRAY:
+        def dfs(node):
+            if color[node] == GRAY:
                 return True  # Back edge found, cycle detected
-            if color[node_id] == BLACK:
+            if color[node] == BLACK:
                 return False
 
-            color[node_id] = GRAY
-            for edge in self.graph.adj.get(node_id, []):
-                neigh = edge.v.identifier
-                if neigh in color and dfs(neigh):
+            color[node] = GRAY
+            for neigh in csr.successors(node):
+                if real[neigh] and dfs(neigh):
                     return True
-            color[node_id] = BLACK
+            color[node] = BLACK
             return False
 
-        for node_id in list(color.keys()):
-            if color[node_id] == WHITE and dfs(node_id):
+        for node in range(len(real)):
+            if real[node] and color[node] == WHITE and dfs(node):
                 return True
         return False
     
     def _has_cycles_undirected(self):
         """Detekce cyklů v neorientovaném grafu pomocí DFS."""
-        visited = set()
-        real_nodes = self._real_node_ids()
-
-        def dfs(node_id, parent_id):
-            visited.add(node_id)
-            for edge in self.graph.adj.get(node_id, []):
-                neighbor_id = edge.v.identifier
-                if neighbor_id not in real_nodes:
+        csr = self.graph.get_csr()
+        real = self._real_node_mask(csr)
+        visited = bytearray(len(real))
+
+        def dfs(node, parent):
+            visited[node] = 1
+            for neighbor in csr.successors(node):
+                if not real[neighbor]:
                     continue
-                if neighbor_id not in visited:
-                    if dfs(neighbor_id, node_id):
+                if not visited[neighbor]:
+                    if dfs(neighbor, node):
                         return True
-                elif neighbor_id != parent_id:
+                elif neighbor != parent:
                     return True
             return False
 
-        for node_id in real_nodes:
-            if node_id not in visited:
-                if dfs(node_id, None):
+        for node in range(len(real)):
+            if real[node] and not visited[node]:
+                if dfs(node, -1):
                     return True
         return False
     
@@ -370,12 +422,15 @@ class GraphPropertiesAnalyzer:
             if self.has_cycles():
                 return False
             
+            csr = self.graph.get_csr()
+            real = self._real_node_mask(csr)
             root_candidates = []
-            for node_id in real_nodes:  # POUZE SKUTEČNÉ UZLY
-                in_degree = len([e for e in self.graph.rev_adj[node_id] 
-                            if e.u.identifier in real_nodes])
+            for idx in range(len(real)):
+                if not real[idx]:  # POUZE SKUTEČNÉ UZLY
+                    continue
+                in_degree = sum(real[s] for s in csr.predecessors(idx))
                 if in_degree == 0:
-                    root_candidates.append(node_id)
+                    root_candidates.append(idx)
                 elif in_degree > 1:
                     return False
             
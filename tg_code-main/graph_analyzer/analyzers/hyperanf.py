@@ -0,0 +1,284 @@
+"""
+Přibližná funkce okolí grafu (HyperANF) z HyperLogLog čítačů.
+"""
+
+import math
+
+from .numpy_support import get_numpy, has_numpy
+
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(x):
+    """Hash splitmix64 (stejný jako vektorová varianta v `_hash_numpy`)."""
+    z = (x + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _hash_numpy(n, seed):
+    """Hash splitmix64 indexů uzlů 0..n-1 jako pole uint64."""
+    np = get_numpy()
+    with np.errstate(over='ignore'):
+        z = np.arange(n, dtype=np.uint64) + np.uint64((seed + 0x9E3779B97F4A7C15) & _MASK64)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class HyperANF:
+    """
+    Odhad funkce okolí N(t) = počet dvojic (x, y) s d(x, y) <= t (v počtu hran).
+
+    Každý uzel x nese HyperLogLog čítač množiny uzlů dosažitelných z x
+    nejvýše t hranami. Čítač má `registers` registrů, uzel se do něj zapíše
+    jako jediný registr (index a pozice nejnižšího jedničkového bitu z hashe
+    uzlu). Krok t → t + 1 je sjednocení čítače uzlu s čítači jeho následníků,
+    tj. maximum po registrech, takže jeden krok je jeden lineární průchod
+    hranami a paměť je n × `registers` bajtů bez ohledu na počet dvojic.
+    Výpočet končí, když se žádný čítač nezmění; počet kroků se změnou je
+    dolní mez průměru grafu (každá změna v kroku t vyžaduje uzel ve
+    vzdálenosti přesně t).
+
+    Bez NumPy se registry uzlu drží jako bajty v jednom Python int a maximum
+    po registrech se počítá broadword operacemi nad celým číslem; s NumPy
+    jako matice uint8 (n × registers) po vrstvách a blocích hran.
+
+    Attributes:
+        offsets (array): Začátky řádků CSR
+        targets (array): Cílové indexy hran
+        registers (int): Počet registrů čítače (mocnina dvou, 16 až 65536)
+        use_numpy (bool): Zda se použije NumPy backend
+        seed (int): Semínko hashe uzlů
+    """
+
+    # Výchozí počet registrů (relativní chyba jednoho čítače 1.04 / sqrt(64) ≈ 13 %)
+    REGISTERS = 64
+    # Kolik bajtů registrů sousedů se s NumPy načte najednou
+    CHUNK_BYTES = 1 << 22
+    # Nejvyšší stupeň uzlu, jehož sjednocení se s NumPy počítá po vrstvách následníků
+    LAYER_DEGREE = 32
+
+    def __init__(self, offsets, targets, registers=None, use_numpy=None, seed=0):
+        """
+        Inicializace nad CSR polemi.
+
+        Args:
+            offsets (array): Začátky řádků CSR (délka n + 1)
+            targets (array): Cílové indexy hran
+            registers (int): Počet registrů čítače (None = REGISTERS)
+            use_numpy (bool): None = použít NumPy, je-li nainstalováno
+            seed (int): Semínko hashe uzlů
+
+        Raises:
+            ValueError: Pokud počet registrů není mocnina dvou v rozsahu 16 až 65536
+        """
+        registers = registers or self.REGISTERS
+        if registers < 16 or registers > 1 << 16 or registers & (registers - 1):
+            raise ValueError(f"Počet registrů musí být mocnina dvou od 16 do 65536, ne {registers}")
+        self.offsets = offsets
+        self.targets = targets
+        self.registers = registers
+        self.use_numpy = has_numpy() if use_numpy is None else (use_numpy and has_numpy())
+        self.seed = seed
+
+    def node_count(self):
+        """Vrátí počet uzlů."""
+        return len(self.offsets) - 1
+
+    def relative_error(self):
+        """Relativní směrodatná chyba odhadu jednoho čítače."""
+        return 1.04 / math.sqrt(self.registers)
+
+    def _alpha(self):
+        """Korekční konstanta HyperLogLog pro daný počet registrů."""
+        return {16: 0.673, 32: 0.697, 64: 0.709}.get(self.registers,
+                                                      0.7213 / (1 + 1.079 / self.registers))
+
+    def _estimate(self, inverse_sum, zeros):
+        """Odhad velikosti množiny z součtu 2^-registr a počtu nulových registrů."""
+        m = self.registers
+        estimate = self._alpha() * m * m / inverse_sum
+        if estimate <= 2.5 * m and zeros:
+            # Malé množiny: lineární počítání podle nulových registrů
+            return m * math.log(m / zeros)
+        return estimate
+
+    def run(self, max_steps=None):
+        """
+        Spočítá odhad funkce okolí až do ustálení čítačů.
+
+        Args:
+            max_steps (int): Nejvyšší počet kroků (None = do ustálení)
+
+        Returns:
+            dict: {
+                'neighborhood': [odhad N(0), N(1), ...] (neklesající),
+                'iterations': počet kroků, ve kterých se některý čítač změnil,
+                'converged': zda se čítače ustálily (False = zastaveno po max_steps),
+            }
+        """
+        step = self._run_numpy if self.use_numpy else self._run_python
+        return step(max_steps)
+
+    def _registers_of(self, hashes):
+        """Z hashů uzlů vrátí (index registru, hodnotu registru) jako dvojici seznamů/polí."""
+        bits = self.registers.bit_length() - 1
+        if self.use_numpy:
+            np = get_numpy()
+            index = (hashes & np.uint64(self.registers - 1)).astype(np.int64)
+            rest = hashes >> np.uint64(bits)
+            with np.errstate(over='ignore'):
+                lowest = rest & (~rest + np.uint64(1))
+            # lowest = 2^k -> frexp vrátí exponent k + 1 = pozice nejnižšího jedničkového bitu
+            rank = np.frexp(lowest.astype(np.float64))[1]
+            rank[rest == 0] = 64 - bits + 1
+            return index, rank.astype(np.uint8)
+        index, rank = [], []
+        for h in hashes:
+            rest = h >> bits
+            index.append(h & (self.registers - 1))
+            rank.append((rest & -rest).bit_length() if rest else 64 - bits + 1)
+        return index, rank
+
+    def _finish(self, neighborhood, iterations, converged):
+        """Vynutí neklesající posloupnost odhadů (přechod mezi režimy odhadu)."""
+        for t in range(1, len(neighborhood)):
+            if neighborhood[t] < neighborhood[t - 1]:
+                neighborhood[t] = neighborhood[t - 1]
+        return {'neighborhood': neighborhood, 'iterations': iterations, 'converged': converged}
+
+    def _run_python(self, max_steps):
+        """Čítače jako Python int (registr j = bajt j), maximum broadword operacemi."""
+        offsets, targets = self.offsets, self.targets
+        n = self.node_count()
+        m = self.registers
+        index, rank = self._registers_of([_splitmix64((self.seed + i) & _MASK64) for i in range(n)])
+        counters = [r << (8 * j) for j, r in zip(index, rank)]
+        # Horní bit každého bajtu; registry jsou < 128, takže (x | high) - y nepřenáší mezi bajty
+        high = int.from_bytes(b'\x80' * m, 'little')
+        powers = [2.0 ** -r for r in range(128)]
+
+        def estimate(counter):
+            data = counter.to_bytes(m, 'little')
+            return self._estimate(sum(powers[r] for r in data), data.count(0))
+
+        sizes = [estimate(counter) for counter in counters]
+        total = sum(sizes)
+        neighborhood = [total]
+        iterations = 0
+        while max_steps is None or iterations < max_steps:
+            updated = counters[:]
+            changed = []
+            for u in range(n):
+                acc = counters[u]
+                for slot in range(offsets[u], offsets[u + 1]):
+                    other = counters[targets[slot]]
+                    # Bajty, kde acc >= other, mají po odečtení nastavený horní bit
+                    keep = ((((acc | high) - other) & high) >> 7) * 0xFF
+                    acc = (acc & keep) | (other & ~keep)
+                if acc != counters[u]:
+                    updated[u] = acc
+                    changed.append(u)
+            if not changed:
+                return self._finish(neighborhood, iterations, True)
+            for u in changed:
+                size = estimate(updated[u])
+                total += size - sizes[u]
+                sizes[u] = size
+            counters = updated
+            iterations += 1
+            neighborhood.append(total)
+        return self._finish(neighborhood, iterations, False)
+
+    def _union_plan(self, offsets, targets):
+        """
+        Připraví sjednocení čítačů s následníky po vrstvách a blocích.
+
+        Uzly se stupněm nejvýše LAYER_DEGREE se zpracují po vrstvách: vrstva k
+        obsahuje uzly se stupněm > k a jejich k-tého následníka, takže se každá
+        vrstva sjednotí jedním maximem celých matic. Uzly s vyšším stupněm se
+        sjednotí přes maximum.reduceat po blocích s nejvýše CHUNK_BYTES bajty
+        registrů sousedů.
+
+        Returns:
+            tuple: (vrstvy [(řádky, následníci)], bloky [(řádky, následníci, začátky úseků)])
+        """
+        np = get_numpy()
+        degree = np.diff(offsets)
+        light = np.flatnonzero((degree > 0) & (degree <= self.LAYER_DEGREE))
+        light = light[np.argsort(-degree[light], kind='stable')]
+        light_degree = degree[light]
+        layers = []
+        for k in range(int(light_degree[0]) if len(light) else 0):
+            # Uzly jsou seřazené sestupně podle stupně, vrstva k je jejich prefix
+            rows = light[:int(np.searchsorted(-light_degree, -k, side='left'))]
+            layers.append((rows, targets[offsets[rows] + k]))
+
+        heavy = np.flatnonzero(degree > self.LAYER_DEGREE)
+        limit = max(1, self.CHUNK_BYTES // self.registers)
+        blocks = []
+        start = 0
+        while start < len(heavy):
+            end = start + 1
+            edges = int(degree[heavy[start]])
+            while end < len(heavy) and edges + degree[heavy[end]] <= limit:
+                edges += int(degree[heavy[end]])
+                end += 1
+            rows = heavy[start:end]
+            lengths = degree[rows]
+            starts = np.cumsum(lengths) - lengths
+            edge_index = np.repeat(offsets[rows] - starts, lengths) + np.arange(edges)
+            blocks.append((rows, targets[edge_index], starts))
+            start = end
+        return layers, blocks
+
+    def _run_numpy(self, max_steps):
+        """Čítače jako matice uint8 (n × registers), sjednocení maximem po vrstvách následníků."""
+        np = get_numpy()
+        n = self.node_count()
+        m = self.registers
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        targets = np.asarray(self.targets)
+        index, rank = self._registers_of(_hash_numpy(n, self.seed))
+        counters = np.zeros((n, m), dtype=np.uint8)
+        counters[np.arange(n), index] = rank
+        powers = np.ldexp(1.0, -np.arange(128))
+        alpha = self._alpha()
+        layers, blocks = self._union_plan(offsets, targets)
+
+        # Řádků na blok odhadu (mezivýsledek 2^-registr je float64)
+        chunk = max(1, self.CHUNK_BYTES // (8 * m))
+
+        def estimate(counters, rows):
+            sizes = np.empty(len(rows))
+            for start in range(0, len(rows), chunk):
+                part = counters[rows[start:start + chunk]]
+                inverse = powers[part].sum(axis=1)
+                zeros = (part == 0).sum(axis=1)
+                raw = alpha * m * m / inverse
+                # Malé množiny: lineární počítání podle nulových registrů
+                small = (raw <= 2.5 * m) & (zeros > 0)
+                raw[small] = m * np.log(m / zeros[small])
+                sizes[start:start + len(part)] = raw
+            return sizes
+
+        sizes = estimate(counters, np.arange(n))
+        neighborhood = [float(sizes.sum())]
+        iterations = 0
+        while max_steps is None or iterations < max_steps:
+            updated = counters.copy()
+            for rows, neighbors in layers:
+                updated[rows] = np.maximum(updated[rows], counters[neighbors])
+            for rows, neighbors, starts in blocks:
+                union = np.maximum.reduceat(counters[neighbors], starts, axis=0)
+                updated[rows] = np.maximum(updated[rows], union)
+            changed = np.flatnonzero((updated != counters).any(axis=1))
+            if not len(changed):
+                return self._finish(neighborhood, iterations, True)
+            counters = updated
+            sizes[changed] = estimate(counters, changed)
+            iterations += 1
+            neighborhood.append(float(sizes.sum()))
+        return self._finish(neighborhood, iterations, False)
@@ -1,30 +1,56 @@
 import csv
+import json
 import os
+import struct
+import sys
+from array import array
+
+from ..models import SparseMatrix, DistanceMatrix
+from .numpy_support import get_numpy, has_numpy
+from .path_analyzer import PathAnalyzer
+
 
 class MatrixAnalyzer:
     """
-    - get_adjacency_matrix() -> (matrix, node_list)
-        matrix: list[list[int]] velikost n x n, matrix[i][j] = počet hran z i do j
+    - get_adjacency_matrix(dense=False) -> (matrix, node_list)
+        matrix: SparseMatrix n x n, matrix[i][j] = počet hran z i do j
         node_list: seřazené ID uzlů (indexy řádků/sloupců)
 
-    - get_incidence_matrix() -> (matrix, node_list, edge_list)
-        matrix: list[list[int]] velikost n_nodes x n_edges, hodnoty 1/-1/2 podle orientace/smyčky
+    - get_incidence_matrix(dense=False) -> (matrix, node_list, edge_list)
+        matrix: SparseMatrix n_nodes x n_edges, hodnoty 1/-1/2 podle orientace/smyčky
         edge_list: seznam hran odpovídajících sloupcům (unikátní podle (u,v,direction))
 
-    - get_weight_matrix() -> (matrix, node_list)
-        matrix: list[list[float]] velikost n x n; neexistující přímé spojení = float('inf'), diagonála = 0
+    - get_weight_matrix(dense=False) -> (matrix, node_list)
+        matrix: SparseMatrix n x n s výplní float('inf'); neexistující přímé spojení = inf, diagonála = 0
 
-    - get_adjacency_power(k) -> (matrix_k, node_list)
+    - get_adjacency_power(k, dense=False) -> (matrix_k, node_list)
         matrix_k: počet cest délky k mezi dvojicemi uzlů (celá čísla)
+        Je-li k dispozici NumPy (a `self.use_numpy` je True), počítá se nad ndarray
+        maticovým násobením; výsledek je totožný s čistě Pythonovou variantou.
+
+    - count_walks(u, v, k) -> int, count_walks_from(u, k) -> dict
+        počty sledů délky k bez výpočtu celé A^k (propagace vektoru, O(k·m))
+
+    - get_adjacency_array() / get_weight_array() -> (ndarray, node_list)
+        husté NumPy matice (vyžadují NumPy)
+
+    - get_distance_matrix(jobs=1) -> (DistanceMatrix, node_list)
+        nejkratší vzdálenosti všech dvojic (BFS/Dijkstra z každého uzlu, volitelně
+        paralelně); save_distance_matrix() uloží CSV nebo binární soubor (.tgd)
+
+    Matice jsou řídké (`SparseMatrix`, CSR): paměť je O(n + nnz), matice
+    incidence tedy O(m) místo O(n·m). `matrix[i][j]`, `len(matrix)` i iterace
+    přes řádky fungují jako u 2D seznamu; hustý 2D seznam vrátí `dense=True`
+    nebo `matrix.to_dense()`. Všechny operace níže přijímají obě podoby.
 
     Formátování a export:
     - _print_matrix() zarovnává sloupce podle šířky obsahu
     - _format_cell() používá `self.float_precision` a `self.inf_symbol`
     - save_matrix_csv(...) uloží CSV (prázdná buňka = žádné přímé spojení)
 
-    TODO k rozšíření a výkonu:
-    - Pro velké grafy doporučuji vytvořit lokální mapu id->index (dict) a používat ji namísto node_list.index()
-    - Pokud chcete dělat numeriku (A^k) pro velké grafy, zvažte numpy arrays pro výkon
+    Pořadí uzlů (node_list) i mapa id->index pochází z grafu (`Graph.get_node_list()`,
+    `Graph.get_node_index()`), počítají se jednou pro každou verzi grafu a sdílí je
+    všechny matice, CSV export i analyzátory cest.
     """
 
     def __init__(self, graph):
@@ -39,50 +65,61 @@ class MatrixAnalyzer:
         # inf_symbol: symbol used to render 'infinite' / no direct connection
         self.float_precision = 1  # number of decimals to show for floats
         self.inf_symbol = '∞'
+        # NumPy backend pro A^k (vypnutím se vynutí čistě Pythonový výpočet)
+        self.use_numpy = has_numpy()
+
+    @staticmethod
+    def _as_result(matrix, dense):
+        """Vrátí řídkou matici, nebo její hustou podobu pokud je vyžádána."""
+        return matrix.to_dense() if dense else matrix
     
     """
     Vrátí matici sousednosti grafu.
     
+    Args:
+        dense (bool): True = vrátit 2D seznam místo SparseMatrix
+
     Returns:
-        tuple: (matrix, node_list) kde matrix je 2D seznam a node_list je seznam identifikátorů uzlů
+        tuple: (matrix, node_list) kde matrix je SparseMatrix (nebo 2D seznam) a node_list je seznam identifikátorů uzlů
     """
-    def get_adjacency_matrix(self):
+    def get_adjacency_matrix(self, dense=False):
         # If there are no nodes, return empty structures
         # Returns: (matrix, node_list)
-        #  - matrix: n x n list of ints (counts of edges between nodes)
+        #  - matrix: n x n matrix of ints (counts of edges between nodes)
         #  - node_list: sorted list of node identifiers (order of rows/cols)
         if not self.graph.nodes:
-            return [], []
+            return self._as_result(SparseMatrix((0, 0)), dense), []
         
-        node_list = sorted(self.graph.nodes.keys())
+        node_list = self.graph.get_node_list()
         n = len(node_list)
-        matrix = [[0 for _ in range(n)] for _ in range(n)]
         
-        # Naivní implementace: pro každý pár (u,v) projít sousední hrany u a spočítat
-        # počet hran vedoucích do v. To vrací multiplicitu hran mezi dvojicí uzlů.
-        # Pozn.: pro velké grafy zvážit vytvoření id->index mapy a iteraci přes adj seznamy (optimalizace).
-        for i, u_id in enumerate(node_list):
-            for j, v_id in enumerate(node_list):
-                # Count edges from u to v
-                count = 0
-                for edge in self.graph.adj[u_id]:
-                    if edge.v.identifier == v_id:
-                        if self.graph.is_directed:
-                            # pouze explicitně orientované hrany '>' se počítají jako u->v
-                            if edge.direction == '>':
-                                count += 1
-                        else:
-                            # v neorientovaném grafu každá hrana mezi uzly zvyšuje hodnotu
-                            count += 1
-                matrix[i][j] = count
+        # Každá pozice řádku u v CSR zvýší buňku [u][v] o 1, takže násobné hrany dají multiplicitu.
+        # V orientovaném grafu se počítají pouze orientované hrany ('A < B' je v řádku B),
+        # v neorientovaném grafu každá hrana mezi uzly zvyšuje hodnotu.
+        # Jediný průchod CSR, ukládají se jen nenulové buňky: O(n + m)
+        directed = self.graph.is_directed
+        csr = self.graph.get_csr()
+        offsets, targets, edge_ids, edges = csr.offsets, csr.targets, csr.edge_ids, self.graph.edges
+        rows = []
+        for u in range(n):
+            row = {}
+            for slot in range(offsets[u], offsets[u + 1]):
+                if directed and edges[edge_ids[slot]].direction == '-':
+                    continue
+                j = targets[slot]
+                row[j] = row.get(j, 0) + 1
+            rows.append(row)
         
-        return matrix, node_list
+        return self._as_result(SparseMatrix.from_rows((n, n), rows), dense), node_list
     
     """
     Vrátí matici incidence grafu.
     
     ---
 
+    Args:
+        dense (bool): True = vrátit 2D seznam místo SparseMatrix
+
     Returns: tuple: (matrix, node_list, edge_list)
     - matrix: n_nodes x n_edges, hodnoty v buňkách jsou 1 / -1 / 2
     Semantika:
@@ -91,11 +128,11 @@ class MatrixAnalyzer:
         * 2  — smyčka (edge spojuje uzel se sebou samým; incidenčně se započítává dvakrát)
     Edge cases: prázdný graf nebo bez hran vrátí prázdné struktury
     """
-    def get_incidence_matrix(self):
+    def get_incidence_matrix(self, dense=False):
         if not self.graph.nodes or not self.graph.edges:
-            return [], [], []
+            return self._as_result(SparseMatrix((0, 0)), dense), [], []
 
-        node_list = sorted(self.graph.nodes.keys())
+        node_list = self.graph.get_node_list()
         edge_list = []
 
         # Create a list of unique edges (avoid duplicates for undirected)
@@ -106,75 +143,76 @@ class MatrixAnalyzer:
                 edge_list.append(edge)
                 seen_edges.add(edge_key)
 
-        # Build zero matrix sized by nodes x edges
+        # Každý sloupec má nejvýše dvě nenulové buňky -> paměť O(n + m)
         n_nodes = len(node_list)
         n_edges = len(edge_list)
-        matrix = [[0 for _ in range(n_edges)] for _ in range(n_nodes)]
+        rows = [{} for _ in range(n_nodes)]
 
-        # Build a quick lookup map id->index to avoid repeated index() calls
-        node_index = {nid: idx for idx, nid in enumerate(node_list)}
+        # Shared id->index map of the graph (no repeated index() calls)
+        node_index = self.graph.get_node_index()
 
         for j, edge in enumerate(edge_list):
             # map node identifiers to row indices
             u_idx = node_index[edge.u.identifier]
             v_idx = node_index[edge.v.identifier]
 
+            # Handle self-loops: represent as 2 in the corresponding column
+            if u_idx == v_idx:
+                rows[u_idx][j] = 2
             # Fill according to orientation
-            if edge.direction == '>':
-                matrix[u_idx][j] = 1   # Outgoing
-                matrix[v_idx][j] = -1  # Incoming
+            elif edge.direction == '>':
+                rows[u_idx][j] = 1   # Outgoing
+                rows[v_idx][j] = -1  # Incoming
             elif edge.direction == '<':
-                matrix[u_idx][j] = -1  # Incoming
-                matrix[v_idx][j] = 1   # Outgoing
+                rows[u_idx][j] = -1  # Incoming
+                rows[v_idx][j] = 1   # Outgoing
             else:  # Undirected
-                matrix[u_idx][j] = 1
-                matrix[v_idx][j] = 1
-
-            # Handle self-loops: represent as 2 in the corresponding column
-            if edge.u == edge.v:
-                matrix[u_idx][j] = 2
+                rows[u_idx][j] = 1
+                rows[v_idx][j] = 1
 
-        return matrix, node_list, edge_list
+        matrix = SparseMatrix.from_rows((n_nodes, n_edges), rows)
+        return self._as_result(matrix, dense), node_list, edge_list
     
     """
     Vrátí matici vah (vzdáleností) grafu.
     
+    Args:
+        dense (bool): True = vrátit 2D seznam místo SparseMatrix
+
     Returns:
         tuple: (matrix, node_list)
     """
-    def get_weight_matrix(self):
+    def get_weight_matrix(self, dense=False):
         # Returns (matrix, node_list)
-        # matrix uses float('inf') for missing direct connection, diagonal 0
+        # matrix uses float('inf') for missing direct connection (fill value), diagonal 0
         if not self.graph.nodes:
-            return [], []
+            return self._as_result(SparseMatrix((0, 0), fill=float('inf')), dense), []
         
-        node_list = sorted(self.graph.nodes.keys())
+        node_list = self.graph.get_node_list()
+        node_index = self.graph.get_node_index()
         n = len(node_list)
-        # Initialize with infinity for no direct connection
-        INF = float('inf')
-        matrix = [[INF for _ in range(n)] for _ in range(n)]
         
-        # Set diagonal to 0 (distance from node to itself)
-        for i in range(n):
-            matrix[i][i] = 0
+        # Set diagonal to 0 (distance from node to itself), the rest is implicit inf
+        rows = [{i: 0} for i in range(n)]
         
         # Fill in direct edge weights
         # Note: if weight is None we use implicit weight = 1
         # If multiple edges exist, we keep the minimum weight between nodes
         for i, u_id in enumerate(node_list):
-            for edge in self.graph.adj[u_id]:
-                j = node_list.index(edge.v.identifier)
+            for edge in self.graph.out_edges(u_id):
+                j = node_index[edge.v.identifier]
                 weight = edge.weight if edge.weight is not None else 1
                 if isinstance(weight, (int, float)):
                     if self.graph.is_directed:
                         # only consider directed '>' edges as outgoing
                         if edge.direction == '>':
-                            matrix[i][j] = min(matrix[i][j], weight)
+                            rows[i][j] = min(rows[i].get(j, float('inf')), weight)
                     else:
-                        matrix[i][j] = min(matrix[i][j], weight)
-                        matrix[j][i] = min(matrix[j][i], weight)
+                        rows[i][j] = min(rows[i].get(j, float('inf')), weight)
+                        rows[j][i] = min(rows[j].get(i, float('inf')), weight)
         
-        return matrix, node_list
+        matrix = SparseMatrix.from_rows((n, n), rows, fill=float('inf'))
+        return self._as_result(matrix, dense), node_list
     
 
     def print_adjacency_matrix(self):
@@ -208,10 +246,14 @@ class MatrixAnalyzer:
         print("\nMatice vah:")
         self._print_matrix(matrix, nodes, col_labels=nodes)
 
-    def get_adjacency_power(self, k):
+    def get_adjacency_power(self, k, dense=False):
         """
         Vrátí matici sousednosti umocněnou na k-tou.
         (A^k)[i][j] = počet cest délky k z i do j.
+
+        Args:
+            k (int): Exponent (>= 1)
+            dense (bool): True = vrátit 2D seznam místo SparseMatrix
         """
         # Validace vstupu: k musí být >= 1
         if k < 1:
@@ -219,32 +261,160 @@ class MatrixAnalyzer:
 
         A, nodes = self.get_adjacency_matrix()
         if not A:
-            return [], []
-
-        # Maticové násobení s ignorováním nul pro úsporu operací
-        def mat_mult(X, Y):
-            n = len(X)
-            Z = [[0]*n for _ in range(n)]
-            for i in range(n):
-                for p in range(n):
-                    if X[i][p] == 0:
-                        continue
-                    xv = X[i][p]
-                    for j in range(n):
-                        if Y[p][j]:
-                            Z[i][j] += xv * Y[p][j]
-            return Z
+            return self._as_result(A, dense), []
+
+        if self.use_numpy and get_numpy() is not None:
+            return self._as_result(self._adjacency_power_numpy(A, k), dense), nodes
 
+        # Opakované umocňování (square-and-multiply), řídké násobení přeskakuje nuly
         result = None
         base = A
         exp = k
         while exp > 0:
             if exp & 1:
-                result = mat_mult(result, base) if result is not None else [row[:] for row in base]
-            base = mat_mult(base, base)
+                result = result.matmul(base) if result is not None else base
             exp >>= 1
+            if exp:
+                base = base.matmul(base)
 
-        return result, nodes
+        return self._as_result(result, dense), nodes
+
+    def count_walks_from(self, u, k):
+        """
+        Spočítá počty sledů délky k z uzlu u do všech uzlů (řádek u matice A^k).
+
+        Řídký vektor počtů se k-krát vynásobí řídkou maticí sousednosti,
+        takže výpočet trvá O(k·m) a potřebuje jen O(n + m) paměti.
+
+        Args:
+            u (str): Identifikátor počátečního uzlu
+            k (int): Délka sledů (>= 0, pro k = 0 je to jednotkový vektor)
+
+        Returns:
+            dict: {id uzlu: počet sledů} pro všechny uzly v pořadí node_list
+        """
+        if k < 0:
+            raise ValueError('k musí být >= 0')
+        node_index = self.graph.get_node_index()
+        if u not in node_index:
+            raise ValueError(f"Uzel '{u}' neexistuje v grafu")
+
+        A, nodes = self.get_adjacency_matrix()
+        counts = {node_index[u]: 1}
+        for _ in range(k):
+            if not counts:
+                break  # žádný sled nepokračuje, dál zůstanou samé nuly
+            step = {}
+            for i, c in counts.items():
+                for j, multiplicity in A.row(i):
+                    step[j] = step.get(j, 0) + c * multiplicity
+            counts = step
+
+        return {node_id: counts.get(i, 0) for i, node_id in enumerate(nodes)}
+
+    def count_walks(self, u, v, k):
+        """
+        Vrátí počet sledů délky k z uzlu u do uzlu v, tj. (A^k)[u][v].
+
+        Args:
+            u (str): Identifikátor počátečního uzlu
+            v (str): Identifikátor koncového uzlu
+            k (int): Délka sledů (>= 0)
+
+        Returns:
+            int: Počet sledů
+        """
+        if v not in self.graph.get_node_index():
+            raise ValueError(f"Uzel '{v}' neexistuje v grafu")
+        return self.count_walks_from(u, k)[v]
+
+    # ========== NumPy backend ==========
+
+    def get_adjacency_array(self):
+        """
+        Vrátí matici sousednosti jako NumPy pole (int64).
+
+        Returns:
+            tuple: (ndarray n x n, node_list)
+        """
+        np = self._require_numpy()
+        A, nodes = self.get_adjacency_matrix()
+        return self._to_ndarray(A, np.int64), nodes
+
+    def get_weight_array(self):
+        """
+        Vrátí matici vah jako NumPy pole (float64, bez přímého spojení = inf).
+
+        Returns:
+            tuple: (ndarray n x n, node_list)
+        """
+        np = self._require_numpy()
+        W, nodes = self.get_weight_matrix()
+        return self._to_ndarray(W, np.float64), nodes
+
+    @staticmethod
+    def _require_numpy():
+        """Načte NumPy, nebo vyhodí ImportError, není-li nainstalováno."""
+        np = get_numpy()
+        if np is None:
+            raise ImportError('Tato operace vyžaduje knihovnu NumPy (pip install numpy)')
+        return np
+
+    @staticmethod
+    def _to_ndarray(matrix, dtype):
+        """Převede SparseMatrix na husté ndarray daného typu."""
+        np = get_numpy()
+        result = np.full(matrix.shape, matrix.fill, dtype=dtype)
+        if matrix.nnz():
+            rows, cols, data = matrix.to_coo()
+            result[rows, cols] = data
+        return result
+
+    @staticmethod
+    def _from_ndarray(result):
+        """Převede celočíselné ndarray zpět na SparseMatrix s Pythonovými int."""
+        np = get_numpy()
+        n_rows, n_cols = result.shape
+        rows, cols = np.nonzero(result)
+        indptr = array('q', [0])
+        indptr.extend(np.cumsum(np.bincount(rows, minlength=n_rows)).tolist())
+        # tolist() převede int64 i object prvky na Pythonové int
+        return SparseMatrix((n_rows, n_cols), indptr, array('i', cols.tolist()),
+                            result[rows, cols].tolist())
+
+    @staticmethod
+    def _exact_matmul(X, Y):
+        """
+        Přesný součin nezáporných celočíselných matic.
+
+        Podle horního odhadu prvků výsledku (max. řádkový součet X krát max. prvek Y)
+        zvolí nejrychlejší přesnou reprezentaci: float64 (BLAS, celá čísla přesně
+        do 2^53), int64, nebo object (libovolně velká Pythonová int).
+        """
+        np = get_numpy()
+        if X.dtype == object or Y.dtype == object:
+            return X.astype(object) @ Y.astype(object)
+        # Odhad ve float64 - rezerva 2x pokrývá zaokrouhlení součtů
+        bound = float(X.sum(axis=1, dtype=np.float64).max(initial=0.0)) * float(Y.max(initial=0))
+        if bound < 2.0 ** 52:
+            return (X.astype(np.float64) @ Y.astype(np.float64)).astype(np.int64)
+        if bound < 2.0 ** 62:
+            return X @ Y
+        # Hrozí přetečení int64 -> přesná aritmetika nad Pythonovými int
+        return X.astype(object) @ Y.astype(object)
+
+    def _adjacency_power_numpy(self, A, k):
+        """A^k opakovaným umocňováním nad ndarray s kontrolou přetečení."""
+        base = self._to_ndarray(A, get_numpy().int64)
+        result = None
+        exp = k
+        while exp > 0:
+            if exp & 1:
+                result = base if result is None else self._exact_matmul(result, base)
+            exp >>= 1
+            if exp:
+                base = self._exact_matmul(base, base)
+        return self._from_ndarray(result)
 
     def _format_cell(self, val):
         # Convert numeric / special values to human-readable strings
@@ -421,11 +591,21 @@ class MatrixAnalyzer:
         rows = len(matrix)
         cols = len(matrix[0]) if rows else 0
 
-        # Prepare string table using _format_cell
-        table = [[self._format_cell(matrix[i][j]) for j in range(cols)] for i in range(rows)]
+        if isinstance(matrix, SparseMatrix):
+            # Šířky sloupců z uložených buněk a výplně, řádky se formátují až při tisku
+            table = None
+            fill_width = len(self._format_cell(matrix.fill))
+            transposed = matrix.transpose()
+            col_widths = [fill_width if transposed.indptr[j + 1] - transposed.indptr[j] < rows else 0
+                          for j in range(cols)]
+            for _, j, val in matrix.items():
+                col_widths[j] = max(col_widths[j], len(self._format_cell(val)))
+        else:
+            # Prepare string table using _format_cell (one row access per row)
+            table = [[self._format_cell(val) for val in row] for row in matrix]
 
-        # Compute max width per column (considering content and optional labels)
-        col_widths = [max((len(table[i][j]) for i in range(rows)), default=0) for j in range(cols)]
+            # Compute max width per column (considering content and optional labels)
+            col_widths = [max((len(table[i][j]) for i in range(rows)), default=0) for j in range(cols)]
         if col_labels:
             for j, lbl in enumerate(col_labels):
                 col_widths[j] = max(col_widths[j], len(str(lbl)))
@@ -444,8 +624,9 @@ class MatrixAnalyzer:
         # Print each row with aligned cells
         for i, node in enumerate(nodes):
             print(f"{str(node):>{row_label_width}} ", end='')
+            cells = table[i] if table is not None else [self._format_cell(v) for v in matrix[i]]
             for j in range(cols):
-                print(f"{table[i][j]:>{col_widths[j]+1}}", end='')
+                print(f"{cells[j]:>{col_widths[j]+1}}", end='')
             print()
         
         # Zobrazit informace o diagonále pouze pro čtvercové matice (pokud je to požadováno)
@@ -465,21 +646,12 @@ class MatrixAnalyzer:
         path (str) when written or CSV string when path is None
     """
     def save_matrix_csv(self, matrix, nodes, col_labels=None, path=None):
-        rows = len(matrix)
-        cols = len(matrix[0]) if rows else 0
-
         header = [''] + [str(l) for l in (col_labels if col_labels is not None else nodes)]
 
-        table = []
-        for i, node in enumerate(nodes):
-            row = [str(node)]
-            for j in range(cols):
-                val = matrix[i][j]
-                if val == float('inf'):
-                    row.append('')
-                else:
-                    row.append(str(val))
-            table.append(row)
+        # Řádky se převádějí postupně při zápisu (řídká matice se nikdy nematerializuje celá)
+        INF = float('inf')
+        table = ([str(node)] + ['' if val == INF else str(val) for val in values]
+                 for node, values in zip(nodes, matrix))
 
         if path is None:
             from io import StringIO
@@ -496,18 +668,100 @@ class MatrixAnalyzer:
             writer.writerows(table)
         return path
 
+    # ========== Matice vzdáleností ==========
+
+    DISTANCE_MAGIC = b'TGD1'
+
+    def get_distance_matrix(self, jobs=1):
+        """
+        Vrátí matici nejkratších vzdáleností mezi všemi dvojicemi uzlů.
+
+        Args:
+            jobs (int): Počet procesů pro výpočet (viz `PathAnalyzer.get_all_distances`)
+
+        Returns:
+            tuple: (DistanceMatrix, node_list)
+        """
+        matrix = PathAnalyzer(self.graph).get_all_distances(jobs)
+        return matrix, matrix.ids
+
+    def save_distance_matrix(self, matrix, path):
+        """
+        Uloží matici vzdáleností do souboru.
+
+        Soubor s příponou .csv se zapíše přes `save_matrix_csv` (prázdná buňka =
+        nedosažitelný uzel), jinak se použije binární formát:
+            MAGIC (4 B) | délka hlavičky (uint32) | JSON hlavička | pole vzdáleností
+        Hlavička obsahuje typ pole, pořadí bajtů a seznam uzlů; pole začíná
+        na offsetu zarovnaném na 8 bajtů.
+
+        Args:
+            matrix (DistanceMatrix): Matice vzdáleností
+            path (str): Cesta k výstupnímu souboru
+
+        Returns:
+            str: Cesta k zapsanému souboru
+        """
+        if path.lower().endswith('.csv'):
+            return self.save_matrix_csv(matrix, matrix.ids, col_labels=matrix.ids, path=path)
+
+        header = json.dumps({
+            'typecode': matrix.data.typecode,
+            'byteorder': sys.byteorder,
+            'weighted': matrix.weighted,
+            'nodes': matrix.ids,
+        }).encode('utf-8')
+        data_offset = (8 + len(header) + 7) // 8 * 8
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(self.DISTANCE_MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(b'\0' * (data_offset - 8 - len(header)))
+            matrix.data.tofile(f)
+        return path
+
+    @staticmethod
+    def load_distance_matrix(path):
+        """
+        Načte matici vzdáleností uloženou binárně metodou `save_distance_matrix`.
+
+        Args:
+            path (str): Cesta k binárnímu souboru
+
+        Returns:
+            DistanceMatrix: Načtená matice
+        """
+        with open(path, 'rb') as f:
+            if f.read(4) != MatrixAnalyzer.DISTANCE_MAGIC:
+                raise ValueError(f"Soubor '{path}' není binární matice vzdáleností")
+            (header_len,) = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+            f.seek((8 + header_len + 7) // 8 * 8)
+            data = array(header['typecode'])
+            n = len(header['nodes'])
+            data.fromfile(f, n * n)
+        if header['byteorder'] != sys.byteorder:
+            data.byteswap()
+        return DistanceMatrix(header['nodes'], data, header['weighted'])
+
     # ========== Maticové operace ==========
 
     def sum_row(self, matrix, row_idx):
         """Vrátí součet hodnot v daném řádku."""
         if not matrix or row_idx >= len(matrix):
             return 0
+        if isinstance(matrix, SparseMatrix):
+            return matrix.row_sum(row_idx)
         return sum(val for val in matrix[row_idx] if val != float('inf'))
 
     def sum_column(self, matrix, col_idx):
         """Vrátí součet hodnot v daném sloupci."""
         if not matrix or col_idx >= len(matrix[0]):
             return 0
+        if isinstance(matrix, SparseMatrix):
+            return matrix.column_sum(col_idx)
         return sum(row[col_idx] for row in matrix if row[col_idx] != float('inf'))
 
     def sum_main_diagonal(self, matrix):
@@ -530,6 +784,8 @@ class MatrixAnalyzer:
         """Vrátí součet všech hodnot v matici."""
         if not matrix:
             return 0
+        if isinstance(matrix, SparseMatrix):
+            return matrix.total()
         total = 0
         for row in matrix:
             for val in row:
@@ -541,6 +797,8 @@ class MatrixAnalyzer:
         """Vrátí transponovanou matici."""
         if not matrix:
             return []
+        if isinstance(matrix, SparseMatrix):
+            return matrix.transpose()
         return [list(row) for row in zip(*matrix)]
 
     def is_symmetric(self, matrix):
@@ -551,6 +809,8 @@ class MatrixAnalyzer:
         cols = len(matrix[0]) if rows else 0
         if rows != cols:
             return False
+        if isinstance(matrix, SparseMatrix):
+            return matrix.structurally_equal(matrix.transpose())
         for i in range(rows):
             for j in range(i+1, cols):
                 if matrix[i][j] != matrix[j][i]:
@@ -565,6 +825,8 @@ class MatrixAnalyzer:
         """Vynásobí dvě matice A × B."""
         if not A or not B:
             return []
+        if isinstance(A, SparseMatrix) and isinstance(B, SparseMatrix):
+            return A.matmul(B)
         rows_A = len(A)
         cols_A = len(A[0]) if rows_A else 0
         rows_B = len(B)
@@ -600,55 +862,63 @@ class MatrixAnalyzer:
         """
         if not matrix:
             return []
+
+        def matches(val):
+            # Ignorovat nekonečno pokud není explicitně hledáno
+            if val == float('inf') and value != float('inf'):
+                return False
+            
+            # Kontrola podmínek
+            if value is not None:
+                return val == value
+            elif min_val is not None and max_val is not None:
+                return min_val <= val <= max_val
+            elif min_val is not None:
+                return val >= min_val
+            elif max_val is not None:
+                return val <= max_val
+            elif condition is not None:
+                return condition(val)
+            return True  # bez podmínky vrátit vše
         
-        results = []
-        rows = len(matrix)
-        cols = len(matrix[0]) if rows else 0
+        if isinstance(matrix, SparseMatrix) and not matches(matrix.fill):
+            # Výplň podmínce nevyhovuje -> stačí projít uložené buňky (O(nnz))
+            cells = matrix.items()
+        else:
+            cells = ((i, j, val) for i, row in enumerate(matrix) for j, val in enumerate(row))
         
-        for i in range(rows):
-            for j in range(cols):
-                val = matrix[i][j]
-                
-                # Ignorovat nekonečno pokud není explicitně hledáno
-                if val == float('inf') and value != float('inf'):
-                    continue
-                
-                # Kontrola podmínek
-                match = False
-                if value is not None:
-                    match = (val == value)
-                elif min_val is not None and max_val is not None:
-                    match = (min_val <= val <= max_val)
-                elif min_val is not None:
-                    match = (val >= min_val)
-                elif max_val is not None:
-                    match = (val <= max_val)
-                elif condition is not None:
-                    match = condition(val)
-                else:
-                    match = True  # bez podmínky vrátit vše
-                
-                if match:
-                    results.append({
-                        'row': i,
-                        'col': j,
-                        'row_node': nodes[i] if i < len(nodes) else i,
-                        'col_node': nodes[j] if j < len(nodes) else j,
-                        'value': val
-                    })
+        results = []
+        for i, j, val in cells:
+            if matches(val):
+                results.append({
+                    'row': i,
+                    'col': j,
+                    'row_node': nodes[i] if i < len(nodes) else i,
+                    'col_node': nodes[j] if j < len(nodes) else j,
+                    'value': val
+                })
         
         return results
 
+    def _scan_values(self, matrix):
+        """Generuje hodnoty matice; u řídké matice jen uložené buňky a jednou výplň."""
+        if isinstance(matrix, SparseMatrix):
+            if matrix.has_implicit_cells():
+                yield matrix.fill
+            yield from matrix.data
+        else:
+            for row in matrix:
+                yield from row
+
     def find_max_in_matrix(self, matrix, nodes):
         """Najde maximální hodnotu (hodnoty) v matici."""
         if not matrix:
             return []
         
         max_val = float('-inf')
-        for row in matrix:
-            for val in row:
-                if val != float('inf') and val > max_val:
-                    max_val = val
+        for val in self._scan_values(matrix):
+            if val != float('inf') and val > max_val:
+                max_val = val
         
         if max_val == float('-inf'):
             return []
@@ -661,10 +931,9 @@ class MatrixAnalyzer:
             return []
         
         min_val = float('inf')
-        for row in matrix:
-            for val in row:
-                if val != float('inf') and val < min_val:
-                    min_val = val
+        for val in self._scan_values(matrix):
+            if val != float('inf') and val < min_val:
+                min_val = val
         
         if min_val == float('inf'):
             return []
@@ -1035,20 +1304,8 @@ class MatrixAnalyzer:
                             print("❌ Délka k musí být alespoň 1")
                             continue
                         
-                        # Spočítat A^k
-                        print(f"\n⏳ Počítám matici sousednosti na {k}. mocninu...")
-                        A_k, nodes_list = self.get_adjacency_power(k)
-                        
-                        if not A_k:
-                            print("❌ Nepodařilo se vypočítat matici")
-                            continue
-                        
-                        # Najít indexy uzlů
-                        start_idx = nodes_list.index(start_node)
-                        end_idx = nodes_list.index(end_node)
-                        
-                        # Získat počet sledů
-                        count = A_k[start_idx][end_idx]
+                        # Počet sledů propagací vektoru - celá A^k není potřeba
+                        count = self.count_walks(start_node, end_node, k)
                         
                         # Zobrazit výsledek
                         print()
@@ -1071,6 +1328,8 @@ class MatrixAnalyzer:
                         # Nabídnout zobrazení celé matice A^k
                         show_matrix = input(f"\nChcete zobrazit celou matici A^{k}? (a/n): ").strip().lower()
                         if show_matrix == 'a':
+                            print(f"\n⏳ Počítám matici sousednosti na {k}. mocninu...")
+                            A_k, nodes_list = self.get_adjacency_power(k)
                             print(f"\nMatice sousednosti na {k}. mocninu:")
                             self._print_matrix(A_k, nodes_list, col_labels=nodes_list)
                         
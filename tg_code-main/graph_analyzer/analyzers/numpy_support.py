@@ -0,0 +1,31 @@
+"""
+Líné načtení volitelné knihovny NumPy.
+
+Import NumPy stojí zhruba 100 ms, proto se knihovna načte až ve výpočtu,
+který ji skutečně použije. Pro automatickou volbu backendu stačí zjistit,
+zda je nainstalována, bez jejího importu.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+
+
+@lru_cache(maxsize=None)
+def has_numpy():
+    """Vrátí True, je-li NumPy nainstalováno (bez importu knihovny)."""
+    return find_spec('numpy') is not None
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """
+    Načte NumPy při prvním volání.
+
+    Returns:
+        module: Modul `numpy`, nebo None, není-li nainstalováno
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
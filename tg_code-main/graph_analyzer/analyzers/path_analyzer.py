@@ -3,13 +3,70 @@ Analyzátor pro cesty a vzdálenosti v grafu.
 """
 
 import heapq
+from array import array
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from typing import Dict, List, Tuple, Optional, Mapping
 
+from ..models import DistanceMatrix, ContractionHierarchy
+from .bitset_bfs import BitsetBFS
+from .frontier_bfs import FrontierBFS
+from .hyperanf import HyperANF
+from .numpy_support import get_numpy, has_numpy
+
+
+class NegativeCycleError(ValueError):
+    """
+    Graf obsahuje záporný cyklus, nejkratší vzdálenosti nejsou definované.
+
+    Attributes:
+        cycle (dict): Svědek cyklu ve tvaru výsledku cesty
+                      {'path': [...] (první uzel = poslední), 'cost': záporná délka, 'edges': [...]}
+    """
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        super().__init__(f"Graf obsahuje záporný cyklus: {' → '.join(cycle['path'])} (délka: {cycle['cost']})")
+
+
 class PathAnalyzer:
     """
     Třída pro analýzu cest a vzdáleností v grafu.
+
+    Excentricity uzlů se cachují pro aktuální verzi grafu (`Graph.get_version()`),
+    takže průměr, poloměr, centrum i periferie sdílí jediný průchod. Samotný
+    průměr a poloměr se počítá omezováním excentricit (`get_diameter_radius`).
+
+    Úlohy nad mnoha zdroji v neohodnoceném grafu (excentricity všech uzlů,
+    matice vzdáleností, `get_shortest_distances_batch`, `get_distance_statistics`)
+    používají bitově paralelní BFS (`BitsetBFS`), který prochází hrany jednou
+    za úroveň pro celou dávku zdrojů. BFS z jednoho zdroje ve velkém grafu
+    běží s NumPy po celých úrovních (`FrontierBFS`, směrově optimalizované).
+
+    Dijkstra z jednoho zdroje vybírá prioritní frontu podle sloupce vah
+    (`get_queue_engine`): pro váhy 0/1 obousměrnou frontu (0-1 BFS), pro
+    malá nezáporná celá čísla Dialovy přihrádky, jinak binární haldu.
+
+    Grafy se zápornými váhami (`Graph.has_negative_weights`) se z jednoho
+    zdroje prohledávají SPFA (Bellman–Ford s frontou), z mnoha zdrojů
+    Johnsonovým převážením na nezáporné váhy a Dijkstrou. Záporný cyklus
+    vyvolá `NegativeCycleError` se svědkem cyklu.
+
+    Pro grafy, kde jsou přesné vzdálenosti všech dvojic příliš drahé,
+    `get_approximate_distances` odhaduje funkci okolí HyperLogLog čítači
+    (`HyperANF`) v několika lineárních průchodech.
     """
+
+    # Pod tímto počtem zdrojů se matice vzdáleností počítá bez procesů
+    PARALLEL_MIN_SOURCES = 64
+    # Počet bloků zdrojů na jeden proces (vyvážení zátěže)
+    CHUNKS_PER_JOB = 4
+    # Nejvyšší celočíselná váha, pro kterou se ještě použijí Dialovy přihrádky
+    DIAL_MAX_WEIGHT = 1000
+    # Od tohoto počtu uzlů se BFS z jednoho zdroje počítá nad poli NumPy
+    FRONTIER_MIN_NODES = 2048
     
     def __init__(self, graph):
         """
@@ -19,6 +76,22 @@ class PathAnalyzer:
             graph (Graph): Graf k analýze
         """
         self.graph = graph
+        # Cache excentricit: platí pro verzi grafu _ecc_version
+        self._ecc_version = None
+        self._ecc_cache = {}
+        self._ecc_disconnected = False
+        # NumPy backend bitově paralelního BFS (vypnutím se vynutí Python int)
+        self.use_numpy = has_numpy()
+        # Contraction hierarchy pro dotazy na cestu (None = obousměrné BFS/Dijkstra)
+        self.hierarchy = None
+        # Johnsonovy potenciály a převážené váhy: (verze grafu, potenciály, váhy)
+        self._johnson = None
+        # Prioritní fronta Dijkstry: None = automaticky podle vah, jinak název enginu
+        self.queue_engine = None
+        # Zvolený engine a funkce pro řádky vzdáleností: ((verze grafu, queue_engine), engine, funkce)
+        self._row_cache = None
+        # Směrově optimalizované BFS nad NumPy: (verze grafu, FrontierBFS)
+        self._frontier = None
     
     def find_shortest_path(self, start_id, end_id):
         """
@@ -29,167 +102,927 @@ class PathAnalyzer:
             end_id (str): Identifikátor cílového uzlu
             
         Returns:
-            list: Seznam identifikátorů uzlů na nejkratší cestě nebo None
+            dict: {'path': seznam identifikátorů uzlů, 'cost': délka cesty,
+                   'edges': seznam použitých hran (Edge ve tvaru u -> v),
+                   'settled': počet uzavřených uzlů obou hledání} nebo None
+
+        Raises:
+            NegativeCycleError: Pokud je z počátku dosažitelný záporný cyklus
         """
         if start_id not in self.graph.nodes or end_id not in self.graph.nodes:
             return None
         
+        csr = self.graph.get_csr()
+        if self.hierarchy is not None and self.hierarchy.ids is csr.ids:
+            # Hierarchie platí jen pro stejné očíslování uzlů (tj. nezměněný graf)
+            nodes, slots, settled = self.hierarchy.query(csr.index_of[start_id], csr.index_of[end_id])
+        elif self.graph.has_negative_weights:
+            nodes, slots, settled = self._spfa_shortest_path(start_id, end_id)
+        elif not self.graph.is_weighted:
+            nodes, slots, settled = self._bfs_shortest_path(start_id, end_id)
+        else:
+            nodes, slots, settled = self._dijkstra_shortest_path(start_id, end_id)
+        if nodes is None:
+            return None
+        result = self._path_result(nodes, slots)
+        result['settled'] = settled
+        return result
+
+    def build_hierarchy(self):
+        """
+        Sestaví contraction hierarchy aktuálního grafu a použije ji pro `find_shortest_path`.
+
+        Returns:
+            ContractionHierarchy: Sestavená hierarchie
+
+        Raises:
+            ValueError: Pokud graf obsahuje zápornou váhu
+        """
+        self.hierarchy = ContractionHierarchy.build(self.graph.get_csr())
+        return self.hierarchy
+
+    def _spfa_shortest_path(self, start_id, end_id):
+        """
+        SPFA z počátku pro grafy se zápornými váhami.
+
+        Returns:
+            tuple: (indexy uzlů na cestě, pozice hran v CSR, počet zpracování
+                   uzlů z fronty); bez cesty jsou první dvě položky None
+        """
+        csr = self.graph.get_csr()
+        start, end = csr.index_of[start_id], csr.index_of[end_id]
+        dist, parent, pops = self._spfa((start,))
+        if dist[end] == float('inf'):
+            return None, None, pops
+        nodes, slots = [end], []
+        node = end
+        while parent[node] >= 0:
+            slot = parent[node]
+            node = _slot_source(csr.offsets, slot)
+            nodes.append(node)
+            slots.append(slot)
+        nodes.reverse()
+        slots.reverse()
+        return nodes, slots, pops
+
+    def _spfa(self, sources):
+        """
+        Spustí SPFA nad CSR; záporný cyklus převede na `NegativeCycleError`.
+
+        Returns:
+            tuple: (vzdálenosti, pozice hrany do uzlu nebo -1, počet zpracování uzlů)
+        """
+        csr = self.graph.get_csr()
+        dist, parent, pops, cycle = _spfa(csr.offsets, csr.targets, csr.weights, sources)
+        if cycle is not None:
+            nodes = [_slot_source(csr.offsets, slot) for slot in cycle]
+            raise NegativeCycleError(self._path_result(nodes + nodes[:1], cycle))
+        return dist, parent, pops
+
+    def _johnson_weights(self):
+        """
+        Vrátí Johnsonovy potenciály h a převážené váhy w'(u, v) = w(u, v) + h(u) - h(v).
+
+        Potenciály jsou vzdálenosti z virtuálního zdroje spojeného se všemi
+        uzly hranou délky 0 (SPFA ze všech uzlů najednou), takže převážené
+        váhy jsou nezáporné a d(s, t) = d'(s, t) - h(s) + h(t). Výsledek se
+        cachuje pro aktuální verzi grafu.
+
+        Returns:
+            tuple: (potenciály uzlů, převážené váhy v pořadí CSR)
+
+        Raises:
+            NegativeCycleError: Pokud graf obsahuje záporný cyklus
+        """
+        version = self.graph.get_version()
+        if self._johnson is None or self._johnson[0] != version:
+            csr = self.graph.get_csr()
+            offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+            potential, _, _ = self._spfa(range(csr.node_count()))
+            reweighted = array('d', weights)
+            for u in range(csr.node_count()):
+                h = potential[u]
+                for slot in range(offsets[u], offsets[u + 1]):
+                    weight = weights[slot]
+                    if weight == weight:  # NaN (nečíselná váha) zůstává
+                        # max() jen proti zaokrouhlovací chybě u neceločíselných vah
+                        reweighted[slot] = max(0.0, weight + h - potential[targets[slot]])
+            self._johnson = (version, potential, reweighted)
+        return self._johnson[1], self._johnson[2]
+
+    def get_queue_engine(self):
+        """
+        Vrátí prioritní frontu, kterou Dijkstra použije pro aktuální graf.
+
+        Sloupec vah (u záporných vah po Johnsonově převážení) se projde jednou
+        pro každou verzi grafu, pokud není engine vynucen přes `queue_engine`.
+
+        Returns:
+            str: 'zero-one' (váhy 0/1, deque), 'dial' (celá čísla do
+                 DIAL_MAX_WEIGHT), 'radix' (jen vynucený), 'heap' (heapq)
+                 nebo 'bfs' pro neohodnocený graf
+
+        Vynucený celočíselný engine ('zero-one', 'dial', 'radix') vyvolá při
+        hledání `ValueError`, pokud ho váhy grafu nepřipouštějí.
+        """
         if not self.graph.is_weighted:
-            return self._bfs_shortest_path(start_id, end_id)
+            return 'bfs'
+        if self.queue_engine is not None:
+            return self.queue_engine
+        return self._row_runner()[0]
+
+    def _row_runner(self):
+        """Vrátí (engine, funkce index zdroje -> řádek vzdáleností) pro aktuální verzi grafu."""
+        key = (self.graph.get_version(), self.queue_engine)
+        if self._row_cache is None or self._row_cache[0] != key:
+            csr = self.graph.get_csr()
+            potential, weights = None, csr.weights
+            if self.graph.has_negative_weights:
+                potential, weights = self._johnson_weights()
+            engine = self.queue_engine or _select_queue_engine(weights, self.DIAL_MAX_WEIGHT)
+            run = _row_runner(csr.offsets, csr.targets, weights, engine)
+            if potential is not None:
+                INF = float('inf')
+
+                def run(source, reweighted_run=run):
+                    h = potential[source]
+                    return [d - h + potential[v] if d != INF else INF
+                            for v, d in enumerate(reweighted_run(source))]
+            self._row_cache = (key, engine, run)
+        return self._row_cache[1], self._row_cache[2]
+
+    def _weighted_row(self, source):
+        """Vzdálenosti z uzlu (index) v ohodnoceném grafu; se zápornými váhami přes Johnsona."""
+        return self._row_runner()[1](source)
+
+    def _path_result(self, nodes, slots):
+        """
+        Sestaví výsledek hledání cesty z indexů uzlů a pozic hran v CSR.
+
+        Hrana na pozici `slot` je `graph.edges[csr.edge_ids[slot]]` (otočená do
+        tvaru u -> v), takže se nic znovu neprohledává.
+        """
+        csr = self.graph.get_csr()
+        ids, edge_ids, graph_edges = csr.ids, csr.edge_ids, self.graph.edges
+        edges = [self.graph.oriented_edge(graph_edges[edge_ids[slot]], ids[u]) for u, slot in zip(nodes, slots)]
+        if self.graph.is_weighted:
+            cost = sum(edge.weight if edge.weight is not None else 1 for edge in edges)
         else:
-            return self._dijkstra_shortest_path(start_id, end_id)
+            cost = len(edges)
+        return {'path': [ids[idx] for idx in nodes], 'cost': cost, 'edges': edges}
     
     def _bfs_shortest_path(self, start_id, end_id):
-        """BFS pro neohodnocené grafy."""
-        queue = deque([(start_id, [start_id])])
-        visited = {start_id}
+        """
+        Obousměrné BFS pro neohodnocené grafy (prochází CSR s celočíselnými indexy).
+
+        Hledá se střídavě z počátku po hranách a z cíle po transponovaných
+        hranách, vždy rozšířením celé úrovně menší fronty. Uzly si pamatují jen
+        předchůdce a pozici hrany, cesta se sestaví až po setkání obou hledání.
+
+        Returns:
+            tuple: (indexy uzlů na cestě, pozice použitých hran v CSR, počet
+                   rozšířených uzlů); bez cesty jsou první dvě položky None
+        """
+        csr = self.graph.get_csr()
+        start = csr.index_of[start_id]
+        end = csr.index_of[end_id]
+        if start == end:
+            return [start], [], 0
+
+        offsets, targets = csr.offsets, csr.targets
+        rev_offsets, rev_sources, _, rev_slots = csr.get_transpose()
+        # uzel -> (předchůdce ve směru hledání, pozice hrany v dopředném CSR, hloubka)
+        forward = {start: None}
+        backward = {end: None}
+        forward_frontier = [start]
+        backward_frontier = [end]
+        forward_depth = backward_depth = 0
+        settled = 0
         
-        while queue:
-            current_id, path = queue.popleft()
-            
-            if current_id == end_id:
-                return path
-            
-            for edge in self.graph.adj[current_id]:
-                next_id = edge.v.identifier
-                if next_id not in visited:
-                    visited.add(next_id)
-                    queue.append((next_id, path + [next_id]))
+        while forward_frontier and backward_frontier:
+            best = None  # (hloubka uzlu setkání v protějším hledání, uzel setkání)
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_depth += 1
+                settled += len(forward_frontier)
+                next_frontier = []
+                for current in forward_frontier:
+                    for slot in range(offsets[current], offsets[current + 1]):
+                        nxt = targets[slot]
+                        if nxt not in forward:
+                            forward[nxt] = (current, slot, forward_depth)
+                            next_frontier.append(nxt)
+                            if nxt in backward:
+                                link = backward[nxt]
+                                depth = link[2] if link else 0
+                                if best is None or depth < best[0]:
+                                    best = (depth, nxt)
+                forward_frontier = next_frontier
+            else:
+                backward_depth += 1
+                settled += len(backward_frontier)
+                next_frontier = []
+                for current in backward_frontier:
+                    for pos in range(rev_offsets[current], rev_offsets[current + 1]):
+                        prev = rev_sources[pos]
+                        if prev not in backward:
+                            backward[prev] = (current, rev_slots[pos], backward_depth)
+                            next_frontier.append(prev)
+                            if prev in forward:
+                                link = forward[prev]
+                                depth = link[2] if link else 0
+                                if best is None or depth < best[0]:
+                                    best = (depth, prev)
+                backward_frontier = next_frontier
+
+            if best is not None:
+                return (*_join_chains(forward, backward, best[1]), settled)
         
-        return None
+        return None, None, settled
     
     def _dijkstra_shortest_path(self, start_id, end_id):
-        """Dijkstra algoritmus pro ohodnocené grafy."""
-        distances = {node_id: float('inf') for node_id in self.graph.nodes}
-        distances[start_id] = 0
-        previous = {}
-        # Use float for distances in the priority queue to satisfy type checkers
-        pq: List[Tuple[float, str]] = [(0.0, start_id)]
-        
-        while pq:
-            current_dist, current_id = heapq.heappop(pq)
-            
-            if current_id == end_id:
-                # Reconstruct path
-                path = []
-                while current_id is not None:
-                    path.append(current_id)
-                    current_id = previous.get(current_id)
-                return path[::-1]
-            
-            if current_dist > distances[current_id]:
+        """
+        Obousměrná Dijkstra pro ohodnocené grafy.
+
+        Hledá se současně od počátku po hranách a od cíle po transponovaných
+        hranách (`CSRGraph.get_transpose()`), vždy na straně s menším klíčem
+        v haldě. μ je délka nejlepší dosud nalezené cesty přes hranu mezi
+        oběma hledáními; hledání končí, jakmile součet minim obou hald
+        dosáhne μ. Vzdálenosti a předchůdci se drží ve slovnících, takže
+        se inicializují jen navštívené uzly.
+
+        Returns:
+            tuple: (indexy uzlů na cestě, pozice použitých hran v CSR, počet
+                   uzavřených uzlů); bez cesty jsou první dvě položky None
+        """
+        csr = self.graph.get_csr()
+        start = csr.index_of[start_id]
+        end = csr.index_of[end_id]
+        if start == end:
+            return [start], [], 0
+
+        rev_offsets, rev_sources, rev_weights, rev_slots = csr.get_transpose()
+        forward_dist = {start: 0.0}
+        backward_dist = {end: 0.0}
+        forward_parent = {start: None}   # uzel -> (předchůdce, pozice hrany, ...)
+        backward_parent = {end: None}    # uzel -> (následník, pozice hrany, ...)
+        forward_pq: List[Tuple[float, int]] = [(0.0, start)]
+        backward_pq: List[Tuple[float, int]] = [(0.0, end)]
+        # Strana hledání: (CSR, mapa pozic na dopředné CSR, vzdálenosti, předchůdci,
+        # halda, vzdálenosti protější strany)
+        forward = (csr.offsets, csr.targets, csr.weights, None,
+                   forward_dist, forward_parent, forward_pq, backward_dist)
+        backward = (rev_offsets, rev_sources, rev_weights, rev_slots,
+                    backward_dist, backward_parent, backward_pq, forward_dist)
+        INF = float('inf')
+        mu = INF
+        meet = None
+        settled = 0
+
+        while forward_pq and backward_pq:
+            if forward_pq[0][0] + backward_pq[0][0] >= mu:
+                break
+            side = forward if forward_pq[0][0] <= backward_pq[0][0] else backward
+            offsets, targets, weights, slots, dist, parent, pq, other_dist = side
+
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > dist[current]:
                 continue
-            
-            for edge in self.graph.adj[current_id]:
-                next_id = edge.v.identifier
-                weight = edge.weight if edge.weight is not None else 1
-                if isinstance(weight, (int, float)):
-                    distance = current_dist + weight
-                    
-                    if distance < distances[next_id]:
-                        distances[next_id] = distance
-                        previous[next_id] = current_id
-                        heapq.heappush(pq, (distance, next_id))
-        
-        return None
+            settled += 1
+
+            for slot in range(offsets[current], offsets[current + 1]):
+                weight = weights[slot]
+                if weight != weight:  # NaN = nečíselná váha, hrana se přeskočí
+                    continue
+                nxt = targets[slot]
+                distance = current_dist + weight
+
+                if distance < dist.get(nxt, INF):
+                    dist[nxt] = distance
+                    parent[nxt] = (current, slot if slots is None else slots[slot])
+                    heapq.heappush(pq, (distance, nxt))
+                if nxt in other_dist and dist[nxt] + other_dist[nxt] < mu:
+                    mu = dist[nxt] + other_dist[nxt]
+                    meet = nxt
+
+        if meet is None:
+            return None, None, settled
+        return (*_join_chains(forward_parent, backward_parent, meet), settled)
     
-    def find_all_paths(self, start_id, end_id, max_length=None):
+    def find_all_paths(self, start_id, end_id, max_length=None, max_paths=None):
         """
         Najde všechny jednoduché cesty mezi dvěma uzly.
         
         Args:
             start_id (str): Identifikátor počátečního uzlu
             end_id (str): Identifikátor cílového uzlu
-            max_length (int): Maximální délka cesty
+            max_length (int): Maximální počet hran cesty (None = bez omezení)
+            max_paths (int): Maximální počet vrácených cest (None = všechny)
             
         Returns:
             list: Seznam všech cest (každá cesta je seznam identifikátorů uzlů)
         """
+        return list(islice(self.iter_simple_paths(start_id, end_id, max_length), max_paths))
+
+    def iter_simple_paths(self, start_id, end_id, max_length=None):
+        """
+        Postupně generuje jednoduché cesty mezi dvěma uzly (iterativní DFS).
+
+        Cesty se vytváří líně, takže volající může skončit po prvních N bez
+        procházení celého (exponenciálního) prostoru. Větve, ze kterých cíl
+        není dosažitelný, se ořežou podle vzdáleností k cíli spočtených jedním
+        zpětným BFS; s `max_length` se ořežou i větve, kterým na zbývající
+        počet hran nestačí ani nejkratší cesta do cíle.
+
+        Args:
+            start_id (str): Identifikátor počátečního uzlu
+            end_id (str): Identifikátor cílového uzlu
+            max_length (int): Maximální počet hran cesty (None = bez omezení)
+
+        Yields:
+            list: Cesta jako seznam identifikátorů uzlů
+        """
         if start_id not in self.graph.nodes or end_id not in self.graph.nodes:
-            return []
-        
-        paths = []
-        
-        def dfs(current_id, target_id, path, visited):
-            if max_length and len(path) > max_length:
-                return
-            
-            if current_id == target_id:
-                paths.append(path[:])
-                return
-            
-            for edge in self.graph.adj[current_id]:
-                next_id = edge.v.identifier
-                if next_id not in visited:
-                    visited.add(next_id)
-                    path.append(next_id)
-                    dfs(next_id, target_id, path, visited)
-                    path.pop()
-                    visited.remove(next_id)
+            return
         
-        visited = {start_id}
-        dfs(start_id, end_id, [start_id], visited)
-        return paths
+        csr = self.graph.get_csr()
+        offsets, targets, ids = csr.offsets, csr.targets, csr.ids
+        start, end = csr.index_of[start_id], csr.index_of[end_id]
+        if start == end:
+            yield [start_id]
+            return
+
+        to_end = self._hops_to(end)
+        limit = csr.node_count() if max_length is None else max_length
+        if to_end[start] < 0 or to_end[start] > limit:
+            return
+
+        visited = bytearray(csr.node_count())
+        visited[start] = 1
+        path = [start]
+        next_slot = [offsets[start]]  # další nezpracovaná hrana každého uzlu na cestě
+        while next_slot:
+            current = path[-1]
+            slot = next_slot[-1]
+            if slot == offsets[current + 1]:
+                next_slot.pop()
+                visited[path.pop()] = 0
+                continue
+            next_slot[-1] = slot + 1
+            nxt = targets[slot]
+            if visited[nxt]:
+                continue
+            hops = to_end[nxt]
+            # len(path) = počet hran po kroku do nxt
+            if hops < 0 or len(path) + hops > limit:
+                continue
+            if nxt == end:
+                yield [ids[idx] for idx in path] + [end_id]
+                continue
+            visited[nxt] = 1
+            path.append(nxt)
+            next_slot.append(offsets[nxt])
+
+    def _hops_to(self, end):
+        """Počet hran nejkratší cesty z každého uzlu do `end` (-1 = nedosažitelný)."""
+        rev_offsets, rev_sources, _, _ = self.graph.get_csr().get_transpose()
+        hops = [-1] * (len(rev_offsets) - 1)
+        hops[end] = 0
+        queue = deque([end])
+        while queue:
+            current = queue.popleft()
+            level = hops[current] + 1
+            for pos in range(rev_offsets[current], rev_offsets[current + 1]):
+                prev = rev_sources[pos]
+                if hops[prev] < 0:
+                    hops[prev] = level
+                    queue.append(prev)
+        return hops
     
-    def get_shortest_distances(self, start_id):
+    def find_k_shortest_paths(self, start_id, end_id, k):
         """
-        Najde nejkratší vzdálenosti od daného uzlu ke všem ostatním uzlům.
-        
+        Najde k nejkratších jednoduchých cest mezi dvěma uzly (Yenův algoritmus).
+
+        Každá další cesta vznikne odbočením (spur) z některého uzlu už nalezené
+        cesty: kořen cesty až po tento uzel se zachová, jeho uzly se zakážou,
+        stejně jako hrany, kterými z téhož kořene pokračují už přijaté cesty,
+        a zbytek se dohledá Dijkstrou (BFS v neohodnoceném grafu). Odbočuje se
+        jen od místa, kde se cesta odchýlila od své předchůdkyně (Lawlerova
+        úprava) - dřívější odbočky už vygenerovala předchůdkyně. Cena je tak
+        O(k · L) hledání pro cesty délky nejvýše L uzlů, nezávisle na počtu
+        všech jednoduchých cest.
+
         Args:
             start_id (str): Identifikátor počátečního uzlu
+            end_id (str): Identifikátor cílového uzlu
+            k (int): Počet hledaných cest
+
+        Returns:
+            list: Nejvýše k výsledků seřazených podle délky, každý ve tvaru
+                  {'path': [...], 'cost': délka, 'edges': [Edge, ...]}
+        """
+        if k <= 0 or start_id not in self.graph.nodes or end_id not in self.graph.nodes:
+            return []
+
+        csr = self.graph.get_csr()
+        offsets, targets = csr.offsets, csr.targets
+        weights = csr.weights if self.graph.is_weighted else None
+        if self.graph.has_negative_weights:
+            # Převážení posune délku každé cesty start -> end o stejnou konstantu,
+            # pořadí cest se nezmění a spur hledání mohou zůstat Dijkstrou
+            weights = self._johnson_weights()[1]
+        start, end = csr.index_of[start_id], csr.index_of[end_id]
+        n = csr.node_count()
+
+        first = _spur_path(offsets, targets, weights, start, end, bytearray(n), set())
+        if first is None:
+            return []
+        # Přijaté cesty: (délka, uzly, pozice hran, index odbočení)
+        accepted = [(first[2], first[0], first[1], 0)]
+        candidates = []  # halda (délka, pořadí, uzly, pozice hran, index odbočení)
+        seen = {tuple(first[1])}
+        counter = 0
+
+        while len(accepted) < k:
+            _, nodes, slots, deviation = accepted[-1]
+            blocked = bytearray(n)
+            root_cost = 0.0
+            for i in range(deviation):
+                blocked[nodes[i]] = 1
+                root_cost += weights[slots[i]] if weights is not None else 1
+            for i in range(deviation, len(slots)):
+                root = slots[:i]
+                banned = {other[i] for _, _, other, _ in accepted
+                          if len(other) > i and other[:i] == root}
+                spur = _spur_path(offsets, targets, weights, nodes[i], end, blocked, banned)
+                if spur is not None:
+                    spur_nodes, spur_slots, spur_cost = spur
+                    key = tuple(root + spur_slots)
+                    if key not in seen:
+                        seen.add(key)
+                        counter += 1
+                        heapq.heappush(candidates, (root_cost + spur_cost, counter,
+                                                    nodes[:i] + spur_nodes, root + spur_slots, i))
+                blocked[nodes[i]] = 1
+                root_cost += weights[slots[i]] if weights is not None else 1
+            if not candidates:
+                break
+            cost, _, nodes, slots, deviation = heapq.heappop(candidates)
+            accepted.append((cost, nodes, slots, deviation))
+
+        return [self._path_result(nodes, slots) for _, nodes, slots, _ in accepted]
+
+    def count_paths(self, start_id, end_id, max_length=None):
+        """
+        Spočítá cesty z počátečního do cílového uzlu bez jejich výčtu.
+
+        Uvažují se jen uzly, které jsou dosažitelné z počátku a zároveň z nich
+        vede cesta do cíle. Je-li tento podgraf acyklický (vždy u DAG), je každý
+        sled jednoduchou cestou a počet se spočítá dynamickým programováním
+        v topologickém pořadí v O(n + m). S `max_length` se počítají sledy délky
+        nejvýše L po vrstvách v O(L · m); v cyklickém podgrafu jsou to sledy,
+        ne jednoduché cesty. Paralelní hrany se počítají zvlášť, počty jsou
+        přesná celá čísla.
+
+        Args:
+            start_id (str): Identifikátor počátečního uzlu
+            end_id (str): Identifikátor cílového uzlu
+            max_length (int): Maximální počet hran (None = bez omezení)
+
+        Returns:
+            dict: {
+                'count': počet cest (sledů),
+                'simple': True pokud jde o jednoduché cesty (acyklický podgraf),
+                'max_length': použité omezení délky nebo None,
+            }
+
+        Raises:
+            ValueError: Pokud uzel neexistuje nebo je bez `max_length` sledů nekonečně mnoho
+        """
+        for node_id in (start_id, end_id):
+            if node_id not in self.graph.nodes:
+                raise ValueError(f"Uzel '{node_id}' neexistuje v grafu")
+        if max_length is not None and max_length < 0:
+            raise ValueError('max_length musí být >= 0')
+
+        csr = self.graph.get_csr()
+        offsets, targets = csr.offsets, csr.targets
+        start, end = csr.index_of[start_id], csr.index_of[end_id]
+        to_end = self._hops_to(end)
+        result = {'count': 0, 'simple': True, 'max_length': max_length}
+        if to_end[start] < 0:
+            return result
+
+        # Podgraf uzlů na nějaké cestě start -> end a jeho topologické pořadí (Kahn)
+        relevant = [start]
+        in_degree = {start: 0}
+        for u in relevant:
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if to_end[v] < 0:
+                    continue
+                if v not in in_degree:
+                    in_degree[v] = 0
+                    relevant.append(v)
+                in_degree[v] += 1
+        order = [u for u in relevant if in_degree[u] == 0]
+        for u in order:
+            for slot in range(offsets[u], offsets[u + 1]):
+                v = targets[slot]
+                if v in in_degree:
+                    in_degree[v] -= 1
+                    if in_degree[v] == 0:
+                        order.append(v)
+        result['simple'] = len(order) == len(relevant)
+
+        if max_length is None:
+            if not result['simple']:
+                raise ValueError('Cesty vedou přes cyklus, sledů je nekonečně mnoho (zadejte maximální délku)')
+            ways = {start: 1}
+            for u in order:
+                count = ways.get(u, 0)
+                if not count:
+                    continue
+                for slot in range(offsets[u], offsets[u + 1]):
+                    v = targets[slot]
+                    if v in in_degree:
+                        ways[v] = ways.get(v, 0) + count
+            result['count'] = ways.get(end, 0)
+            return result
+
+        # Sledy po vrstvách; uzel se drží jen pokud z něj cíl stihne dosáhnout
+        counts = {start: 1}
+        total = 1 if start == end else 0
+        for step in range(1, max_length + 1):
+            remaining = max_length - step
+            layer = {}
+            for u, count in counts.items():
+                for slot in range(offsets[u], offsets[u + 1]):
+                    v = targets[slot]
+                    if 0 <= to_end[v] <= remaining:
+                        layer[v] = layer.get(v, 0) + count
+            if not layer:
+                break
+            total += layer.get(end, 0)
+            counts = layer
+        result['count'] = total
+        return result
+
+    def get_shortest_distances(self, start_id, mode='nearest'):
+        """
+        Najde nejkratší vzdálenosti od daného uzlu (nebo více uzlů) ke všem ostatním uzlům.
+        
+        Args:
+            start_id (str | iterable): Identifikátor počátečního uzlu nebo kolekce identifikátorů
+            mode (str): Pro více zdrojů 'nearest' (vzdálenost k nejbližšímu zdroji,
+                        jediné hledání, viz `get_nearest_sources`) nebo 'each'
+                        (vzdálenosti z každého zdroje, viz `get_shortest_distances_batch`)
             
         Returns:
-            dict: Slovník vzdáleností {node_id: distance}
+            dict: Slovník vzdáleností {node_id: distance}; pro mode='each' a více
+                  zdrojů {start_id: {node_id: distance}}
         """
+        if not isinstance(start_id, str):
+            if mode == 'each':
+                return self.get_shortest_distances_batch(start_id)
+            if mode != 'nearest':
+                raise ValueError(f"Neznámý režim vzdáleností: {mode}")
+            return self.get_nearest_sources(start_id)['distances']
+
         if start_id not in self.graph.nodes:
             return {}
         
         if not self.graph.is_weighted:
             return self._bfs_distances(start_id)
+        elif self.graph.has_negative_weights:
+            return self._spfa_distances(start_id)
         else:
             return self._dijkstra_distances(start_id)
     
     def _bfs_distances(self, start_id):
         """BFS pro výpočet vzdáleností v neohodnoceném grafu."""
-        distances = {start_id: 0}
-        queue = deque([start_id])
+        csr = self.graph.get_csr()
+        offsets, targets = csr.offsets, csr.targets
+        start = csr.index_of[start_id]
+        if self.use_numpy and csr.node_count() >= self.FRONTIER_MIN_NODES:
+            np = get_numpy()
+            dist = self._frontier_engine().run(start)['distances']
+            # Dosažené uzly po úrovních (v rámci úrovně podle indexu)
+            reached = np.flatnonzero(dist >= 0)
+            order = reached[np.argsort(dist[reached], kind='stable')]
+            ids = csr.ids
+            return dict(zip([ids[idx] for idx in order.tolist()], dist[order].tolist()))
+        dist = [-1] * csr.node_count()
+        dist[start] = 0
+        order = [start]
+        queue = deque([start])
         
         while queue:
-            current_id = queue.popleft()
+            current = queue.popleft()
+            next_dist = dist[current] + 1
             
-            for edge in self.graph.adj[current_id]:
-                next_id = edge.v.identifier
-                if next_id not in distances:
-                    distances[next_id] = distances[current_id] + 1
-                    queue.append(next_id)
+            for slot in range(offsets[current], offsets[current + 1]):
+                nxt = targets[slot]
+                if dist[nxt] < 0:
+                    dist[nxt] = next_dist
+                    order.append(nxt)
+                    queue.append(nxt)
         
-        return distances
+        # Slovník v pořadí objevení uzlů (stejně jako dříve)
+        ids = csr.ids
+        return {ids[idx]: dist[idx] for idx in order}
+
+    def get_nearest_sources(self, start_ids):
+        """
+        Přiřadí každému uzlu nejbližší ze zdrojů a vzdálenost k němu (Voronoiovo dělení).
+
+        Všechny zdroje startují najednou se vzdáleností 0 a každý uzel převezme
+        značku zdroje od uzlu, přes který byl dosažen, takže stačí jediné BFS
+        (neohodnocený graf), Dijkstra, nebo SPFA (záporné váhy) bez ohledu na
+        počet zdrojů.
+
+        Args:
+            start_ids (iterable): Identifikátory zdrojů (neexistující se ignorují)
+
+        Returns:
+            dict: {
+                'distances': {node_id: vzdálenost k nejbližšímu zdroji} (stejný
+                             formát jako `get_shortest_distances` pro jeden zdroj),
+                'sources': {node_id: nejbližší zdroj} jen pro dosažitelné uzly,
+            }
+
+        Raises:
+            NegativeCycleError: Pokud je ze zdrojů dosažitelný záporný cyklus
+        """
+        csr = self.graph.get_csr()
+        sources = [csr.index_of[start_id] for start_id in dict.fromkeys(start_ids)
+                   if start_id in self.graph.nodes]
+        ids = csr.ids
+        if not sources:
+            return {'distances': {}, 'sources': {}}
+
+        if not self.graph.is_weighted:
+            dist, label, order = _nearest_bfs(csr.offsets, csr.targets, sources)
+            return {'distances': {ids[idx]: dist[idx] for idx in order},
+                    'sources': {ids[idx]: ids[label[idx]] for idx in order}}
+
+        if self.graph.has_negative_weights:
+            dist, parent, _ = self._spfa(sources)
+            label = _parent_labels(csr.offsets, parent, dist)
+        else:
+            dist, label = _nearest_dijkstra(csr.offsets, csr.targets, csr.weights, sources)
+        return {'distances': {node_id: dist[idx] for idx, node_id in enumerate(ids)},
+                'sources': {ids[idx]: ids[label[idx]] for idx in range(len(ids)) if label[idx] >= 0}}
+
+    def _frontier_engine(self):
+        """Vrátí (cachované) směrově optimalizované BFS nad CSR aktuálního grafu."""
+        version = self.graph.get_version()
+        if self._frontier is None or self._frontier[0] != version:
+            self._frontier = (version, FrontierBFS.from_csr(self.graph.get_csr()))
+        return self._frontier[1]
+
+    def _bitset_engine(self):
+        """Vrátí bitově paralelní BFS nad CSR aktuálního grafu."""
+        csr = self.graph.get_csr()
+        return BitsetBFS(csr.offsets, csr.targets, use_numpy=self.use_numpy)
+
+    def get_shortest_distances_batch(self, start_ids):
+        """
+        Najde nejkratší vzdálenosti z více uzlů najednou.
+
+        V neohodnoceném grafu se všechny zdroje zpracují bitově paralelním BFS
+        (jeden průchod hran na úroveň pro každou dávku zdrojů), v ohodnoceném
+        se pro každý zdroj spustí Dijkstra se společně připravenou prioritní
+        frontou (a u záporných vah společnými Johnsonovými potenciály).
+
+        Args:
+            start_ids (iterable): Identifikátory počátečních uzlů
+
+        Returns:
+            dict: {start_id: {node_id: distance}} jen pro dosažitelné uzly;
+                  neexistující uzel má prázdný slovník
+        """
+        start_ids = list(start_ids)
+        if self.graph.is_weighted:
+            distances = self._dijkstra_distances
+            if self.graph.has_negative_weights:
+                try:
+                    self._johnson_weights()
+                except NegativeCycleError:
+                    # Cyklus nemusí být ze zdrojů dosažitelný - každý zdroj zvlášť přes SPFA
+                    distances = self._spfa_distances
+            return {start_id: distances(start_id) if start_id in self.graph.nodes else {}
+                    for start_id in start_ids}
+
+        csr = self.graph.get_csr()
+        known = [start_id for start_id in start_ids if start_id in self.graph.nodes]
+        rows = self._bitset_engine().run([csr.index_of[s] for s in known], rows=True)['rows']
+        result = {start_id: {} for start_id in start_ids}
+        ids = csr.ids
+        for start_id, row in zip(known, rows):
+            result[start_id] = {ids[idx]: d for idx, d in enumerate(row) if d >= 0}
+        return result
+
+    def get_distance_statistics(self, start_ids=None):
+        """
+        Spočítá excentricity, closeness a histogram vzdáleností pro více zdrojů.
+
+        V neohodnoceném grafu se vše získá z počtů uzlů v jednotlivých úrovních
+        bitově paralelního BFS (bez rozbalování jednotlivých vzdáleností),
+        v ohodnoceném z Dijkstry z každého zdroje.
+
+        Args:
+            start_ids (iterable): Identifikátory zdrojů (None = všechny uzly)
+
+        Returns:
+            dict: {
+                'eccentricities': {id: excentricita} (inf = některý uzel je nedosažitelný),
+                'closeness': {id: (dosažené uzly - 1) / součet vzdáleností},
+                'histogram': {vzdálenost: počet dvojic (zdroj, uzel)}, bez nulových vzdáleností,
+                'average_distance': průměrná vzdálenost dosažitelných dvojic,
+                'engine': 'bitset-numpy' | 'bitset' | 'dijkstra-<prioritní fronta>',
+                'sweeps': počet průchodů grafem,
+            }
+        """
+        csr = self.graph.get_csr()
+        n = csr.node_count()
+        if start_ids is None:
+            start_ids = csr.ids
+        start_ids = [start_id for start_id in start_ids if start_id in self.graph.nodes]
+        sources = [csr.index_of[start_id] for start_id in start_ids]
+
+        if self.graph.is_weighted:
+            INF = float('inf')
+            eccentricity, reached, distance_sum = [], [], []
+            histogram = {}
+            for source in sources:
+                row = [d for d in self._weighted_row(source) if d != INF]
+                eccentricity.append(max(row))
+                reached.append(len(row))
+                distance_sum.append(sum(row))
+                for d in row:
+                    if d:
+                        histogram[d] = histogram.get(d, 0) + 1
+            engine, sweeps = f"dijkstra-{self.get_queue_engine()}", len(sources)
+        else:
+            bfs = self._bitset_engine()
+            stats = bfs.run(sources)
+            eccentricity, reached, distance_sum = stats['eccentricity'], stats['reached'], stats['distance_sum']
+            histogram = {d: count for d, count in enumerate(stats['histogram']) if d and count}
+            engine = 'bitset-numpy' if bfs.use_numpy else 'bitset'
+            sweeps = stats['sweeps']
+
+        pairs = sum(histogram.values())
+        return {
+            'eccentricities': {start_id: float(ecc) if r == n else float('inf')
+                               for start_id, ecc, r in zip(start_ids, eccentricity, reached)},
+            'closeness': {start_id: (r - 1) / total if total else 0.0
+                          for start_id, r, total in zip(start_ids, reached, distance_sum)},
+            'histogram': dict(sorted(histogram.items())),
+            'average_distance': sum(d * count for d, count in histogram.items()) / pairs if pairs else 0.0,
+            'engine': engine,
+            'sweeps': sweeps,
+        }
+
+    def get_approximate_distances(self, registers=None, max_steps=None, quantile=0.9, seed=0):
+        """
+        Odhadne rozložení vzdáleností (v počtu hran) pomocí HyperANF.
+
+        Funkce okolí N(t) je počet dvojic (x, y) s d(x, y) <= t včetně dvojic
+        (x, x). Z ní se odvodí efektivní průměr (nejmenší t, pro které
+        N(t) dosáhne `quantile` všech dosažitelných dvojic, lineárně
+        interpolováno mezi kroky), průměrná vzdálenost dosažitelných dvojic
+        (bez nulových vzdáleností, jako `get_distance_statistics`) a dolní
+        mez průměru grafu. Váhy hran se ignorují.
+
+        Args:
+            registers (int): Počet registrů čítače, mocnina dvou 16..65536
+                             (None = HyperANF.REGISTERS); chyba ~ 1.04 / sqrt(registers)
+            max_steps (int): Nejvyšší počet průchodů (None = do ustálení čítačů)
+            quantile (float): Podíl dvojic pro efektivní průměr
+            seed (int): Semínko hashe uzlů
+
+        Returns:
+            dict: {
+                'neighborhood': {t: odhad N(t)},
+                'reachable_pairs': odhad počtu dosažitelných dvojic (x, y), x != y,
+                'average_distance': odhad průměrné vzdálenosti,
+                'effective_diameter': odhad efektivního průměru,
+                'diameter_lower_bound': počet průchodů se změnou čítače (přesná dolní mez
+                                        průměru v počtu hran, není-li omezen max_steps),
+                'converged': zda se čítače ustálily,
+                'registers': počet registrů,
+                'relative_error': relativní směrodatná chyba jednoho čítače,
+                'engine': 'hyperanf-numpy' | 'hyperanf',
+            }
+
+        Raises:
+            ValueError: Pokud počet registrů není mocnina dvou v povoleném rozsahu
+        """
+        csr = self.graph.get_csr()
+        anf = HyperANF(csr.offsets, csr.targets, registers, use_numpy=self.use_numpy, seed=seed)
+        result = anf.run(max_steps)
+        neighborhood = result['neighborhood']
+        total = neighborhood[-1]
+        pairs = total - neighborhood[0]
+
+        effective = 0.0
+        target = quantile * total
+        for t in range(1, len(neighborhood)):
+            if neighborhood[t] >= target:
+                below = neighborhood[t - 1]
+                effective = t - 1 + (target - below) / (neighborhood[t] - below) if target > below else t - 1
+                break
+        average = sum(t * (neighborhood[t] - neighborhood[t - 1])
+                      for t in range(1, len(neighborhood))) / pairs if pairs > 0 else 0.0
+
+        return {
+            'neighborhood': dict(enumerate(neighborhood)),
+            'reachable_pairs': pairs,
+            'average_distance': average,
+            'effective_diameter': float(effective),
+            'diameter_lower_bound': result['iterations'],
+            'converged': result['converged'],
+            'registers': anf.registers,
+            'relative_error': anf.relative_error(),
+            'engine': 'hyperanf-numpy' if anf.use_numpy else 'hyperanf',
+        }
     
     def _dijkstra_distances(self, start_id):
         """Dijkstra pro výpočet vzdáleností v ohodnoceném grafu."""
-        distances = {node_id: float('inf') for node_id in self.graph.nodes}
-        distances[start_id] = 0
-        # Use float distances in the priority queue
-        pq: List[Tuple[float, str]] = [(0.0, start_id)]
-        
-        while pq:
-            current_dist, current_id = heapq.heappop(pq)
-            
-            if current_dist > distances[current_id]:
-                continue
-            
-            for edge in self.graph.adj[current_id]:
-                next_id = edge.v.identifier
-                weight = edge.weight if edge.weight is not None else 1
-                if isinstance(weight, (int, float)):
-                    distance = current_dist + weight
-                    
-                    if distance < distances[next_id]:
-                        distances[next_id] = distance
-                        heapq.heappush(pq, (distance, next_id))
-        
-        return distances
+        csr = self.graph.get_csr()
+        dist = self._weighted_row(csr.index_of[start_id])
+        index_of = csr.index_of
+        return {node_id: dist[index_of[node_id]] for node_id in self.graph.nodes}
+
+    def _spfa_distances(self, start_id):
+        """SPFA pro výpočet vzdáleností v grafu se zápornými váhami."""
+        csr = self.graph.get_csr()
+        dist, _, _ = self._spfa((csr.index_of[start_id],))
+        index_of = csr.index_of
+        return {node_id: dist[index_of[node_id]] for node_id in self.graph.nodes}
+
+    def get_all_distances(self, jobs=1):
+        """
+        Spočítá matici nejkratších vzdáleností mezi všemi dvojicemi uzlů.
+
+        Z každého uzlu se spustí Dijkstra s haldou (ohodnocený graf) nad CSR,
+        celkem O(n·(n + m) log n) místo O(n³) Floyd–Warshalla; neohodnocený graf
+        se prochází bitově paralelním BFS po dávkách zdrojů. Pro jobs > 1 se
+        zdroje rozdělí do bloků, které počítá `ProcessPoolExecutor`; CSR se do
+        procesů předá jednou při jejich startu.
+        Záporné váhy se nejdřív Johnsonovým převážením převedou na nezáporné
+        (jedno SPFA) a vzdálenosti se po Dijkstrách opraví zpět.
+
+        Args:
+            jobs (int): Počet procesů (1 = výpočet v aktuálním procesu)
+
+        Returns:
+            DistanceMatrix: Kompaktní matice vzdáleností v pořadí `Graph.get_node_list()`
+
+        Raises:
+            NegativeCycleError: Pokud graf obsahuje záporný cyklus
+        """
+        csr = self.graph.get_csr()
+        n = csr.node_count()
+        weighted = self.graph.is_weighted
+        weights = csr.weights if weighted else None
+        potential = None
+        if self.graph.has_negative_weights:
+            potential, weights = self._johnson_weights()
+        engine = self.get_queue_engine() if weighted else None
+
+        if jobs <= 1 or n < self.PARALLEL_MIN_SOURCES:
+            data = _distance_block(csr.offsets, csr.targets, weights, 0, n, self.use_numpy, engine)
+        else:
+            typecode = DistanceMatrix.typecode_for(weighted)
+            data = array(typecode, [0]) * (n * n)
+            chunk = -(-n // (jobs * self.CHUNKS_PER_JOB))
+            tasks = [(start, min(start + chunk, n)) for start in range(0, n, chunk)]
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_distance_worker,
+                                     initargs=(csr.offsets, csr.targets, weights, engine)) as executor:
+                for start, block in executor.map(_distance_rows, tasks):
+                    data[start * n:start * n + len(block)] = block
+
+        if potential is not None:
+            INF = float('inf')
+            for u in range(n):
+                h = potential[u]
+                row = u * n
+                for v in range(n):
+                    d = data[row + v]
+                    if d != INF:
+                        data[row + v] = d - h + potential[v]
+        return DistanceMatrix(csr.ids, data, weighted, index_of=csr.index_of)
     
+    def _eccentricity_cache(self):
+        """Vrátí cache excentricit, při změně verze grafu ji vyprázdní."""
+        version = self.graph.get_version()
+        if self._ecc_version != version:
+            self._ecc_version = version
+            self._ecc_cache = {}
+            self._ecc_disconnected = False
+        return self._ecc_cache
+
     def get_node_eccentricity(self, node_id) -> float:
         """
         Vypočítá excentricitu uzlu (maximální vzdálenost k jakémukoli jinému uzlu).
@@ -204,22 +1037,203 @@ class PathAnalyzer:
             # For consistency return infinity when node is not present
             return float('inf')
 
-        distances: Mapping[str, float | int] = self.get_shortest_distances(node_id)
-        max_distance: float = 0.0
+        cache = self._eccentricity_cache()
+        eccentricity = cache.get(node_id)
+        if eccentricity is None:
+            eccentricity = cache[node_id] = self._compute_eccentricity(node_id)
+            if eccentricity == float('inf'):
+                self._ecc_disconnected = True
+        return eccentricity
+
+    def _compute_eccentricity(self, node_id) -> float:
+        """Spočítá excentricitu uzlu jedním BFS/Dijkstrou (bez cache)."""
+        if self.graph.has_negative_weights:
+            # Excentricity mnoha uzlů: Dijkstra nad Johnsonovými vahami místo SPFA z každého
+            distances: Mapping[str, float | int] = self._dijkstra_distances(node_id)
+        else:
+            distances = self.get_shortest_distances(node_id)
+        if len(distances) < len(self.graph.nodes):
+            return float('inf')  # BFS nedosáhl všech uzlů - graf není souvislý
 
-        for other_id in self.graph.nodes:
+        max_distance: float = 0.0
+        for other_id, d in distances.items():
             if other_id != node_id:
-                if other_id in distances:
-                    d = distances[other_id]
-                    # ensure d is a float (distance functions use numeric values)
-                    if d is None:
-                        return float('inf')
-                    max_distance = max(max_distance, float(d))
-                else:
-                    return float('inf')  # Not connected
+                # ensure d is a float (distance functions use numeric values)
+                if d is None:
+                    return float('inf')
+                max_distance = max(max_distance, float(d))
 
         return max_distance
-    
+
+    def get_eccentricities(self):
+        """
+        Vrátí excentricity všech uzlů.
+
+        Každá excentricita se počítá nejvýše jednou pro danou verzi grafu.
+        Výpočet končí u prvního uzlu s nekonečnou excentricitou, protože pak
+        jsou průměr i poloměr nekonečné a centrum prázdné.
+
+        Returns:
+            dict: {node_id: excentricita} nebo None pokud graf není souvislý
+        """
+        cache = self._eccentricity_cache()
+        if not self.graph.is_weighted:
+            self._fill_eccentricities_bitset(cache)
+        for node_id in self.graph.nodes:
+            if self._ecc_disconnected or self.get_node_eccentricity(node_id) == float('inf'):
+                return None
+        return {node_id: cache[node_id] for node_id in self.graph.nodes}
+
+    def _fill_eccentricities_bitset(self, cache):
+        """Doplní chybějící excentricity neohodnoceného grafu po dávkách bitového BFS."""
+        csr = self.graph.get_csr()
+        n = csr.node_count()
+        missing = [csr.index_of[node_id] for node_id in self.graph.nodes if node_id not in cache]
+        bfs = self._bitset_engine()
+        for start in range(0, len(missing), bfs.batch_size):
+            if self._ecc_disconnected:
+                return
+            batch = missing[start:start + bfs.batch_size]
+            stats = bfs.run(batch)
+            for source, ecc, reached in zip(batch, stats['eccentricity'], stats['reached']):
+                if reached < n:
+                    cache[csr.ids[source]] = float('inf')
+                    self._ecc_disconnected = True
+                else:
+                    cache[csr.ids[source]] = float(ecc)
+
+    def get_eccentricity_summary(self):
+        """
+        Spočítá průměr, poloměr, centrum i periferii v jediném průchodu.
+
+        Returns:
+            dict: {'eccentricities', 'diameter', 'radius', 'center', 'periphery'};
+                  pro nesouvislý graf je průměr i poloměr inf a centrum i periferie prázdné
+        """
+        eccentricities = self.get_eccentricities()
+        if eccentricities is None:
+            return {'eccentricities': None, 'diameter': float('inf'), 'radius': float('inf'),
+                    'center': [], 'periphery': []}
+
+        diameter = max(eccentricities.values(), default=0.0)
+        radius = min(eccentricities.values(), default=float('inf'))
+        return {
+            'eccentricities': eccentricities,
+            'diameter': diameter,
+            'radius': radius,
+            'center': [node_id for node_id, ecc in eccentricities.items() if ecc == radius],
+            'periphery': [node_id for node_id, ecc in eccentricities.items() if ecc == diameter],
+        }
+
+    def get_diameter_radius(self):
+        """
+        Spočítá přesný průměr a poloměr omezováním excentricit (Takes–Kosters).
+
+        Každý uzel má dolní a horní mez excentricity. Po prohledání ze zdroje v
+        se meze všech kandidátů zpřesní podle trojúhelníkové nerovnosti
+        (max(d(w,v), ecc(v) - d(v,w)) ≤ ecc(w) ≤ d(w,v) + ecc(v)) a kandidáti,
+        jejichž meze už průměr ani poloměr nezmění, se vyřadí. Zdroje se
+        vybírají střídavě s největší horní a nejmenší dolní mezí (shody
+        rozhoduje stupeň). U orientovaných grafů se ze zdroje hledá dopředu
+        i pozpátku (nad `CSRGraph.get_transpose()`). Záporné váhy se převáží
+        Johnsonovými potenciály (meze platí pro libovolné vzdálenosti bez
+        záporného cyklu). Spočítané excentricity se ukládají do cache.
+
+        Returns:
+            dict: {'diameter', 'radius', 'searches'} - 'searches' je počet
+                  provedených BFS/Dijkstrů; pro nesouvislý graf je průměr i poloměr inf
+        """
+        csr = self.graph.get_csr()
+        n = csr.node_count()
+        weighted = self.graph.is_weighted
+        weights = csr.weights if weighted else None
+        INF = float('inf')
+        if n == 0:
+            return {'diameter': 0.0, 'radius': INF, 'searches': 0}
+
+        cache = self._eccentricity_cache()
+        if self._ecc_disconnected:
+            return {'diameter': INF, 'radius': INF, 'searches': 0}
+
+        potential = None
+        if self.graph.has_negative_weights:
+            potential, weights = self._johnson_weights()
+        offsets, targets, ids = csr.offsets, csr.targets, csr.ids
+        if csr.is_directed:
+            rev_offsets, rev_targets, rev_weights, rev_slots = csr.get_transpose()
+            if not weighted:
+                rev_weights = None
+            elif potential is not None:
+                rev_weights = array('d', (weights[slot] for slot in rev_slots))
+
+        forward_run = backward_run = None
+        if weighted:
+            engine = self.get_queue_engine()
+            forward_run = backward_run = _row_runner(offsets, targets, weights, engine)
+            if csr.is_directed:
+                backward_run = _row_runner(rev_offsets, rev_targets, rev_weights, engine)
+
+        def search(off, tgt, run, source, backward=False):
+            if run is None:
+                return [INF if d < 0 else d for d in _bfs_row(off, tgt, source)]
+            row = run(source)
+            if potential is None:
+                return row
+            # d'(s, x) = d(s, x) + h(s) - h(x); pozpátku d'(x, s) = d(x, s) + h(x) - h(s)
+            sign = -1 if backward else 1
+            h = potential[source]
+            return [d - sign * (h - potential[x]) if d != INF else INF for x, d in enumerate(row)]
+
+        lower = [0.0] * n
+        upper = [INF] * n
+        degree = [offsets[i + 1] - offsets[i] for i in range(n)]
+        candidates = set(range(n))
+        diameter_low = 0.0   # největší známá excentricita
+        radius_up = INF      # nejmenší známá excentricita
+        searches = 0
+        pick_upper = True
+
+        while candidates:
+            if pick_upper:
+                v = max(candidates, key=lambda w: (upper[w], degree[w]))
+            else:
+                v = min(candidates, key=lambda w: (lower[w], -degree[w]))
+            pick_upper = not pick_upper
+
+            forward = search(offsets, targets, forward_run, v)
+            searches += 1
+            if csr.is_directed:
+                backward = search(rev_offsets, rev_targets, backward_run, v, backward=True)
+                searches += 1
+            else:
+                backward = forward
+            ecc_v = float(max(forward))
+            if ecc_v == INF or (backward is not forward and max(backward) == INF):
+                # Některý uzel nedosáhne na jiný - graf není (silně) souvislý
+                self._ecc_disconnected = True
+                if ecc_v == INF:
+                    cache[ids[v]] = INF
+                return {'diameter': INF, 'radius': INF, 'searches': searches}
+
+            cache[ids[v]] = ecc_v
+            lower[v] = upper[v] = ecc_v
+            diameter_low = max(diameter_low, ecc_v)
+            radius_up = min(radius_up, ecc_v)
+
+            for w in candidates:
+                if w != v:
+                    d_wv = backward[w]
+                    lower[w] = max(lower[w], d_wv, ecc_v - forward[w])
+                    upper[w] = min(upper[w], d_wv + ecc_v)
+                    if lower[w] == upper[w]:
+                        diameter_low = max(diameter_low, lower[w])
+                        radius_up = min(radius_up, upper[w])
+                        cache[ids[w]] = float(lower[w])
+            candidates = {w for w in candidates
+                          if lower[w] != upper[w] and (upper[w] > diameter_low or lower[w] < radius_up)}
+
+        return {'diameter': diameter_low, 'radius': radius_up, 'searches': searches}
+
     def get_graph_diameter(self):
         """
         Vypočítá průměr grafu (maximální excentricita).
@@ -227,14 +1241,7 @@ class PathAnalyzer:
         Returns:
             float: Průměr grafu
         """
-        max_eccentricity = 0.0
-        for node_id in self.graph.nodes:
-            eccentricity = self.get_node_eccentricity(node_id)
-            if eccentricity == float('inf'):
-                return float('inf')
-            max_eccentricity = max(max_eccentricity, eccentricity)
-        
-        return max_eccentricity
+        return self.get_diameter_radius()['diameter']
     
     def get_graph_radius(self):
         """
@@ -243,14 +1250,7 @@ class PathAnalyzer:
         Returns:
             float: Poloměr grafu
         """
-        min_eccentricity = float('inf')
-        for node_id in self.graph.nodes:
-            eccentricity = self.get_node_eccentricity(node_id)
-            if eccentricity == float('inf'):
-                return float('inf')
-            min_eccentricity = min(min_eccentricity, eccentricity)
-        
-        return min_eccentricity
+        return self.get_diameter_radius()['radius']
     
     def find_center_nodes(self):
         """
@@ -259,13 +1259,522 @@ class PathAnalyzer:
         Returns:
             list: Seznam identifikátorů centrálních uzlů
         """
-        radius = self.get_graph_radius()
-        if radius == float('inf'):
-            return []
-        
-        center_nodes = []
-        for node_id in self.graph.nodes:
-            if self.get_node_eccentricity(node_id) == radius:
-                center_nodes.append(node_id)
+        return self.get_eccentricity_summary()['center']
+
+    def find_periphery_nodes(self):
+        """
+        Najde periferní uzly grafu (uzly s maximální excentricitou).
         
-        return center_nodes
+        Returns:
+            list: Seznam identifikátorů periferních uzlů
+        """
+        return self.get_eccentricity_summary()['periphery']
+
+
+def _join_chains(forward, backward, meet):
+    """
+    Spojí řetězy předchůdců obou hledání v uzlu setkání.
+
+    Args:
+        forward (dict): uzel -> (předchůdce, pozice hrany předchůdce -> uzel, ...) z hledání od počátku
+        backward (dict): uzel -> (následník, pozice hrany uzel -> následník, ...) z hledání od cíle
+        meet (int): Uzel setkání
+
+    Returns:
+        tuple: (indexy uzlů na cestě, pozice hran v dopředném CSR)
+    """
+    nodes = [meet]
+    slots = []
+    link = forward[meet]
+    while link is not None:
+        prev, slot = link[0], link[1]
+        nodes.append(prev)
+        slots.append(slot)
+        link = forward[prev]
+    nodes.reverse()
+    slots.reverse()
+    link = backward[meet]
+    while link is not None:
+        nxt, slot = link[0], link[1]
+        nodes.append(nxt)
+        slots.append(slot)
+        link = backward[nxt]
+    # Pozice hrany patří uzlu, ze kterého hrana vychází (nodes[i] -> nodes[i + 1])
+    return nodes, slots
+
+
+def _spur_path(offsets, targets, weights, source, target, blocked, banned):
+    """
+    Nejkratší cesta source -> target mimo zakázané uzly a pozice hran (pro Yena).
+
+    Args:
+        weights (array): Váhy hran CSR, None = neohodnocený graf (BFS)
+        blocked (bytearray): 1 = uzel nesmí být na cestě
+        banned (set): Pozice hran v CSR, které se nesmí použít
+
+    Returns:
+        tuple: (indexy uzlů, pozice hran, délka) nebo None pokud cesta neexistuje
+    """
+    parent = {source: None}  # uzel -> (předchůdce, pozice hrany)
+    if weights is None:
+        dist = {source: 0}
+        queue = deque([source])
+        while queue and target not in parent:
+            current = queue.popleft()
+            for slot in range(offsets[current], offsets[current + 1]):
+                nxt = targets[slot]
+                if nxt in parent or blocked[nxt] or slot in banned:
+                    continue
+                parent[nxt] = (current, slot)
+                dist[nxt] = dist[current] + 1
+                queue.append(nxt)
+    else:
+        INF = float('inf')
+        dist = {source: 0.0}
+        pq = [(0.0, source)]
+        while pq:
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > dist[current]:
+                continue
+            if current == target:
+                break
+            for slot in range(offsets[current], offsets[current + 1]):
+                weight = weights[slot]
+                if weight != weight or slot in banned:  # NaN = nečíselná váha
+                    continue
+                nxt = targets[slot]
+                if blocked[nxt]:
+                    continue
+                distance = current_dist + weight
+                if distance < dist.get(nxt, INF):
+                    dist[nxt] = distance
+                    parent[nxt] = (current, slot)
+                    heapq.heappush(pq, (distance, nxt))
+
+    if target not in parent:
+        return None
+    nodes, slots = [target], []
+    node = target
+    while parent[node] is not None:
+        node, slot = parent[node]
+        nodes.append(node)
+        slots.append(slot)
+    nodes.reverse()
+    slots.reverse()
+    return nodes, slots, dist[target]
+
+
+def _nearest_bfs(offsets, targets, sources):
+    """BFS ze všech zdrojů najednou; vrátí (vzdálenosti, značky zdrojů, pořadí objevení)."""
+    n = len(offsets) - 1
+    dist = [-1] * n
+    label = [-1] * n
+    order = []
+    for source in sources:
+        dist[source] = 0
+        label[source] = source
+        order.append(source)
+    queue = deque(order)
+    while queue:
+        current = queue.popleft()
+        next_dist = dist[current] + 1
+        current_label = label[current]
+        for slot in range(offsets[current], offsets[current + 1]):
+            nxt = targets[slot]
+            if dist[nxt] < 0:
+                dist[nxt] = next_dist
+                label[nxt] = current_label
+                order.append(nxt)
+                queue.append(nxt)
+    return dist, label, order
+
+
+def _nearest_dijkstra(offsets, targets, weights, sources):
+    """Dijkstra ze všech zdrojů najednou; vrátí (vzdálenosti, značky zdrojů nebo -1)."""
+    n = len(offsets) - 1
+    INF = float('inf')
+    dist = [INF] * n
+    label = [-1] * n
+    for source in sources:
+        dist[source] = 0
+        label[source] = source
+    pq = [(0.0, source) for source in sources]
+    heapq.heapify(pq)
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+        if current_dist > dist[current]:
+            continue
+        current_label = label[current]
+        for slot in range(offsets[current], offsets[current + 1]):
+            weight = weights[slot]
+            if weight != weight:  # NaN = nečíselná váha
+                continue
+            nxt = targets[slot]
+            distance = current_dist + weight
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                label[nxt] = current_label
+                heapq.heappush(pq, (distance, nxt))
+    return dist, label
+
+
+def _parent_labels(offsets, parent, dist):
+    """Značky zdrojů z lesa předchůdců (kořen = zdroj); -1 pro nedosažitelné uzly."""
+    n = len(parent)
+    label = [-1] * n
+    for node in range(n):
+        if label[node] >= 0 or dist[node] == float('inf'):
+            continue
+        chain = []
+        current = node
+        while label[current] < 0 and parent[current] >= 0:
+            chain.append(current)
+            current = _slot_source(offsets, parent[current])
+        root = label[current] if label[current] >= 0 else current
+        label[current] = root
+        for member in chain:
+            label[member] = root
+    return label
+
+
+def _spfa(offsets, targets, weights, sources):
+    """
+    SPFA (Bellman–Ford s frontou) nad CSR z jednoho či více zdrojů (vzdálenost 0).
+
+    Uzel se znovu zařadí do fronty jen při zlepšení vzdálenosti, takže výpočet
+    skončí, jakmile se nic nezmění (typicky po zlomku V·E relaxací). Každý
+    uzel si pamatuje počet hran své aktuální cesty; dosáhne-li n, obsahuje
+    graf předchůdců cyklus, který je záporný a vrátí se jako svědek.
+
+    Returns:
+        tuple: (vzdálenosti, pozice hrany do uzlu nebo -1, počet zpracování
+               uzlů, pozice hran záporného cyklu nebo None)
+    """
+    n = len(offsets) - 1
+    INF = float('inf')
+    dist = [INF] * n
+    parent = [-1] * n
+    length = [0] * n
+    in_queue = bytearray(n)
+    queue = deque()
+    for source in sources:
+        if not in_queue[source]:
+            dist[source] = 0.0
+            in_queue[source] = 1
+            queue.append(source)
+    pops = 0
+
+    while queue:
+        current = queue.popleft()
+        in_queue[current] = 0
+        pops += 1
+        current_dist = dist[current]
+        for slot in range(offsets[current], offsets[current + 1]):
+            weight = weights[slot]
+            if weight != weight:  # NaN = nečíselná váha
+                continue
+            nxt = targets[slot]
+            distance = current_dist + weight
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                parent[nxt] = slot
+                length[nxt] = length[current] + 1
+                if length[nxt] >= n:
+                    cycle = _parent_cycle(offsets, parent, nxt)
+                    if cycle is not None:
+                        return dist, parent, pops, cycle
+                if not in_queue[nxt]:
+                    in_queue[nxt] = 1
+                    queue.append(nxt)
+
+    return dist, parent, pops, None
+
+
+def _parent_cycle(offsets, parent, node):
+    """Najde cyklus v grafu předchůdců nad uzlem; vrátí pozice jeho hran ve směru cyklu."""
+    seen = set()
+    while node not in seen:
+        seen.add(node)
+        if parent[node] < 0:
+            return None
+        node = _slot_source(offsets, parent[node])
+    cycle = []
+    current = node
+    while True:
+        cycle.append(parent[current])
+        current = _slot_source(offsets, parent[current])
+        if current == node:
+            break
+    cycle.reverse()
+    return cycle
+
+
+def _slot_source(offsets, slot):
+    """Počáteční uzel hrany na pozici `slot` (binární hledání v offsets)."""
+    return bisect_right(offsets, slot) - 1
+
+
+def _bfs_row(offsets, targets, source):
+    """BFS z jednoho zdroje nad CSR; vrátí seznam vzdáleností (-1 = nedosažitelný)."""
+    dist = [-1] * (len(offsets) - 1)
+    dist[source] = 0
+    queue = [source]
+    head = 0
+    while head < len(queue):
+        current = queue[head]
+        head += 1
+        next_dist = dist[current] + 1
+        for slot in range(offsets[current], offsets[current + 1]):
+            nxt = targets[slot]
+            if dist[nxt] < 0:
+                dist[nxt] = next_dist
+                queue.append(nxt)
+    return dist
+
+
+def _dijkstra_row(offsets, targets, weights, source):
+    """Dijkstra s haldou z jednoho zdroje nad CSR; vrátí seznam vzdáleností (inf = nedosažitelný)."""
+    INF = float('inf')
+    dist = [INF] * (len(offsets) - 1)
+    dist[source] = 0
+    # Use float distances in the priority queue
+    pq: List[Tuple[float, int]] = [(0.0, source)]
+
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+
+        if current_dist > dist[current]:
+            continue
+
+        for slot in range(offsets[current], offsets[current + 1]):
+            weight = weights[slot]
+            if weight != weight:  # NaN = nečíselná váha
+                continue
+            nxt = targets[slot]
+            distance = current_dist + weight
+
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                heapq.heappush(pq, (distance, nxt))
+
+    return dist
+
+
+def _select_queue_engine(weights, dial_max_weight):
+    """
+    Vybere prioritní frontu Dijkstry podle jednoho průchodu sloupcem vah.
+
+    Radix halda se automaticky nevybírá: v CPythonu je pro velké rozsahy
+    vah pomalejší než `heapq` (implementovaná v C), viz
+    benchmarks/bench_queue_engines.py.
+    """
+    max_weight = 0
+    for weight in weights:
+        if weight != weight:  # NaN = nečíselná váha, hrana se při hledání přeskočí
+            continue
+        if weight < 0 or not weight.is_integer():
+            return 'heap'
+        if weight > max_weight:
+            max_weight = weight
+    if max_weight <= 1:
+        return 'zero-one'
+    if max_weight <= dial_max_weight:
+        return 'dial'
+    return 'heap'
+
+
+def _row_runner(offsets, targets, weights, engine):
+    """
+    Vrátí funkci index zdroje -> řádek vzdáleností (float, inf = nedosažitelný).
+
+    Celočíselné enginy pracují nad seznamem celých vah (-1 = nečíselná váha),
+    který se převede jednou pro všechny zdroje.
+
+    Raises:
+        ValueError: Pokud vynucený celočíselný engine nepokrývá některou váhu
+                    (záporná, neceločíselná, pro 'zero-one' větší než 1)
+    """
+    if engine == 'heap':
+        return lambda source: _dijkstra_row(offsets, targets, weights, source)
+    if engine not in ('zero-one', 'dial', 'radix'):
+        raise ValueError(f"Neznámá prioritní fronta: {engine}")
+    int_weights = []
+    for weight in weights:
+        if weight != weight:  # NaN = nečíselná váha, hrana se přeskočí
+            int_weights.append(-1)
+        elif weight < 0 or not weight.is_integer() or (engine == 'zero-one' and weight > 1):
+            raise ValueError(f"Prioritní fronta '{engine}' nepodporuje váhu hrany {weight} "
+                             f"(jen nezáporná celá čísla{', 0 nebo 1' if engine == 'zero-one' else ''})")
+        else:
+            int_weights.append(int(weight))
+    if engine == 'zero-one':
+        row = _zero_one_row
+    elif engine == 'dial':
+        max_weight = max(int_weights, default=0)
+        row = lambda off, tgt, wts, source: _dial_row(off, tgt, wts, source, max_weight)
+    else:
+        row = _radix_row
+    return lambda source: [float(d) for d in row(offsets, targets, int_weights, source)]
+
+
+def _zero_one_row(offsets, targets, weights, source):
+    """0-1 BFS s obousměrnou frontou (váhy 0 a 1, -1 = přeskočit hranu)."""
+    dist = [float('inf')] * (len(offsets) - 1)
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        current_dist = dist[current]
+        for slot in range(offsets[current], offsets[current + 1]):
+            weight = weights[slot]
+            if weight < 0:
+                continue
+            nxt = targets[slot]
+            distance = current_dist + weight
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                if weight:
+                    queue.append(nxt)
+                else:
+                    queue.appendleft(nxt)
+    return dist
+
+
+def _dial_row(offsets, targets, weights, source, max_weight):
+    """
+    Dijkstra s Dialovými přihrádkami (celé váhy 0..max_weight, -1 = přeskočit hranu).
+
+    Přihrádky tvoří kruh délky max_weight + 1: všechny otevřené vzdálenosti
+    leží v intervalu [d, d + max_weight], takže se index přihrádky nepřekryje.
+    """
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    dist = [float('inf')] * (len(offsets) - 1)
+    dist[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    current_dist = 0
+    while pending:
+        bucket = buckets[current_dist % size]
+        while bucket:  # hrany s váhou 0 přidávají do právě zpracovávané přihrádky
+            current = bucket.pop()
+            pending -= 1
+            if dist[current] != current_dist:
+                continue
+            for slot in range(offsets[current], offsets[current + 1]):
+                weight = weights[slot]
+                if weight < 0:
+                    continue
+                nxt = targets[slot]
+                distance = current_dist + weight
+                if distance < dist[nxt]:
+                    dist[nxt] = distance
+                    buckets[distance % size].append(nxt)
+                    pending += 1
+        current_dist += 1
+    return dist
+
+
+def _radix_row(offsets, targets, weights, source):
+    """
+    Dijkstra s radix haldou (nezáporné celé váhy, -1 = přeskočit hranu).
+
+    Uzel leží v přihrádce podle nejvyššího bitu, ve kterém se jeho vzdálenost
+    liší od poslední vybrané (`last`). Když je přihrádka 0 prázdná, vezme se
+    první neprázdná, `last` se posune na její minimum a její uzly se
+    rozdělí do nižších přihrádek.
+    """
+    n = len(offsets) - 1
+    dist = [float('inf')] * n
+    dist[source] = 0
+    done = bytearray(n)
+    buckets = [[source]]
+    last = 0
+    while True:
+        if not buckets[0]:
+            i = 1
+            while i < len(buckets) and not buckets[i]:
+                i += 1
+            if i == len(buckets):
+                break
+            items = [v for v in buckets[i] if not done[v]]
+            buckets[i] = []
+            if not items:
+                continue
+            last = min(dist[v] for v in items)
+            for v in items:
+                buckets[(dist[v] ^ last).bit_length()].append(v)
+        current = buckets[0].pop()
+        if done[current]:
+            continue
+        done[current] = 1
+        current_dist = dist[current]
+        for slot in range(offsets[current], offsets[current + 1]):
+            weight = weights[slot]
+            if weight < 0:
+                continue
+            nxt = targets[slot]
+            distance = current_dist + weight
+            if distance < dist[nxt]:
+                dist[nxt] = distance
+                index = (distance ^ last).bit_length()
+                while len(buckets) <= index:
+                    buckets.append([])
+                buckets[index].append(nxt)
+    return dist
+
+
+def _distance_block(offsets, targets, weights, start, end, use_numpy=None, engine=None):
+    """
+    Spočítá řádky matice vzdáleností pro zdroje start..end-1.
+
+    Args:
+        offsets (array): Začátky řádků CSR
+        targets (array): Cílové indexy hran
+        weights (array): Váhy hran, None = neohodnocený graf (bitový BFS)
+        start (int): První zdroj
+        end (int): Zdroj za posledním
+        use_numpy (bool): Backend bitového BFS (None = NumPy, je-li k dispozici)
+        engine (str): Prioritní fronta Dijkstry (None = 'heap')
+
+    Returns:
+        array: Řádky po sobě ('i' pro BFS, 'd' pro Dijkstru)
+    """
+    block = array(DistanceMatrix.typecode_for(weights is not None))
+    if weights is None:
+        bfs = BitsetBFS(offsets, targets, use_numpy=use_numpy)
+        # Po dávkách, aby se najednou držely jen řádky jedné dávky
+        for batch_start in range(start, end, bfs.batch_size):
+            batch = range(batch_start, min(batch_start + bfs.batch_size, end))
+            for row in bfs.run(batch, rows=True)['rows']:
+                block.extend(row)
+        return block
+    run = _row_runner(offsets, targets, weights, engine or 'heap')
+    for source in range(start, end):
+        block.extend(run(source))
+    return block
+
+
+# CSR předané pracovnímu procesu při startu (offsets, targets, weights, engine)
+_worker_csr = None
+
+
+def _init_distance_worker(offsets, targets, weights, engine=None):
+    """Inicializace pracovního procesu: uloží CSR do globální proměnné."""
+    global _worker_csr
+    _worker_csr = (offsets, targets, weights, engine)
+
+
+def _distance_rows(task):
+    """
+    Úloha pro pracovní proces: spočítá blok řádků matice vzdáleností.
+
+    Args:
+        task (tuple): (start, end) - rozsah indexů zdrojů
+
+    Returns:
+        tuple: (start, pole vzdáleností bloku)
+    """
+    start, end = task
+    offsets, targets, weights, engine = _worker_csr
+    return start, _distance_block(offsets, targets, weights, start, end, engine=engine)
@@ -62,6 +62,8 @@ def create_parser():
     analysis_group.add_argument('--incidence', action='store_true', help='Zobrazí matici incidence (pouze)')
     analysis_group.add_argument('--weight', action='store_true', help='Zobrazí matici vah (pouze)')
     analysis_group.add_argument('--adj-power', type=int, metavar='K', help='Vypočte matici sousednosti na K-tou (A^K)')
+    analysis_group.add_argument('--walks', nargs=3, metavar=('U', 'V', 'K'), help='Spočítá sledy délky K z uzlu U do uzlu V (bez výpočtu celé A^K)')
+    analysis_group.add_argument('--distance-matrix', nargs='?', const='', metavar='FILE', help='Matice vzdáleností všech dvojic uzlů; s FILE se uloží (.csv = CSV, jinak binárně)')
     analysis_group.add_argument('--matrix-ops', action='store_true', help='Interaktivní operace s maticemi (sčítání řádků, sloupců, diagonál, atd.)')
     analysis_group.add_argument('--full', action='store_true', help='Zobrazí kompletní analýzu grafu')
 
@@ -74,15 +76,25 @@ def create_parser():
 
     path_group = parser.add_argument_group('Analýzy cest')
     path_group.add_argument('--path', nargs=2, metavar=('START', 'END'), help='Najde nejkratší cestu mezi dvěma uzly')
+    path_group.add_argument('--ch', action='store_true', help='Pro --path použije contraction hierarchy (uloží se vedle souboru jako .tgch)')
     path_group.add_argument('--all-paths', nargs=2, metavar=('START', 'END'), help='Najde všechny jednoduché cesty mezi dvěma uzly')
-    path_group.add_argument('--distances', metavar='NODE', help='Zobrazí vzdálenosti od zadaného uzlu ke všem ostatním')
+    path_group.add_argument('--k-paths', nargs=3, metavar=('START', 'END', 'K'), help='Najde K nejkratších jednoduchých cest mezi dvěma uzly (Yenův algoritmus)')
+    path_group.add_argument('--count-paths', nargs=2, metavar=('START', 'END'), help='Spočítá cesty mezi dvěma uzly bez jejich výčtu (s --max-length sledy délky nejvýše N)')
+    path_group.add_argument('--distances', metavar='NODE[,NODE...]', help='Zobrazí vzdálenosti od zadaného uzlu ke všem ostatním (více uzlů: k nejbližšímu z nich)')
+    path_group.add_argument('--per-source', action='store_true', help='S více uzly v --distances vypíše vzdálenosti z každého zvlášť')
     path_group.add_argument('--diameter', action='store_true', help='Vypočítá průměr grafu')
     path_group.add_argument('--radius', action='store_true', help='Vypočítá poloměr grafu')
     path_group.add_argument('--center', action='store_true', help='Najde centrální uzly grafu')
+    path_group.add_argument('--periphery', action='store_true', help='Najde periferní uzly grafu (excentricita = průměr)')
+    path_group.add_argument('--distance-stats', action='store_true', help='Histogram vzdáleností, průměrná vzdálenost a closeness uzlů')
+    path_group.add_argument('--approx-distances', nargs='?', type=int, const=0, metavar='REGISTERS', help='Odhad funkce okolí, efektivního průměru a průměrné vzdálenosti (HyperANF, REGISTERS = mocnina dvou, výchozí 64)')
 
     parser.add_argument('--quiet', '-q', action='store_true', help='Potlačí výstupní zprávy (pouze výsledky)')
     parser.add_argument('--export-csv', metavar='DIR', help='Exportovat vybrané matice jako CSV do adresáře DIR')
+    parser.add_argument('--no-cache', action='store_true', help='Nepoužívat ani nezapisovat binární cache grafu (.tgc)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N', help='Počet procesů pro paralelní parsování velkých souborů a výpočet matice vzdáleností (výchozí: 1)')
     parser.add_argument('--max-paths', type=int, default=10, metavar='N', help='Maximální počet zobrazených cest (výchozí: 10)')
+    parser.add_argument('--max-length', type=int, metavar='N', help='Maximální počet hran cesty pro --all-paths a --count-paths (výchozí: bez omezení)')
 
     return parser
 
@@ -94,13 +106,13 @@ def run(argv=None):
     # if not args.quiet:
     #     print_custom_header()
 
-    graph = commands.load_graph(args.input_file)
+    graph = commands.load_graph(args.input_file, use_cache=not args.no_cache, jobs=args.jobs)
 
     has_specific_args = any([
         args.properties, args.matrices, args.full,
         args.neighbors, args.degree, args.successors, args.predecessors, args.info,
-        args.path, args.all_paths, args.distances, args.diameter, args.radius, args.center,
-        args.adjacency, args.incidence, args.weight, args.adj_power is not None, args.matrix_ops
+        args.path, args.all_paths, args.k_paths, args.count_paths, args.distances, args.diameter, args.radius, args.center, args.periphery,
+        args.distance_stats, args.approx_distances is not None, args.adjacency, args.incidence, args.weight, args.adj_power is not None, args.walks, args.distance_matrix is not None, args.matrix_ops
     ])
 
     if not has_specific_args:
@@ -129,9 +141,11 @@ def run(argv=None):
     if args.info:
         commands.analyze_node(graph, args.info, 'all', args.quiet)
 
-    if any([args.path, args.all_paths, args.distances, args.diameter, args.radius, args.center]):
+    if any([args.path, args.all_paths, args.k_paths, args.count_paths, args.distances, args.diameter, args.radius, args.center, args.periphery,
+            args.distance_stats, args.approx_distances is not None]):
         commands.analyze_paths(graph, args, args.quiet)
 
-    specific_matrix_flags = any([args.adjacency, args.incidence, args.weight, args.adj_power is not None])
+    specific_matrix_flags = any([args.adjacency, args.incidence, args.weight, args.adj_power is not None, args.walks,
+                                 args.distance_matrix is not None])
     if args.matrices or args.full or specific_matrix_flags or args.matrix_ops:
         commands.analyze_matrices(graph, args, args.quiet)
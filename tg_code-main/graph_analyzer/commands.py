@@ -1,17 +1,35 @@
 import os
 import sys
+import time
 
-from .models import Graph
-from .utils import GraphParser
-from .analyzers import GraphPropertiesAnalyzer, PathAnalyzer, MatrixAnalyzer
+from .models import Graph, ContractionHierarchy
+from .utils import GraphParser, GraphCache, HierarchyCache
+from .analyzers import GraphPropertiesAnalyzer, PathAnalyzer, MatrixAnalyzer, NegativeCycleError
 
 
-def load_graph(input_file):
-    """Načte graf ze souboru a vrátí objekt Graph."""
+def load_graph(input_file, use_cache=True, jobs=1):
+    """
+    Načte graf ze souboru a vrátí objekt Graph.
+
+    Pokud vedle souboru existuje platná cache (.tgc), parsování se přeskočí
+    a graf i s CSR se sestaví přímo z cache; uložená varování parseru se
+    vypíšou znovu. Jinak se graf plní přímo z proudu záznamů parseru (pro
+    jobs > 1 parsovaného paralelně) a cache se zapíše z hotového grafu pro
+    další spuštění.
+    """
     try:
-        nodes_dict, edges_list = GraphParser.parse_file(input_file)
+        if use_cache:
+            cached = GraphCache.load(input_file)
+            if cached is not None:
+                graph, warnings = cached
+                for message in warnings:
+                    print(message)
+                return graph
+        warnings = []
         graph = Graph()
-        graph.load_from_data(nodes_dict, edges_list)
+        graph.load_from_records(GraphParser.iter_records(input_file, jobs, warnings))
+        if use_cache:
+            GraphCache.save(input_file, graph, warnings)
         return graph
     except FileNotFoundError:
         raise
@@ -19,6 +37,28 @@ def load_graph(input_file):
         raise
 
 
+def load_hierarchy(input_file, graph, use_cache=True):
+    """
+    Vrátí contraction hierarchy grafu ze souboru .tgch, nebo ji sestaví.
+
+    Nově sestavená hierarchie se uloží vedle vstupního souboru pro další spuštění.
+
+    Returns:
+        tuple: (ContractionHierarchy, doba sestavení v sekundách nebo None pokud se načetla)
+    """
+    csr = graph.get_csr()
+    if use_cache:
+        hierarchy = HierarchyCache.load(input_file, csr)
+        if hierarchy is not None:
+            return hierarchy, None
+    start_time = time.perf_counter()
+    hierarchy = ContractionHierarchy.build(csr)
+    build_time = time.perf_counter() - start_time
+    if use_cache:
+        HierarchyCache.save(input_file, hierarchy, csr)
+    return hierarchy, build_time
+
+
 def print_basic_info(graph, quiet=False):
     """Vytiskne základní informace o grafu."""
     if not quiet:
@@ -129,6 +169,59 @@ def analyze_node(graph, node_id, analysis_type, quiet=False):
         print(f"Předchůdci uzlu '{node_id}': {predecessors}")
 
 
+def _path_weight(graph, path):
+    """Sečte váhy hran podél cesty (hrana pro každý krok se hledá v O(1) v indexu hran)."""
+    total_weight = 0
+    for u, v in zip(path[:-1], path[1:]):
+        edge = graph.get_edge(u, v)
+        if edge is not None:
+            total_weight += edge.weight if edge.weight is not None else 1
+    return total_weight
+
+
+def _print_distances(graph, path_analyzer, node_id, quiet=False):
+    """Vypíše vzdálenosti od jednoho uzlu."""
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"VZDÁLENOSTI OD UZLU '{node_id}'")
+        print("="*60)
+
+    try:
+        distances = path_analyzer.get_shortest_distances(node_id)
+    except NegativeCycleError as e:
+        distances = {}
+        print(e)
+    for target_id, distance in sorted(distances.items()):
+        if target_id != node_id:
+            if distance == float('inf'):
+                print(f"  {node_id} → {target_id}: nedostupný")
+            else:
+                print(f"  {node_id} → {target_id}: {distance}")
+    if distances and not quiet:
+        engine = 'spfa' if graph.has_negative_weights else path_analyzer.get_queue_engine()
+        print(f"Výpočet: {engine}")
+
+
+def _print_nearest_sources(path_analyzer, node_ids, quiet=False):
+    """Vypíše vzdálenost každého uzlu k nejbližšímu ze zadaných uzlů."""
+    if not quiet:
+        print(f"\n{'='*60}")
+        print(f"VZDÁLENOSTI K NEJBLIŽŠÍMU Z UZLŮ {', '.join(node_ids)}")
+        print("="*60)
+
+    try:
+        nearest = path_analyzer.get_nearest_sources(node_ids)
+    except NegativeCycleError as e:
+        print(e)
+        return
+    sources = nearest['sources']
+    for target_id, distance in sorted(nearest['distances'].items()):
+        if distance == float('inf'):
+            print(f"  {target_id}: nedostupný")
+        elif sources[target_id] != target_id:
+            print(f"  {sources[target_id]} → {target_id}: {distance}")
+
+
 def analyze_paths(graph, args, quiet=False):
     """Analyzuje cesty v grafu."""
     path_analyzer = PathAnalyzer(graph)
@@ -140,21 +233,34 @@ def analyze_paths(graph, args, quiet=False):
             print(f"NEJKRATŠÍ CESTA: {start} → {end}")
             print("="*60)
 
-        path = path_analyzer.find_shortest_path(start, end)
-        if path:
-            print(f"Nejkratší cesta: {' → '.join(path)}")
-            if graph.is_weighted:
-                total_weight = 0
-                for u, v in zip(path[:-1], path[1:]):
-                    for edge in graph.adj[u]:
-                        if edge.v.identifier == v:
-                            total_weight += edge.weight
-                            break
-                print(f"Délka cesty: {total_weight}")
+        if getattr(args, 'ch', False):
+            try:
+                hierarchy, build_time = load_hierarchy(args.input_file, graph,
+                                                       use_cache=not getattr(args, 'no_cache', False))
+                path_analyzer.hierarchy = hierarchy
+                if not quiet:
+                    if build_time is None:
+                        print(f"Contraction hierarchy načtena z {HierarchyCache.cache_path(args.input_file)}")
+                    else:
+                        print(f"Contraction hierarchy sestavena za {build_time:.2f} s "
+                              f"({hierarchy.shortcut_count} zkratek)")
+            except ValueError as e:
+                print(f"Contraction hierarchy nelze použít: {e}")
+
+        try:
+            result = path_analyzer.find_shortest_path(start, end)
+            if result:
+                print(f"Nejkratší cesta: {' → '.join(result['path'])}")
+                print(f"Délka cesty: {result['cost']}")
+                if not quiet and graph.has_negative_weights:
+                    # SPFA uzly neuzavírá, uzel může projít frontou vícekrát
+                    print(f"Výběrů z fronty (SPFA): {result['settled']}")
+                elif not quiet:
+                    print(f"Uzavřené uzly: {result['settled']} z {len(graph.nodes)}")
             else:
-                print(f"Délka cesty: {len(path) - 1}")
-        else:
-            print("Cesta neexistuje")
+                print("Cesta neexistuje")
+        except NegativeCycleError as e:
+            print(e)
 
     if args.all_paths:
         start, end = args.all_paths
@@ -163,76 +269,185 @@ def analyze_paths(graph, args, quiet=False):
             print(f"VŠECHNY CESTY: {start} → {end}")
             print("="*60)
 
-        paths = path_analyzer.find_all_paths(start, end, max_length=10)
+        # O jednu cestu víc, aby se poznalo, že nejsou vypsány všechny
+        paths = path_analyzer.find_all_paths(start, end, max_length=getattr(args, 'max_length', None),
+                                             max_paths=args.max_paths + 1)
         if paths:
-            print(f"Nalezeno {len(paths)} cest:")
-            for i, path in enumerate(paths[:args.max_paths], 1):
+            more = len(paths) > args.max_paths
+            paths = paths[:args.max_paths]
+            print(f"{'Prvních' if more else 'Nalezeno'} {len(paths)} cest:")
+            for i, path in enumerate(paths, 1):
                 if graph.is_weighted:
-                    total_weight = 0
-                    for u, v in zip(path[:-1], path[1:]):
-                        for edge in graph.adj[u]:
-                            if edge.v.identifier == v:
-                                total_weight += edge.weight
-                                break
+                    total_weight = _path_weight(graph, path)
                     print(f"  {i}. {' → '.join(path)} (délka: {total_weight})")
                 else:
                     print(f"  {i}. {' → '.join(path)} (délka: {len(path) - 1})")
-            if len(paths) > args.max_paths:
-                print(f"  ... a dalších {len(paths) - args.max_paths} cest")
+            if more:
+                print("  ... a další cesty (zvyšte --max-paths)")
         else:
             print("Žádné cesty nebyly nalezeny")
 
-    if args.distances:
-        node_id = args.distances
+    if getattr(args, 'k_paths', None):
+        start, end, k = args.k_paths
         if not quiet:
             print(f"\n{'='*60}")
-            print(f"VZDÁLENOSTI OD UZLU '{node_id}'")
+            print(f"{k} NEJKRATŠÍCH CEST: {start} → {end}")
             print("="*60)
 
-        distances = path_analyzer.get_shortest_distances(node_id)
-        for target_id, distance in sorted(distances.items()):
-            if target_id != node_id:
-                if distance == float('inf'):
-                    print(f"  {node_id} → {target_id}: nedostupný")
-                else:
-                    print(f"  {node_id} → {target_id}: {distance}")
+        try:
+            results = path_analyzer.find_k_shortest_paths(start, end, int(k))
+        except ValueError as e:
+            results = None
+            print(f"Chyba při hledání cest: {e}")
+        if results:
+            for i, result in enumerate(results, 1):
+                print(f"  {i}. {' → '.join(result['path'])} (délka: {result['cost']})")
+            if len(results) < int(k):
+                print(f"Existuje jen {len(results)} jednoduchých cest")
+        elif results is not None:
+            print("Cesta neexistuje")
+
+    if getattr(args, 'count_paths', None):
+        start, end = args.count_paths
+        max_length = getattr(args, 'max_length', None)
+        if not quiet:
+            print(f"\n{'='*60}")
+            print(f"POČET CEST: {start} → {end}")
+            print("="*60)
+
+        try:
+            result = path_analyzer.count_paths(start, end, max_length)
+            kind = 'jednoduchých cest' if result['simple'] else 'sledů'
+            limit = f" délky nejvýše {max_length}" if max_length is not None else ''
+            print(f"Počet {kind}{limit} z {start} do {end}: {result['count']}")
+        except ValueError as e:
+            print(f"Chyba při počítání cest: {e}")
 
-    if args.diameter:
+    if args.distances:
+        node_ids = [node_id for node_id in args.distances.split(',') if node_id]
+        if len(node_ids) > 1 and not getattr(args, 'per_source', False):
+            _print_nearest_sources(path_analyzer, node_ids, quiet)
+        else:
+            for node_id in node_ids:
+                _print_distances(graph, path_analyzer, node_id, quiet)
+
+    # Centrum a periferie potřebují excentricity všech uzlů (jediný společný výpočet);
+    # samotný průměr a poloměr stačí spočítat omezováním excentricit
+    eccentricity_summary = None
+    try:
+        if args.center or getattr(args, 'periphery', False):
+            eccentricity_summary = path_analyzer.get_eccentricity_summary()
+        elif args.diameter or args.radius:
+            eccentricity_summary = path_analyzer.get_diameter_radius()
+    except NegativeCycleError as e:
+        if not quiet:
+            requested = [title for flag, title in ((args.diameter, "PRŮMĚR GRAFU"), (args.radius, "POLOMĚR GRAFU"),
+                                                   (args.center, "CENTRÁLNÍ UZLY"),
+                                                   (getattr(args, 'periphery', False), "PERIFERNÍ UZLY"))
+                         if flag]
+            print(f"\n{'='*60}")
+            print(" / ".join(requested))
+            print("="*60)
+        print(e)
+
+    if args.diameter and eccentricity_summary is not None:
         if not quiet:
             print(f"\n{'='*60}")
             print("PRŮMĚR GRAFU")
             print("="*60)
 
-        diameter = path_analyzer.get_graph_diameter()
+        diameter = eccentricity_summary['diameter']
         if diameter == float('inf'):
             print("Průměr: nekonečno (graf není souvislý)")
         else:
             print(f"Průměr grafu: {diameter}")
 
-    if args.radius:
+    if args.radius and eccentricity_summary is not None:
         if not quiet:
             print(f"\n{'='*60}")
             print("POLOMĚR GRAFU")
             print("="*60)
 
-        radius = path_analyzer.get_graph_radius()
+        radius = eccentricity_summary['radius']
         if radius == float('inf'):
             print("Poloměr: nekonečno (graf není souvislý)")
         else:
             print(f"Poloměr grafu: {radius}")
 
-    if args.center:
+    if (args.diameter or args.radius) and eccentricity_summary and 'searches' in eccentricity_summary and not quiet:
+        print(f"Počet prohledávání (BFS/Dijkstra): {eccentricity_summary['searches']} "
+              f"(uzlů: {len(graph.nodes)})")
+
+    if args.center and eccentricity_summary is not None:
         if not quiet:
             print(f"\n{'='*60}")
             print("CENTRÁLNÍ UZLY")
             print("="*60)
 
-        center_nodes = path_analyzer.find_center_nodes()
+        center_nodes = eccentricity_summary['center']
         if center_nodes:
             print(f"Centrální uzly: {center_nodes}")
         else:
             print("Žádné centrální uzly (graf není souvislý)")
 
+    if getattr(args, 'periphery', False) and eccentricity_summary is not None:
+        if not quiet:
+            print(f"\n{'='*60}")
+            print("PERIFERNÍ UZLY")
+            print("="*60)
+
+        periphery_nodes = eccentricity_summary['periphery']
+        if periphery_nodes:
+            print(f"Periferní uzly: {periphery_nodes}")
+        else:
+            print("Žádné periferní uzly (graf není souvislý)")
+
+    if getattr(args, 'distance_stats', False):
+        if not quiet:
+            print(f"\n{'='*60}")
+            print("STATISTIKY VZDÁLENOSTÍ")
+            print("="*60)
+
+        try:
+            stats = path_analyzer.get_distance_statistics()
+        except NegativeCycleError as e:
+            print(e)
+        else:
+            print("Histogram vzdáleností (počet dvojic uzlů):")
+            for distance, count in stats['histogram'].items():
+                print(f"  {distance}: {count}")
+            print(f"Průměrná vzdálenost: {stats['average_distance']:.4f}")
+            closeness = sorted(stats['closeness'].items(), key=lambda item: (-item[1], item[0]))
+            print("Nejvyšší closeness:")
+            for node_id, value in closeness[:args.max_paths]:
+                print(f"  {node_id}: {value:.4f}")
+            if not quiet:
+                print(f"Výpočet: {stats['engine']}, průchodů grafem: {stats['sweeps']}")
+
+    if getattr(args, 'approx_distances', None) is not None:
+        if not quiet:
+            print(f"\n{'='*60}")
+            print("ODHAD VZDÁLENOSTÍ (HyperANF)")
+            print("="*60)
+            if graph.is_weighted:
+                print("Vzdálenosti v počtu hran (váhy se ignorují)")
+
+        try:
+            approx = path_analyzer.get_approximate_distances(args.approx_distances or None)
+        except ValueError as e:
+            print(e)
+            return
+        print("Funkce okolí (odhad počtu dvojic ve vzdálenosti nejvýše t):")
+        for distance, count in approx['neighborhood'].items():
+            print(f"  {distance}: {count:.0f}")
+        print(f"Dosažitelné dvojice: {approx['reachable_pairs']:.0f}")
+        print(f"Průměrná vzdálenost: {approx['average_distance']:.4f}")
+        print(f"Efektivní průměr (90 %): {approx['effective_diameter']:.4f}")
+        print(f"Průměr je alespoň: {approx['diameter_lower_bound']}")
+        if not quiet:
+            print(f"Výpočet: {approx['engine']}, registrů: {approx['registers']}, "
+                  f"relativní chyba čítače: ±{approx['relative_error']:.1%}")
+
 
 def analyze_matrices(graph, args, quiet=False):
     """Analyzuje maticové reprezentace grafu."""
@@ -248,6 +463,8 @@ def analyze_matrices(graph, args, quiet=False):
         getattr(sys, 'argv', None) and '--incidence' in sys.argv,
         getattr(sys, 'argv', None) and '--weight' in sys.argv,
         getattr(sys, 'argv', None) and '--adj-power' in sys.argv,
+        getattr(args, 'walks', None),
+        getattr(args, 'distance_matrix', None) is not None,
     ])
 
     export_dir = None
@@ -340,3 +557,37 @@ def analyze_matrices(graph, args, quiet=False):
                 matrix_analyzer.save_matrix_csv(A_k, nodes, col_labels=nodes, path=os.path.join(export_dir, f'adjacency_power_{k}.csv'))
         except Exception as e:
             print(f"Chyba při výpočtu A^k: {e}")
+    if getattr(args, 'walks', None):
+        start, end, k = args.walks
+        if not quiet:
+            print(f"\n{'='*60}")
+            print(f"POČET SLEDŮ: {start} → {end} (délka {k})")
+            print("="*60)
+        try:
+            count = matrix_analyzer.count_walks(start, end, int(k))
+            print(f"Počet sledů délky {k} z {start} do {end}: {count}")
+        except ValueError as e:
+            print(f"Chyba při počítání sledů: {e}")
+    if getattr(args, 'distance_matrix', None) is not None:
+        jobs = getattr(args, 'jobs', 1)
+        if not quiet:
+            print(f"\n{'='*60}")
+            print("MATICE VZDÁLENOSTÍ")
+            print("="*60)
+        start_time = time.perf_counter()
+        try:
+            D, nodes = matrix_analyzer.get_distance_matrix(jobs=jobs)
+        except NegativeCycleError as e:
+            print(e)
+            return
+        elapsed = time.perf_counter() - start_time
+        if args.distance_matrix:
+            path = matrix_analyzer.save_distance_matrix(D, args.distance_matrix)
+            print(f"Matice vzdáleností {len(nodes)}×{len(nodes)} uložena do {path}")
+        else:
+            matrix_analyzer._print_matrix(D, nodes, col_labels=nodes)
+        if export_dir:
+            matrix_analyzer.save_matrix_csv(D, nodes, col_labels=nodes, path=os.path.join(export_dir, 'distance.csv'))
+        if not quiet:
+            engine = PathAnalyzer(graph).get_queue_engine()
+            print(f"Výpočet: {elapsed:.2f} s ({len(nodes)} zdrojů, procesů: {jobs}, {engine})")
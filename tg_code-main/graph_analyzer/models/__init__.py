@@ -5,5 +5,9 @@ Modely pro reprezentaci grafových struktur.
 from .node import Node
 from .edge import Edge
 from .graph import Graph
+from .csr import CSRGraph
+from .sparse_matrix import SparseMatrix, SparseRow
+from .distance_matrix import DistanceMatrix
+from .contraction_hierarchy import ContractionHierarchy
 
-__all__ = ['Node', 'Edge', 'Graph']
+__all__ = ['Node', 'Edge', 'Graph', 'CSRGraph', 'SparseMatrix', 'SparseRow', 'DistanceMatrix', 'ContractionHierarchy']
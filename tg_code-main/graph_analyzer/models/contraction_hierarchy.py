@@ -0,0 +1,286 @@
+import heapq
+from array import array
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy (CH) pro opakované dotazy na nejkratší cestu.
+
+    Uzly se postupně kontrahují podle priority (rozdíl hran + počet již
+    kontrahovaných sousedů). Při kontrakci uzlu v se mezi jeho sousedy
+    u -> w přidá zkratka s váhou w(u,v) + w(v,w), pokud lokální Dijkstra
+    nenajde stejně krátkou cestu mimo v (witness). Každý uzel si ponechá jen
+    hrany do výše postavených uzlů:
+
+    - dopředný horní graf: hrany v -> w s rank[w] > rank[v]
+    - zpětný horní graf: hrany u -> v s rank[u] > rank[v], uložené u uzlu v
+
+    Dotaz je obousměrná Dijkstra, která z počátku i z cíle stoupá jen nahoru,
+    takže uzavře jen malou část grafu. Zkratky se při sestavení cesty
+    rozbalí rekurzivně přes prostřední uzel (`mid`) až na původní hrany,
+    které nesou svou pozici v dopředném CSR (`slot`).
+
+    Attributes:
+        ids (list): Index -> identifikátor uzlu
+        rank (array): Pořadí kontrakce uzlu
+        up (tuple): Dopředný horní graf (offsets, targets, weights, mids, slots)
+        down (tuple): Zpětný horní graf (offsets, sources, weights, mids, slots)
+        shortcut_count (int): Počet přidaných zkratek
+    """
+
+    __slots__ = ('ids', 'rank', 'up', 'down', 'shortcut_count')
+
+    # Maximální počet uzavřených uzlů jedné witness search
+    WITNESS_SETTLE_LIMIT = 60
+
+    def __init__(self, ids, rank, up, down, shortcut_count=0):
+        """
+        Inicializace z hotových polí.
+
+        Args:
+            ids (list): Seznam identifikátorů uzlů v pořadí indexů CSR
+            rank (array): Pořadí kontrakce uzlů
+            up (tuple): (offsets, targets, weights, mids, slots) dopředného horního grafu
+            down (tuple): (offsets, sources, weights, mids, slots) zpětného horního grafu
+            shortcut_count (int): Počet zkratek
+        """
+        self.ids = ids
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.shortcut_count = shortcut_count
+
+    @classmethod
+    def build(cls, csr):
+        """
+        Sestaví hierarchii z CSR grafu.
+
+        Paralelní hrany se sloučí na nejlehčí, smyčky a hrany s nečíselnou
+        váhou se vynechají. Záporné váhy nejsou podporovány.
+
+        Args:
+            csr (CSRGraph): CSR pohled na graf (`Graph.get_csr()`)
+
+        Returns:
+            ContractionHierarchy: Sestavená hierarchie
+
+        Raises:
+            ValueError: Pokud graf obsahuje zápornou váhu
+        """
+        n = csr.node_count()
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+        # out[u][w] = in_[w][u] = (váha, prostřední uzel nebo -1, pozice původní hrany nebo -1)
+        out = [{} for _ in range(n)]
+        in_ = [{} for _ in range(n)]
+        for u in range(n):
+            for slot in range(offsets[u], offsets[u + 1]):
+                weight = weights[slot]
+                if weight != weight:  # NaN = nečíselná váha, hrana se přeskočí
+                    continue
+                if weight < 0:
+                    raise ValueError('Contraction hierarchy nepodporuje záporné váhy hran')
+                v = targets[slot]
+                if v != u and (v not in out[u] or weight < out[u][v][0]):
+                    out[u][v] = in_[v][u] = (weight, -1, slot)
+
+        deleted = [0] * n
+        contracted = bytearray(n)
+
+        def shortcuts_for(v):
+            """Zkratky (u, w, váha) potřebné při kontrakci uzlu v."""
+            needed = []
+            for u, (w_uv, _, _) in in_[v].items():
+                costs = {w: w_uv + w_vw for w, (w_vw, _, _) in out[v].items() if w != u}
+                if not costs:
+                    continue
+                witness = cls._witness_search(out, u, v, max(costs.values()))
+                for w, cost in costs.items():
+                    if witness.get(w, float('inf')) > cost:
+                        needed.append((u, w, cost))
+            return needed
+
+        def priority(v, needed):
+            return len(needed) - len(in_[v]) - len(out[v]) + deleted[v]
+
+        heap = [(priority(v, shortcuts_for(v)), v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = array('i', [0]) * n
+        up_lists = [None] * n
+        down_lists = [None] * n
+        shortcut_count = 0
+        next_rank = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            # Líná aktualizace: priorita se přepočítá a uzel se případně vrátí do haldy
+            needed = shortcuts_for(v)
+            current = priority(v, needed)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            for u, w, cost in needed:
+                if w not in out[u] or cost < out[u][w][0]:
+                    if w not in out[u]:
+                        shortcut_count += 1
+                    out[u][w] = in_[w][u] = (cost, v, -1)
+
+            rank[v] = next_rank
+            next_rank += 1
+            contracted[v] = 1
+            up_lists[v] = sorted(out[v].items())
+            down_lists[v] = sorted(in_[v].items())
+            for w in out[v]:
+                del in_[w][v]
+                deleted[w] += 1
+            for u in in_[v]:
+                del out[u][v]
+                deleted[u] += 1
+            out[v] = {}
+            in_[v] = {}
+
+        return cls(csr.ids, rank, cls._pack(up_lists), cls._pack(down_lists), shortcut_count)
+
+    @classmethod
+    def _witness_search(cls, out, source, skip, limit):
+        """Omezená Dijkstra ze `source` mimo uzel `skip`; vrátí horní meze vzdáleností."""
+        dist = {source: 0.0}
+        pq = [(0.0, source)]
+        settled = 0
+        while pq:
+            d, x = heapq.heappop(pq)
+            if d > dist[x]:
+                continue
+            settled += 1
+            if settled > cls.WITNESS_SETTLE_LIMIT:
+                break
+            for y, (weight, _, _) in out[x].items():
+                if y == skip:
+                    continue
+                nd = d + weight
+                if nd <= limit and nd < dist.get(y, float('inf')):
+                    dist[y] = nd
+                    heapq.heappush(pq, (nd, y))
+        return dist
+
+    @staticmethod
+    def _pack(lists):
+        """Převede seznamy hran uzlů na pole (offsets, cíle, váhy, mids, slots)."""
+        offsets = array('q', [0])
+        ends, weights, mids, slots = array('i'), array('d'), array('i'), array('q')
+        for entries in lists:
+            for end, (weight, mid, slot) in entries:
+                ends.append(end)
+                weights.append(weight)
+                mids.append(mid)
+                slots.append(slot)
+            offsets.append(len(ends))
+        return offsets, ends, weights, mids, slots
+
+    def node_count(self):
+        """Vrátí počet uzlů."""
+        return len(self.ids)
+
+    def query(self, start, end):
+        """
+        Najde nejkratší cestu mezi uzly (indexy) obousměrnou Dijkstrou nahoru.
+
+        Args:
+            start (int): Index počátečního uzlu
+            end (int): Index cílového uzlu
+
+        Returns:
+            tuple: (indexy uzlů na cestě, pozice původních hran v CSR, počet
+                   uzavřených uzlů); bez cesty jsou první dvě položky None
+        """
+        if start == end:
+            return [start], [], 0
+
+        INF = float('inf')
+        forward_dist, backward_dist = {start: 0.0}, {end: 0.0}
+        # uzel -> (uzel, ze kterého byl dosažen, pozice hrany v jeho řádku horního grafu)
+        forward_parent, backward_parent = {start: None}, {end: None}
+        forward_pq, backward_pq = [(0.0, start)], [(0.0, end)]
+        # Strana hledání: (horní graf, graf pro stall-on-demand, vzdálenosti, předchůdci,
+        # halda, vzdálenosti protější strany)
+        forward = (self.up, self.down, forward_dist, forward_parent, forward_pq, backward_dist)
+        backward = (self.down, self.up, backward_dist, backward_parent, backward_pq, forward_dist)
+        mu = INF
+        meet = None
+        settled = 0
+
+        while True:
+            forward_key = forward_pq[0][0] if forward_pq else INF
+            backward_key = backward_pq[0][0] if backward_pq else INF
+            if min(forward_key, backward_key) >= mu:
+                break
+            side = forward if forward_key <= backward_key else backward
+            (offsets, ends, weights, _, _), stall, dist, parent, pq, other_dist = side
+
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > dist[current]:
+                continue
+            settled += 1
+            if current in other_dist and current_dist + other_dist[current] < mu:
+                mu = current_dist + other_dist[current]
+                meet = current
+
+            # Stall-on-demand: vede-li do uzlu kratší cesta shora, jeho hrany se nerozšiřují
+            stall_offsets, stall_ends, stall_weights = stall[0], stall[1], stall[2]
+            if any(dist.get(stall_ends[pos], INF) + stall_weights[pos] < current_dist
+                   for pos in range(stall_offsets[current], stall_offsets[current + 1])):
+                continue
+
+            for pos in range(offsets[current], offsets[current + 1]):
+                nxt = ends[pos]
+                distance = current_dist + weights[pos]
+                if distance < dist.get(nxt, INF):
+                    dist[nxt] = distance
+                    parent[nxt] = (current, pos)
+                    heapq.heappush(pq, (distance, nxt))
+
+        if meet is None:
+            return None, None, settled
+
+        # Horní hrany cesty: od počátku k uzlu setkání, pak od něj k cíli
+        chain = []  # (u, v, mid, slot) ve směru cesty
+        node = meet
+        while forward_parent[node] is not None:
+            prev, pos = forward_parent[node]
+            chain.append((prev, node, self.up[3][pos], self.up[4][pos]))
+            node = prev
+        chain.reverse()
+        node = meet
+        while backward_parent[node] is not None:
+            nxt, pos = backward_parent[node]
+            chain.append((node, nxt, self.down[3][pos], self.down[4][pos]))
+            node = nxt
+
+        nodes = [start]
+        slots = []
+        for u, v, mid, slot in chain:
+            self._unpack(u, v, mid, slot, nodes, slots)
+        return nodes, slots, settled
+
+    def _find(self, graph, owner, other):
+        """Vrátí (mid, slot) hrany mezi `owner` a `other` z řádku `owner` horního grafu."""
+        offsets, ends, _, mids, slots = graph
+        for pos in range(offsets[owner], offsets[owner + 1]):
+            if ends[pos] == other:
+                return mids[pos], slots[pos]
+        raise KeyError((owner, other))
+
+    def _unpack(self, u, v, mid, slot, nodes, slots):
+        """Rozbalí hranu u -> v hierarchie na původní hrany a připojí je k cestě."""
+        stack = [(u, v, mid, slot)]
+        while stack:
+            a, b, m, s = stack.pop()
+            if m < 0:
+                nodes.append(b)
+                slots.append(s)
+                continue
+            # Zkratka a -> b přes m: hrana a -> m leží ve zpětném grafu u m, m -> b v dopředném
+            first = self._find(self.down, m, a)
+            second = self._find(self.up, m, b)
+            stack.append((m, b) + second)
+            stack.append((a, m) + first)
@@ -0,0 +1,222 @@
+from array import array
+
+
+class CSRGraph:
+    """
+    Kompaktní reprezentace grafu ve formátu CSR (Compressed Sparse Row).
+
+    Uzly jsou očíslovány celými čísly 0..n-1 podle kanonického pořadí grafu,
+    sousedé uzlu `i` leží v `targets[offsets[i]:offsets[i + 1]]` v pořadí přidání
+    hran. Hrana 'A < B' je v řádku uzlu B, neorientovaná hrana v řádcích obou
+    koncových uzlů. Pro orientované grafy se navíc sestaví reverzní CSR
+    z orientovaných hran (neorientované hrany v něm nejsou).
+
+    Attributes:
+        ids (list): Index -> identifikátor uzlu (sdílené s `Graph.get_node_list`)
+        index_of (dict): Identifikátor uzlu -> index (sdílené s `Graph.get_node_index`)
+        offsets (array): Začátky řádků v poli `targets` (délka n + 1)
+        targets (array): Cílové uzly hran (indexy)
+        weights (array): Váhy hran jako float (None -> 1.0, nečíselná váha -> NaN)
+        rev_offsets (array): Začátky řádků reverzního CSR
+        rev_sources (array): Zdrojové uzly hran vedoucích do uzlu (indexy)
+        edge_ids (array): Index hrany v `Graph.edges` pro každou pozici `targets`
+        rev_edge_ids (array): Index hrany v `Graph.edges` pro každou pozici `rev_sources`
+        version (int): Verze grafu, ze které bylo CSR sestaveno
+    """
+
+    __slots__ = ('ids', 'index_of', 'offsets', 'targets', 'weights', 'rev_offsets', 'rev_sources',
+                 'edge_ids', 'rev_edge_ids', 'is_directed', 'version', '_transposed')
+
+    def __init__(self, ids, offsets, targets, weights, rev_offsets=None, rev_sources=None,
+                 is_directed=False, index_of=None, version=0, edge_ids=None, rev_edge_ids=None):
+        """
+        Inicializace CSR struktury z hotových polí.
+
+        Args:
+            ids (list): Seznam identifikátorů uzlů v pořadí indexů
+            offsets (array): Začátky řádků dopředného CSR
+            targets (array): Cílové indexy hran
+            weights (array): Váhy hran (float)
+            rev_offsets (array): Začátky řádků reverzního CSR (None = stejné jako dopředné)
+            rev_sources (array): Zdrojové indexy reverzního CSR
+            is_directed (bool): Zda je graf orientovaný
+            index_of (dict): Hotová mapa id -> index (None = spočítat z `ids`)
+            version (int): Verze grafu
+            edge_ids (array): Indexy hran v `Graph.edges` pro pozice dopředného CSR
+            rev_edge_ids (array): Indexy hran v `Graph.edges` pro pozice reverzního CSR
+        """
+        self.ids = ids
+        if index_of is None:
+            index_of = {node_id: idx for idx, node_id in enumerate(ids)}
+        self.index_of = index_of
+        self.version = version
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.is_directed = is_directed
+        self.edge_ids = edge_ids
+        if rev_offsets is None:
+            # Neorientovaný graf: předchůdci == následníci
+            rev_offsets, rev_sources, rev_edge_ids = offsets, targets, edge_ids
+        self.rev_offsets = rev_offsets
+        self.rev_sources = rev_sources
+        self.rev_edge_ids = rev_edge_ids
+        self._transposed = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Sestaví CSR ze seznamu hran grafu (`Graph.edges`).
+
+        Pozice hran se nejprve vypíšou v pořadí přidání a pak stabilně
+        rozřadí podle počátečního uzlu (přihrádkové řazení), takže pořadí
+        v řádku odpovídá pořadí hran v souboru.
+
+        Args:
+            graph (Graph): Načtený graf
+
+        Returns:
+            CSRGraph: Kompaktní reprezentace grafu
+        """
+        ids = graph.get_node_list()
+        index_of = graph.get_node_index()
+
+        sources, targets, weights, edge_ids = array('i'), array('i'), array('d'), array('i')
+        rev_targets, rev_sources, rev_edge_ids = array('i'), array('i'), array('i')
+        for edge_id, edge in enumerate(graph.edges):
+            u = index_of[edge.u.identifier]
+            v = index_of[edge.v.identifier]
+            weight = cls._weight_as_float(edge.weight)
+            if edge.direction == '<':
+                u, v = v, u
+            sources.append(u)
+            targets.append(v)
+            weights.append(weight)
+            edge_ids.append(edge_id)
+            if edge.direction == '-':
+                sources.append(v)
+                targets.append(u)
+                weights.append(weight)
+                edge_ids.append(edge_id)
+            else:
+                rev_targets.append(v)
+                rev_sources.append(u)
+                rev_edge_ids.append(edge_id)
+
+        n = len(ids)
+        offsets, order = cls._bucket_order(sources, n)
+        targets = array('i', map(targets.__getitem__, order))
+        weights = array('d', map(weights.__getitem__, order))
+        edge_ids = array('i', map(edge_ids.__getitem__, order))
+
+        rev_offsets = None
+        if graph.is_directed:
+            rev_offsets, order = cls._bucket_order(rev_targets, n)
+            rev_sources = array('i', map(rev_sources.__getitem__, order))
+            rev_edge_ids = array('i', map(rev_edge_ids.__getitem__, order))
+
+        return cls(ids, offsets, targets, weights, rev_offsets, rev_sources, graph.is_directed,
+                   index_of=index_of, version=graph.get_version(),
+                   edge_ids=edge_ids, rev_edge_ids=rev_edge_ids)
+
+    @staticmethod
+    def _bucket_order(keys, n):
+        """
+        Stabilní přihrádkové řazení pozic podle klíče 0..n-1.
+
+        Returns:
+            tuple: (offsets - začátky přihrádek, délka n + 1; pořadí pozic)
+        """
+        counts = [0] * (n + 1)
+        for key in keys:
+            counts[key + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+        fill = counts[:n]
+        order = array('i', bytes(4 * len(keys)))
+        for k, key in enumerate(keys):
+            order[fill[key]] = k
+            fill[key] += 1
+        return offsets, order
+
+    @staticmethod
+    def _weight_as_float(weight):
+        """Převede váhu hrany na float (chybějící váha = 1, nečíselná = NaN)."""
+        if weight is None:
+            return 1.0
+        if isinstance(weight, (int, float)):
+            return float(weight)
+        return float('nan')
+
+    def node_count(self):
+        """Vrátí počet uzlů."""
+        return len(self.ids)
+
+    def slot_count(self):
+        """Vrátí počet záznamů v dopředném CSR (neorientovaná hrana je uložena dvakrát)."""
+        return len(self.targets)
+
+    def successors(self, idx):
+        """Vrátí indexy následníků uzlu (kopie úseku pole `targets`)."""
+        return self.targets[self.offsets[idx]:self.offsets[idx + 1]]
+
+    def predecessors(self, idx):
+        """Vrátí indexy předchůdců uzlu (pro neorientované grafy totéž co následníci)."""
+        return self.rev_sources[self.rev_offsets[idx]:self.rev_offsets[idx + 1]]
+
+    def out_degree(self, idx):
+        """Vrátí výstupní stupeň uzlu."""
+        return self.offsets[idx + 1] - self.offsets[idx]
+
+    def in_degree(self, idx):
+        """Vrátí vstupní stupeň uzlu."""
+        return self.rev_offsets[idx + 1] - self.rev_offsets[idx]
+
+    def weighted_successors(self, idx):
+        """Vrátí dvojice (index následníka, váha) pro daný uzel."""
+        start, end = self.offsets[idx], self.offsets[idx + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def get_transpose(self):
+        """
+        Vrátí přesnou transpozici dopředného CSR (všechny hrany otočené) včetně vah.
+
+        Na rozdíl od reverzního CSR (jen orientované hrany) obsahuje i neorientované
+        hrany smíšených grafů, takže hledání pozpátku vidí přesně hrany z `targets`.
+        Výsledek se sestaví v O(n + m) při prvním volání a cachuje se.
+
+        Returns:
+            tuple: (offsets, sources, weights, slots) - `sources` jsou počáteční uzly
+                   hran vedoucích do uzlu, `slots[k]` je pozice téže hrany v `targets`
+        """
+        if self._transposed is None:
+            n = len(self.ids)
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+            counts = [0] * (n + 1)
+            for t in targets:
+                counts[t + 1] += 1
+            for i in range(n):
+                counts[i + 1] += counts[i]
+            m = len(targets)
+            rev_offsets = array('q', counts)
+            rev_sources = array('i', [0]) * m
+            rev_weights = array('d', [0.0]) * m
+            rev_slots = array('q', [0]) * m
+            fill = counts[:n]
+            for u in range(n):
+                for slot in range(offsets[u], offsets[u + 1]):
+                    v = targets[slot]
+                    pos = fill[v]
+                    fill[v] = pos + 1
+                    rev_sources[pos] = u
+                    rev_weights[pos] = weights[slot]
+                    rev_slots[pos] = slot
+            self._transposed = (rev_offsets, rev_sources, rev_weights, rev_slots)
+        return self._transposed
+
+    def undirected_neighbors(self, idx):
+        """Vrátí indexy všech sousedů bez ohledu na orientaci (mohou se opakovat)."""
+        if not self.is_directed:
+            return self.successors(idx)
+        return self.successors(idx) + self.predecessors(idx)
@@ -0,0 +1,91 @@
+class DistanceMatrix:
+    """
+    Hustá matice nejkratších vzdáleností mezi všemi dvojicemi uzlů.
+
+    Vzdálenosti jsou uloženy po řádcích v jediném poli `array` (řádek i =
+    vzdálenosti z uzlu `ids[i]`). Pro neohodnocené grafy se používá typ 'i'
+    (4 B na buňku, -1 = nedosažitelný uzel), pro ohodnocené typ 'd'
+    (8 B na buňku, inf = nedosažitelný uzel).
+
+    Stejně jako `SparseMatrix` podporuje `len(matrix)`, `matrix[i][j]`
+    a iteraci přes řádky, takže ji lze tisknout i ukládat do CSV metodami
+    `MatrixAnalyzer`. Řádky se vrací jako seznamy s float('inf') pro
+    nedosažitelné uzly.
+
+    Attributes:
+        ids (list): Index -> identifikátor uzlu
+        index_of (dict): Identifikátor uzlu -> index
+        data (array): Vzdálenosti po řádcích (n * n prvků)
+        weighted (bool): True = typ 'd', False = typ 'i'
+    """
+
+    __slots__ = ('ids', 'index_of', 'data', 'weighted')
+
+    UNREACHABLE = -1
+
+    def __init__(self, ids, data, weighted, index_of=None):
+        """
+        Inicializace z hotového pole vzdáleností.
+
+        Args:
+            ids (list): Seznam identifikátorů uzlů v pořadí řádků
+            data (array): Vzdálenosti po řádcích ('i' nebo 'd')
+            weighted (bool): Zda jde o vzdálenosti ohodnoceného grafu
+            index_of (dict): Hotová mapa id -> index (None = spočítat z `ids`)
+        """
+        self.ids = ids
+        if index_of is None:
+            index_of = {node_id: idx for idx, node_id in enumerate(ids)}
+        self.index_of = index_of
+        self.data = data
+        self.weighted = weighted
+
+    @staticmethod
+    def typecode_for(weighted):
+        """Vrátí typ pole pro (ne)ohodnocený graf."""
+        return 'd' if weighted else 'i'
+
+    def node_count(self):
+        """Vrátí počet uzlů (řádků i sloupců)."""
+        return len(self.ids)
+
+    def get(self, i, j):
+        """Vrátí vzdálenost z uzlu s indexem i do uzlu s indexem j (inf = nedosažitelný)."""
+        value = self.data[i * len(self.ids) + j]
+        if not self.weighted and value == self.UNREACHABLE:
+            return float('inf')
+        return value
+
+    def distance(self, u_id, v_id):
+        """Vrátí vzdálenost mezi uzly podle jejich identifikátorů."""
+        return self.get(self.index_of[u_id], self.index_of[v_id])
+
+    def row(self, i):
+        """Vrátí řádek i jako seznam vzdáleností (inf = nedosažitelný)."""
+        n = len(self.ids)
+        values = self.data[i * n:(i + 1) * n].tolist()
+        if not self.weighted:
+            INF = float('inf')
+            values = [INF if v == self.UNREACHABLE else v for v in values]
+        return values
+
+    def to_dense(self):
+        """Vrátí matici jako 2D seznam."""
+        return [self.row(i) for i in range(len(self.ids))]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.ids)
+        if not 0 <= i < len(self.ids):
+            raise IndexError('index řádku mimo rozsah')
+        return self.row(i)
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield self.row(i)
+
+    def __repr__(self):
+        return f"DistanceMatrix(n={len(self.ids)}, weighted={self.weighted})"
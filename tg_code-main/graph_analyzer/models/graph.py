@@ -1,22 +1,34 @@
 import collections
 from .node import Node
 from .edge import Edge
+from .csr import CSRGraph
 
 class Graph:
     """
     Třída reprezentující graf s jeho základními vlastnostmi a operacemi.
+
+    Graf drží jen uzly a hrany v pořadí přidání (`edges`). Sousednost se
+    prochází přes kompaktní CSR (`get_csr`), které si ke každé pozici
+    pamatuje index hrany v `edges`; hrany ve tvaru u -> v (otočené 'A < B'
+    a zpětné neorientované) se vytváří až na vyžádání (`out_edges`).
     """
     
     def __init__(self):
         """Inicializace prázdného grafu."""
         self.nodes = {}
-        self.adj = collections.defaultdict(list)  # Adjacency list for outgoing edges
-        self.rev_adj = collections.defaultdict(list)  # Adjacency list for incoming edges (for directed graphs)
         self.edges = []
         self.is_directed = False
         self.is_weighted = False
+        self.has_negative_weights = False
         self.has_loops = False
-        self.has_multiple_edges = False
+        # Verze grafu - zvyšuje se při každé změně, odvozené struktury podle ní poznají zastarání
+        self._version = 0
+        self._node_order = None  # (verze, seznam uzlů, mapa id -> index)
+        self._csr = None  # Kompaktní CSR pohled, sestavuje se po načtení grafu
+        self._multiple_edges = None  # (verze, bool) pro has_multiple_edges
+        # Index pro has_edge/get_edge/edge_multiplicity, sestaví se až při prvním dotazu:
+        # (verze, {(u_id, v_id, směr): počet}, {(u_id, v_id): index první hrany})
+        self._edge_lookup = None
 
     def add_node(self, node):
         """
@@ -27,6 +39,7 @@ class Graph:
         """
         if node.identifier not in self.nodes:
             self.nodes[node.identifier] = node
+            self._version += 1
 
     def add_edge(self, edge):
         """
@@ -46,37 +59,157 @@ class Graph:
             self.is_directed = True
         if edge.weight is not None:
             self.is_weighted = True
+            if isinstance(edge.weight, (int, float)) and edge.weight < 0:
+                self.has_negative_weights = True
         if edge.u == edge.v:
             self.has_loops = True
 
-        # Check for multiple edges
-        for existing_edge in self.adj[edge.u.identifier]:
-            if existing_edge.v == edge.v and existing_edge.direction == edge.direction:
-                self.has_multiple_edges = True
-                break
-        if not self.is_directed:
-            for existing_edge in self.adj[edge.v.identifier]:
-                if existing_edge.v == edge.u and existing_edge.direction == edge.direction:
-                    self.has_multiple_edges = True
+        self.edges.append(edge)
+        self._version += 1
+
+    @staticmethod
+    def _adjacency_keys(edge):
+        """
+        Vrátí klíče (u_id, v_id, směr) pozic hrany v seznamech sousedů.
+
+        Hrana 'A < B' vede z B do A ('>'), neorientovaná hrana vede oběma směry.
+        """
+        u_id, v_id = edge.u.identifier, edge.v.identifier
+        if edge.direction == '<':
+            return ((v_id, u_id, '>'),)
+        if edge.direction == '-':
+            return ((u_id, v_id, '-'), (v_id, u_id, '-'))
+        return ((u_id, v_id, '>'),)
+
+    @staticmethod
+    def oriented_edge(edge, u_id):
+        """Vrátí hranu ve tvaru u -> v pro pozici v seznamu sousedů uzlu u (otočí ji jen je-li třeba)."""
+        if edge.direction == '<':
+            return Edge(edge.v, edge.u, '>', edge.weight, edge.label)
+        if edge.direction == '-' and edge.u.identifier != u_id:
+            return Edge(edge.v, edge.u, '-', edge.weight, edge.label)
+        return edge
+
+    @property
+    def has_multiple_edges(self):
+        """
+        Zda graf obsahuje násobné hrany (spočítá se jednou pro každou verzi grafu).
+
+        Hrany se porovnávají v orientovaném tvaru, takže 'A < B' je násobná
+        s 'B > A' a neorientovaná 'B - A' s 'A - B'.
+        """
+        if self._multiple_edges is None or self._multiple_edges[0] != self._version:
+            seen = set()
+            found = False
+            for edge in self.edges:
+                keys = self._adjacency_keys(edge)
+                if keys[0] in seen:
+                    found = True
                     break
+                seen.update(keys)
+            self._multiple_edges = (self._version, found)
+        return self._multiple_edges[1]
 
-        self.edges.append(edge)
-        
-        # Handle adjacency lists based on edge direction
-        if edge.direction == '>':
-            # u -> v: u has outgoing edge to v, v has incoming edge from u
-            self.adj[edge.u.identifier].append(edge)
-            self.rev_adj[edge.v.identifier].append(edge)
-        elif edge.direction == '<':
-            # u <- v: v has outgoing edge to u, u has incoming edge from v
-            actual_edge = Edge(edge.v, edge.u, '>', edge.weight, edge.label)
-            self.adj[edge.v.identifier].append(actual_edge)
-            self.rev_adj[edge.u.identifier].append(actual_edge)
-        else:  # '-' undirected
-            # For undirected, both nodes can reach each other
-            self.adj[edge.u.identifier].append(edge)
-            reverse_edge = Edge(edge.v, edge.u, '-', edge.weight, edge.label)
-            self.adj[edge.v.identifier].append(reverse_edge)
+    def _get_edge_lookup(self):
+        """Index pozic hran v seznamech sousedů (viz `_edge_lookup`) pro aktuální verzi."""
+        if self._edge_lookup is None or self._edge_lookup[0] != self._version:
+            counts = collections.Counter()
+            first = {}
+            for edge_id, edge in enumerate(self.edges):
+                for key in self._adjacency_keys(edge):
+                    counts[key] += 1
+                    first.setdefault(key[:2], edge_id)
+            self._edge_lookup = (self._version, counts, first)
+        return self._edge_lookup
+
+    def has_edge(self, u_id, v_id):
+        """
+        Zjistí v O(1), zda z uzlu u vede hrana do uzlu v.
+
+        Neorientovaná hrana vede oběma směry, hrana 'A < B' vede z B do A.
+        Index hran se sestaví při prvním dotazu na danou verzi grafu.
+
+        Args:
+            u_id (str): Identifikátor počátečního uzlu
+            v_id (str): Identifikátor koncového uzlu
+
+        Returns:
+            bool: True pokud hrana existuje
+        """
+        return (u_id, v_id) in self._get_edge_lookup()[2]
+
+    def edge_multiplicity(self, u_id, v_id, direction=None):
+        """
+        Vrátí v O(1) počet hran z uzlu u do uzlu v (násobnost).
+
+        Args:
+            u_id (str): Identifikátor počátečního uzlu
+            v_id (str): Identifikátor koncového uzlu
+            direction (str): '>' pouze orientované, '-' pouze neorientované, None obojí
+
+        Returns:
+            int: Počet hran
+        """
+        counts = self._get_edge_lookup()[1]
+        if direction is None:
+            return counts.get((u_id, v_id, '>'), 0) + counts.get((u_id, v_id, '-'), 0)
+        return counts.get((u_id, v_id, direction), 0)
+
+    def get_edge(self, u_id, v_id):
+        """
+        Vrátí první hranu z uzlu u do uzlu v (v pořadí `out_edges(u)`) v O(1).
+
+        Args:
+            u_id (str): Identifikátor počátečního uzlu
+            v_id (str): Identifikátor koncového uzlu
+
+        Returns:
+            Edge: Hrana ve tvaru u -> v nebo None pokud neexistuje
+        """
+        edge_id = self._get_edge_lookup()[2].get((u_id, v_id))
+        return None if edge_id is None else self.oriented_edge(self.edges[edge_id], u_id)
+
+    def out_edges(self, node_id):
+        """
+        Vrátí hrany vycházející z uzlu ve tvaru u -> v (v pořadí přidání).
+
+        Neorientovaná hrana je v seznamu obou koncových uzlů, hrana 'A < B'
+        v seznamu uzlu B jako 'B > A'.
+
+        Args:
+            node_id (str): Identifikátor uzlu
+
+        Returns:
+            list: Seznam hran (prázdný pro neexistující uzel)
+        """
+        csr = self.get_csr()
+        idx = csr.index_of.get(node_id)
+        if idx is None:
+            return []
+        edges, edge_ids = self.edges, csr.edge_ids
+        return [self.oriented_edge(edges[edge_ids[slot]], node_id)
+                for slot in range(csr.offsets[idx], csr.offsets[idx + 1])]
+
+    def in_edges(self, node_id):
+        """
+        Vrátí orientované hrany vedoucí do uzlu ve tvaru u -> v (v pořadí přidání).
+
+        Neorientované hrany se nezahrnují (ty vrací `out_edges`).
+
+        Args:
+            node_id (str): Identifikátor uzlu
+
+        Returns:
+            list: Seznam hran (prázdný pro neexistující uzel či neorientovaný graf)
+        """
+        csr = self.get_csr()
+        idx = csr.index_of.get(node_id)
+        if idx is None or not self.is_directed:
+            return []
+        edges, ids = self.edges, csr.ids
+        start, end = csr.rev_offsets[idx], csr.rev_offsets[idx + 1]
+        return [self.oriented_edge(edges[edge_id], ids[source])
+                for source, edge_id in zip(csr.rev_sources[start:end], csr.rev_edge_ids[start:end])]
 
     def load_from_data(self, nodes_dict, edges_list):
         """
@@ -86,8 +219,10 @@ class Graph:
             nodes_dict (dict): Slovník uzlů
             edges_list (list): Seznam hran
         """
-        # Reset graph
+        # Reset graph (verze zůstává rostoucí i přes opakované načtení)
+        version = self._version
         self.__init__()
+        self._version = version + 1
         
         # Add nodes
         for node in nodes_dict.values():
@@ -97,6 +232,111 @@ class Graph:
         for edge in edges_list:
             self.add_edge(edge)
 
+        # Build compact CSR view once the graph is complete
+        self._csr = CSRGraph.from_graph(self)
+
+    def load_from_records(self, records):
+        """
+        Načte graf přímo z proudu záznamů parseru (viz `GraphParser.iter_records`).
+
+        Args:
+            records (iterable): Záznamy ('node', Node) / ('edge', Edge)
+        """
+        # Reset graph (verze zůstává rostoucí i přes opakované načtení)
+        version = self._version
+        self.__init__()
+        self._version = version + 1
+
+        for kind, item in records:
+            if kind == 'node':
+                # Pozdější definice uzlu přepíše dřívější (stejně jako nodes_dict parseru)
+                if item.identifier not in self.nodes:
+                    self._version += 1
+                self.nodes[item.identifier] = item
+            else:
+                self.add_edge(item)
+
+        # Build compact CSR view once the graph is complete
+        self._csr = CSRGraph.from_graph(self)
+
+    def load_compiled(self, nodes_dict, edges_list, csr, properties):
+        """
+        Načte hotový graf včetně CSR (např. z cache .tgc) bez přepočtu.
+
+        Hrany se nepřidávají po jedné přes `add_edge`: vlastnosti grafu i CSR
+        už jsou spočítané a převezmou se tak, jak jsou.
+
+        Args:
+            nodes_dict (dict): Slovník uzlů (v pořadí definic)
+            edges_list (list): Seznam hran (indexy odpovídají `csr.edge_ids`)
+            csr (CSRGraph): CSR sestavené z těchto hran nad seřazenými uzly
+            properties (dict): is_directed, is_weighted, has_negative_weights,
+                has_loops a has_multiple_edges
+        """
+        # Reset graph (verze zůstává rostoucí i přes opakované načtení)
+        version = self._version
+        self.__init__()
+        self._version = version + 1
+
+        self.nodes = nodes_dict
+        self.edges = edges_list
+        self.is_directed = properties['is_directed']
+        self.is_weighted = properties['is_weighted']
+        self.has_negative_weights = properties['has_negative_weights']
+        self.has_loops = properties['has_loops']
+        self._multiple_edges = (self._version, properties['has_multiple_edges'])
+        self._node_order = (self._version, csr.ids, csr.index_of)
+        csr.version = self._version
+        self._csr = csr
+
+    def get_version(self):
+        """Vrátí verzi grafu (mění se s každým přidaným uzlem či hranou)."""
+        return self._version
+
+    def _get_node_order(self):
+        """Vrátí (seznam uzlů, mapa id -> index) pro aktuální verzi grafu."""
+        if self._node_order is None or self._node_order[0] != self._version:
+            node_list = sorted(self.nodes.keys())
+            index_of = {node_id: idx for idx, node_id in enumerate(node_list)}
+            self._node_order = (self._version, node_list, index_of)
+        return self._node_order
+
+    def get_node_list(self):
+        """
+        Vrátí kanonické pořadí uzlů (index -> identifikátor).
+
+        Pořadí odpovídá seřazeným identifikátorům a sdílí ho všechny matice,
+        CSV export i analyzátory cest. Spočítá se jednou pro každou verzi grafu;
+        vrácený seznam je sdílený a nesmí se měnit.
+
+        Returns:
+            list: Seřazené identifikátory uzlů
+        """
+        return self._get_node_order()[1]
+
+    def get_node_index(self):
+        """
+        Vrátí kanonickou mapu identifikátor -> index (viz `get_node_list`).
+
+        Returns:
+            dict: {node_id: index}
+        """
+        return self._get_node_order()[2]
+
+    def get_csr(self):
+        """
+        Vrátí kompaktní CSR reprezentaci grafu (celočíselné indexy uzlů).
+
+        CSR se sestaví jednou po `load_from_data`; po další změně grafu
+        (jiná verze) se při příštím volání sestaví znovu.
+
+        Returns:
+            CSRGraph: CSR pohled na graf
+        """
+        if self._csr is None or self._csr.version != self._version:
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
+
     def get_node_count(self):
         """Vrátí počet uzlů v grafu."""
         return len(self.nodes)
@@ -142,16 +382,15 @@ class Graph:
         if node_id not in self.nodes:
             return None
         
-        neighbors = set()
-        for edge in self.adj[node_id]:
-            neighbors.add(edge.v.identifier)
+        csr = self.get_csr()
+        idx = csr.index_of[node_id]
+        neighbors = set(csr.successors(idx))
         
         # For directed graphs, also check reverse adjacency
         if self.is_directed:
-            for edge in self.rev_adj[node_id]:
-                neighbors.add(edge.u.identifier)
+            neighbors.update(csr.predecessors(idx))
         
-        return list(neighbors)
+        return [csr.ids[i] for i in neighbors]
 
     def get_successors(self, node_id):
         """
@@ -165,7 +404,12 @@ class Graph:
         """
         if node_id not in self.nodes:
             return None
-        return [edge.v.identifier for edge in self.adj[node_id] if edge.direction == '>']
+        # Jen orientované hrany (neorientované pozice CSR se přeskočí)
+        csr = self.get_csr()
+        idx = csr.index_of[node_id]
+        edges, edge_ids, targets = self.edges, csr.edge_ids, csr.targets
+        return [csr.ids[targets[slot]] for slot in range(csr.offsets[idx], csr.offsets[idx + 1])
+                if edges[edge_ids[slot]].direction != '-']
 
     def get_predecessors(self, node_id):
         """
@@ -179,7 +423,11 @@ class Graph:
         """
         if node_id not in self.nodes:
             return None
-        return [edge.u.identifier for edge in self.rev_adj[node_id] if edge.direction == '>']
+        if not self.is_directed:
+            return []
+        # Reverzní CSR orientovaného grafu obsahuje právě orientované hrany
+        csr = self.get_csr()
+        return [csr.ids[source] for source in csr.predecessors(csr.index_of[node_id])]
 
     def get_node_degree(self, node_id):
         """
@@ -194,16 +442,18 @@ class Graph:
         if node_id not in self.nodes:
             return None
         
+        csr = self.get_csr()
+        idx = csr.index_of[node_id]
         if self.is_directed:
-            in_degree = len(self.rev_adj[node_id])
-            out_degree = len(self.adj[node_id])
+            in_degree = csr.in_degree(idx)
+            out_degree = csr.out_degree(idx)
             return {
                 'in_degree': in_degree,
                 'out_degree': out_degree,
                 'total_degree': in_degree + out_degree
             }
         else:
-            return {'total_degree': len(self.adj[node_id])}
+            return {'total_degree': csr.out_degree(idx)}
 
     def is_isolated_node(self, node_id):
         """
@@ -239,6 +489,7 @@ class Graph:
             'properties': {
                 'is_directed': self.is_directed,
                 'is_weighted': self.is_weighted,
+                'has_negative_weights': self.has_negative_weights,
                 'has_loops': self.has_loops,
                 'has_multiple_edges': self.has_multiple_edges
             }
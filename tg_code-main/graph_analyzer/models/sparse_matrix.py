@@ -0,0 +1,307 @@
+from array import array
+from bisect import bisect_left
+
+
+class SparseMatrix:
+    """
+    Řídká matice uložená ve formátu CSR (Compressed Sparse Row).
+
+    Uloženy jsou pouze buňky s hodnotou různou od `fill`; všechny ostatní
+    buňky mají implicitně hodnotu `fill` (0 pro matici sousednosti a incidence,
+    float('inf') pro matici vah). Sloupcové indexy v každém řádku jsou seřazené,
+    takže hodnotu buňky lze najít binárním vyhledáváním.
+
+    Pro kompatibilitu s kódem, který pracuje s 2D seznamy, vrací `matrix[i]`
+    pohled na řádek (`SparseRow`), takže funguje `matrix[i][j]`, `len(matrix)`,
+    `len(matrix[0])` i iterace přes řádky. Hustá matice vznikne pouze
+    explicitním voláním `to_dense()`.
+
+    Attributes:
+        shape (tuple): (počet řádků, počet sloupců)
+        fill (int|float): Hodnota neuložených buněk
+        indptr (array): Začátky řádků v polích `indices`/`data` (délka rows + 1)
+        indices (array): Sloupcové indexy uložených buněk
+        data (list): Hodnoty uložených buněk (seznam kvůli libovolně velkým int)
+    """
+
+    __slots__ = ('shape', 'fill', 'indptr', 'indices', 'data', '_transposed')
+
+    def __init__(self, shape, indptr=None, indices=None, data=None, fill=0):
+        """
+        Inicializace z hotových CSR polí (bez kontroly seřazení).
+
+        Args:
+            shape (tuple): (počet řádků, počet sloupců)
+            indptr (array): Začátky řádků (None = prázdná matice)
+            indices (array): Sloupcové indexy
+            data (list): Hodnoty
+            fill (int|float): Hodnota neuložených buněk
+        """
+        rows = shape[0]
+        self.shape = (shape[0], shape[1])
+        self.fill = fill
+        self.indptr = indptr if indptr is not None else array('q', [0] * (rows + 1))
+        self.indices = indices if indices is not None else array('i')
+        self.data = data if data is not None else []
+        self._transposed = None
+
+    # ========== Konstrukce a převody ==========
+
+    @classmethod
+    def from_rows(cls, shape, rows, fill=0):
+        """
+        Sestaví matici ze slovníků řádků (dict-of-keys po řádcích).
+
+        Args:
+            shape (tuple): (počet řádků, počet sloupců)
+            rows (iterable): Pro každý řádek slovník {sloupec: hodnota}
+            fill (int|float): Hodnota neuložených buněk
+
+        Returns:
+            SparseMatrix: Nová matice (hodnoty rovné `fill` se neukládají)
+        """
+        indptr = array('q', [0])
+        indices = array('i')
+        data = []
+        for row in rows:
+            for j in sorted(row):
+                val = row[j]
+                if val != fill:
+                    indices.append(j)
+                    data.append(val)
+            indptr.append(len(indices))
+        return cls(shape, indptr, indices, data, fill)
+
+    @classmethod
+    def from_coo(cls, shape, row_idx, col_idx, values, fill=0, combine=None):
+        """
+        Sestaví matici z trojic (řádek, sloupec, hodnota).
+
+        Args:
+            shape (tuple): (počet řádků, počet sloupců)
+            row_idx (iterable): Řádkové indexy
+            col_idx (iterable): Sloupcové indexy
+            values (iterable): Hodnoty
+            fill (int|float): Hodnota neuložených buněk
+            combine (callable): Sloučení duplicitních buněk (výchozí součet)
+
+        Returns:
+            SparseMatrix: Nová matice
+        """
+        rows = [{} for _ in range(shape[0])]
+        for i, j, val in zip(row_idx, col_idx, values):
+            row = rows[i]
+            if j in row:
+                row[j] = combine(row[j], val) if combine else row[j] + val
+            else:
+                row[j] = val
+        return cls.from_rows(shape, rows, fill)
+
+    @classmethod
+    def from_dok(cls, shape, cells, fill=0):
+        """
+        Sestaví matici ze slovníku {(řádek, sloupec): hodnota}.
+
+        Args:
+            shape (tuple): (počet řádků, počet sloupců)
+            cells (dict): Uložené buňky
+            fill (int|float): Hodnota neuložených buněk
+
+        Returns:
+            SparseMatrix: Nová matice
+        """
+        rows = [{} for _ in range(shape[0])]
+        for (i, j), val in cells.items():
+            rows[i][j] = val
+        return cls.from_rows(shape, rows, fill)
+
+    @classmethod
+    def from_dense(cls, matrix, fill=0):
+        """Převede 2D seznam na řídkou matici."""
+        cols = len(matrix[0]) if matrix else 0
+        return cls.from_rows((len(matrix), cols), (dict(enumerate(row)) for row in matrix), fill)
+
+    def to_coo(self):
+        """Vrátí trojici seznamů (řádky, sloupce, hodnoty) uložených buněk."""
+        rows = []
+        for i in range(self.shape[0]):
+            rows.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return rows, list(self.indices), list(self.data)
+
+    def to_dok(self):
+        """Vrátí slovník {(řádek, sloupec): hodnota} uložených buněk."""
+        return {(i, j): val for i, j, val in self.items()}
+
+    def to_dense(self):
+        """Vrátí hustou matici jako 2D seznam (n x m buněk - pouze na vyžádání)."""
+        return [self.row_values(i) for i in range(self.shape[0])]
+
+    # ========== Přístup k buňkám ==========
+
+    def nnz(self):
+        """Vrátí počet uložených (nenulových) buněk."""
+        return len(self.data)
+
+    def get(self, i, j):
+        """Vrátí hodnotu buňky [i][j] (binární vyhledávání v řádku)."""
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        pos = bisect_left(self.indices, j, lo, hi)
+        if pos < hi and self.indices[pos] == j:
+            return self.data[pos]
+        return self.fill
+
+    def row(self, i):
+        """Vrátí dvojice (sloupec, hodnota) uložených buněk řádku i."""
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return zip(self.indices[lo:hi], self.data[lo:hi])
+
+    def column(self, j):
+        """Vrátí dvojice (řádek, hodnota) uložených buněk sloupce j."""
+        return self.transpose().row(j)
+
+    def row_values(self, i):
+        """Vrátí všechny hodnoty řádku i včetně implicitních jako seznam (hustý řádek)."""
+        values = [self.fill] * self.shape[1]
+        for j, val in self.row(i):
+            values[j] = val
+        return values
+
+    def items(self):
+        """Generuje trojice (řádek, sloupec, hodnota) v pořadí po řádcích."""
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for i in range(self.shape[0]):
+            for pos in range(indptr[i], indptr[i + 1]):
+                yield i, indices[pos], data[pos]
+
+    def has_implicit_cells(self):
+        """Vrátí True, pokud matice obsahuje alespoň jednu neuloženou buňku."""
+        return self.nnz() < self.shape[0] * self.shape[1]
+
+    # ========== Operace ==========
+
+    def transpose(self):
+        """Vrátí transponovanou matici v O(nnz) (výsledek se cachuje)."""
+        if self._transposed is None:
+            rows, cols = self.shape
+            counts = [0] * (cols + 1)
+            for j in self.indices:
+                counts[j + 1] += 1
+            for j in range(cols):
+                counts[j + 1] += counts[j]
+            indptr = array('q', counts)
+            indices = array('i', [0]) * len(self.indices)
+            data = [None] * len(self.data)
+            cursor = counts[:-1]
+            # Procházení po řádcích zachová seřazené řádkové indexy ve sloupcích
+            for i, j, val in self.items():
+                pos = cursor[j]
+                indices[pos] = i
+                data[pos] = val
+                cursor[j] = pos + 1
+            transposed = SparseMatrix((cols, rows), indptr, indices, data, self.fill)
+            transposed._transposed = self
+            self._transposed = transposed
+        return self._transposed
+
+    def _finite_sum(self, values, implicit):
+        """Sečte konečné hodnoty a příspěvek `implicit` neuložených buněk."""
+        total = sum(val for val in values if val != float('inf'))
+        if implicit and self.fill != float('inf'):
+            total += self.fill * implicit
+        return total
+
+    def row_sum(self, i):
+        """Součet řádku (hodnoty inf se vynechávají)."""
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return self._finite_sum(self.data[lo:hi], self.shape[1] - (hi - lo))
+
+    def column_sum(self, j):
+        """Součet sloupce (hodnoty inf se vynechávají)."""
+        return self.transpose().row_sum(j)
+
+    def total(self):
+        """Součet všech buněk (hodnoty inf se vynechávají)."""
+        return self._finite_sum(self.data, self.shape[0] * self.shape[1] - self.nnz())
+
+    def matmul(self, other):
+        """
+        Vynásobí dvě řídké matice (řádkový Gustavsonův algoritmus).
+
+        Neuložené buňky i hodnoty inf se berou jako nulové příspěvky, stejně
+        jako v husté variantě `MatrixAnalyzer.matrix_multiply`.
+
+        Args:
+            other (SparseMatrix): Pravý činitel
+
+        Returns:
+            SparseMatrix: Součin s výplní 0
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"Matice nelze násobit: {self.shape[0]}×{self.shape[1]} "
+                             f"a {other.shape[0]}×{other.shape[1]}")
+        INF = float('inf')
+        rows = []
+        for i in range(self.shape[0]):
+            acc = {}
+            for p, x in self.row(i):
+                if x == INF:
+                    continue
+                for j, y in other.row(p):
+                    if y != INF:
+                        acc[j] = acc.get(j, 0) + x * y
+            rows.append(acc)
+        return SparseMatrix.from_rows((self.shape[0], other.shape[1]), rows, fill=0)
+
+    def structurally_equal(self, other):
+        """Porovná dvě matice buňku po buňce v O(nnz)."""
+        return (self.shape == other.shape and self.fill == other.fill
+                and self.indptr == other.indptr and self.indices == other.indices
+                and self.data == other.data)
+
+    # ========== Kompatibilita s 2D seznamy ==========
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.shape[0]
+        if not 0 <= i < self.shape[0]:
+            raise IndexError('index řádku mimo rozsah')
+        return SparseRow(self, i)
+
+    def __iter__(self):
+        for i in range(self.shape[0]):
+            yield SparseRow(self, i)
+
+    def __repr__(self):
+        return f"SparseMatrix(shape={self.shape}, nnz={self.nnz()}, fill={self.fill!r})"
+
+
+class SparseRow:
+    """
+    Pohled na jeden řádek `SparseMatrix` chovající se jako seznam hodnot.
+    """
+
+    __slots__ = ('_matrix', '_row')
+
+    def __init__(self, matrix, row):
+        self._matrix = matrix
+        self._row = row
+
+    def __len__(self):
+        return self._matrix.shape[1]
+
+    def __getitem__(self, j):
+        if j < 0:
+            j += self._matrix.shape[1]
+        if not 0 <= j < self._matrix.shape[1]:
+            raise IndexError('index sloupce mimo rozsah')
+        return self._matrix.get(self._row, j)
+
+    def __iter__(self):
+        return iter(self._matrix.row_values(self._row))
+
+    def items(self):
+        """Vrátí dvojice (sloupec, hodnota) uložených buněk řádku."""
+        return self._matrix.row(self._row)
@@ -3,5 +3,7 @@ Utility moduly pro parsování a pomocné funkce.
 """
 
 from .graph_parser import GraphParser
+from .graph_cache import GraphCache
+from .hierarchy_cache import HierarchyCache
 
-__all__ = ['GraphParser']
+__all__ = ['GraphParser', 'GraphCache', 'HierarchyCache']
@@ -0,0 +1,321 @@
+"""
+Perzistentní binární cache (.tgc) pro naparsované grafy.
+
+Soubor `graf.tg.tgc` leží vedle zdrojového souboru a obsahuje tabulku uzlů,
+pole hran, váhy, popisky a hotové CSR v binárním rozložení, které lze přímo
+namapovat do paměti (mmap). Hlavička nese vlastnosti grafu a varování
+parseru. Cache je platná pouze pokud sedí cesta, velikost, čas modifikace
+a SHA-256 obsahu zdrojového souboru.
+
+Rozložení souboru:
+    MAGIC (4 B) | délka hlavičky (uint32) | JSON hlavička | sekce polí
+Každá sekce je zarovnaná na 8 bajtů a její typ, offset a počet prvků
+jsou uvedeny v hlavičce.
+"""
+
+import gc
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from ..models import Node, Edge, Graph, CSRGraph
+
+
+class GraphCache:
+    """
+    Třída pro ukládání a načítání zkompilovaných grafů (.tgc).
+    """
+
+    MAGIC = b'TGC1'
+    VERSION = 2
+    SUFFIX = '.tgc'
+
+    # Druhy hodnot (uzlů i vah hran)
+    KIND_NONE = 0
+    KIND_FLOAT = 1
+    KIND_STR = 2
+
+    @staticmethod
+    def cache_path(file_path):
+        """Vrátí cestu k cache souboru pro daný zdrojový soubor."""
+        return file_path + GraphCache.SUFFIX
+
+    @staticmethod
+    def source_key(file_path):
+        """
+        Spočítá klíč zdrojového souboru.
+
+        Args:
+            file_path (str): Cesta ke zdrojovému souboru
+
+        Returns:
+            dict: {'source', 'size', 'mtime_ns', 'sha256'}
+        """
+        st = os.stat(file_path)
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return {
+            'source': os.path.abspath(file_path),
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': digest.hexdigest(),
+        }
+
+    @staticmethod
+    def load(file_path):
+        """
+        Načte graf z cache, pokud existuje a odpovídá zdrojovému souboru.
+
+        Graf se sestaví přímo z uložených polí včetně CSR a vlastností,
+        hrany se znovu nepřidávají ani nepřepočítávají.
+
+        Args:
+            file_path (str): Cesta ke zdrojovému souboru (ne k .tgc)
+
+        Returns:
+            tuple: (Graph, seznam varování parseru) nebo None pokud cache chybí či je zastaralá
+        """
+        path = GraphCache.cache_path(file_path)
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < 8:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return GraphCache._read(mm, file_path)
+        except (OSError, ValueError, KeyError, IndexError, TypeError, struct.error):
+            return None
+
+    @staticmethod
+    def _read(mm, file_path):
+        """Přečte a zvaliduje namapovaný cache soubor."""
+        if mm[:4] != GraphCache.MAGIC:
+            return None
+        (header_len,) = struct.unpack_from('<I', mm, 4)
+        header = json.loads(mm[8:8 + header_len].decode('utf-8'))
+        if header.get('version') != GraphCache.VERSION or header.get('byteorder') != sys.byteorder:
+            return None
+
+        key = header['key']
+        st = os.stat(file_path)
+        if (key['source'] != os.path.abspath(file_path) or key['size'] != st.st_size
+                or key['mtime_ns'] != st.st_mtime_ns):
+            return None
+        if key['sha256'] != GraphCache.source_key(file_path)['sha256']:
+            return None
+
+        # Sekce se zkopírují do polí po blocích bajtů (bez převodu na seznamy)
+        view = memoryview(mm)
+        sections = {}
+        try:
+            for name, (typecode, offset, count) in header['sections'].items():
+                arr = array(typecode)
+                arr.frombytes(view[offset:offset + count * arr.itemsize])
+                if len(arr) != count:
+                    raise ValueError(f"Zkrácená sekce {name}")
+                sections[name] = arr
+            blob = bytes(view[header['blob'][0]:header['blob'][0] + header['blob'][1]])
+        finally:
+            view.release()
+
+        str_offsets = sections['str_offsets']
+        strings = [blob[str_offsets[i]:str_offsets[i + 1]].decode('utf-8')
+                   for i in range(len(str_offsets) - 1)]
+
+        def values_of(prefix):
+            values = []
+            for kind, num, ref in zip(sections[prefix + '_kind'], sections[prefix + '_num'],
+                                      sections[prefix + '_ref']):
+                if kind == GraphCache.KIND_FLOAT:
+                    values.append(num)
+                elif kind == GraphCache.KIND_STR:
+                    values.append(strings[ref])
+                else:
+                    values.append(None)
+            return values
+
+        # Uzly a hrany netvoří cykly - sběrač cyklů by při hromadném vytváření
+        # objektů jen opakovaně procházel rostoucí haldu
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            node_list = [Node(strings[id_ref], value)
+                         for id_ref, value in zip(sections['node_id'], values_of('node'))]
+            nodes_dict = {node.identifier: node for node in node_list}
+
+            labels = [strings[label] if label >= 0 else None for label in sections['edge_label']]
+            edges_list = [Edge(node_list[u], node_list[v], direction, weight, label)
+                          for u, v, direction, weight, label in zip(
+                              sections['edge_u'], sections['edge_v'],
+                              sections['edge_dir'].tobytes().decode('ascii'), values_of('weight'), labels)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        properties = header['properties']
+        ids = [node_list[i].identifier for i in sections['canon']]
+        if properties['is_directed']:
+            rev = sections['csr_rev_offsets'], sections['csr_rev_sources'], sections['csr_rev_edge_ids']
+        else:
+            rev = None, None, None
+        csr = CSRGraph(ids, sections['csr_offsets'], sections['csr_targets'], sections['csr_weights'],
+                       rev[0], rev[1], properties['is_directed'],
+                       edge_ids=sections['csr_edge_ids'], rev_edge_ids=rev[2])
+
+        graph = Graph()
+        graph.load_compiled(nodes_dict, edges_list, csr, properties)
+        return graph, header['warnings']
+
+    @staticmethod
+    def save(file_path, graph, warnings=()):
+        """
+        Uloží načtený graf do cache vedle zdrojového souboru.
+
+        Kromě uzlů a hran se ukládá i CSR, vlastnosti grafu a varování
+        parseru, aby je načtení z cache mohlo převzít a znovu vypsat.
+        Zápis je atomický (dočasný soubor + přejmenování). Pokud zápis selže
+        (např. adresář jen pro čtení), cache se tiše přeskočí.
+
+        Args:
+            file_path (str): Cesta ke zdrojovému souboru
+            graph (Graph): Graf načtený z tohoto souboru
+            warnings (iterable): Varování vypsaná parserem při načítání
+
+        Returns:
+            str: Cesta k cache souboru nebo None pokud se nepodařilo uložit
+        """
+        strings = []
+        string_index = {}
+
+        def intern(text):
+            idx = string_index.get(text)
+            if idx is None:
+                idx = string_index[text] = len(strings)
+                strings.append(text)
+            return idx
+
+        def encode_value(value, kinds, nums, refs):
+            if value is None:
+                kinds.append(GraphCache.KIND_NONE)
+                nums.append(0.0)
+                refs.append(-1)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                kinds.append(GraphCache.KIND_FLOAT)
+                nums.append(float(value))
+                refs.append(-1)
+            else:
+                kinds.append(GraphCache.KIND_STR)
+                nums.append(0.0)
+                refs.append(intern(str(value)))
+
+        node_index = {}
+        node_id, node_kind, node_num, node_ref = array('i'), array('b'), array('d'), array('i')
+        for identifier, node in graph.nodes.items():
+            node_index[identifier] = len(node_index)
+            node_id.append(intern(identifier))
+            encode_value(node.value, node_kind, node_num, node_ref)
+
+        edge_u, edge_v, edge_dir, edge_label = array('i'), array('i'), array('b'), array('i')
+        weight_kind, weight_num, weight_ref = array('b'), array('d'), array('i')
+        for edge in graph.edges:
+            u = node_index.get(edge.u.identifier)
+            v = node_index.get(edge.v.identifier)
+            if u is None or v is None:
+                # Hrana mimo tabulku uzlů - takový graf necachujeme
+                return None
+            edge_u.append(u)
+            edge_v.append(v)
+            edge_dir.append(ord(edge.direction))
+            encode_value(edge.weight, weight_kind, weight_num, weight_ref)
+            edge_label.append(intern(edge.label) if edge.label is not None else -1)
+
+        encoded = [s.encode('utf-8') for s in strings]
+        str_offsets = array('q', [0])
+        for chunk in encoded:
+            str_offsets.append(str_offsets[-1] + len(chunk))
+        blob = b''.join(encoded)
+
+        arrays = {
+            'str_offsets': str_offsets,
+            'node_id': node_id, 'node_kind': node_kind, 'node_num': node_num, 'node_ref': node_ref,
+            'edge_u': edge_u, 'edge_v': edge_v, 'edge_dir': edge_dir, 'edge_label': edge_label,
+            'weight_kind': weight_kind, 'weight_num': weight_num, 'weight_ref': weight_ref,
+        }
+
+        # CSR nad seřazenými uzly (canon: pořadí -> index v tabulce uzlů)
+        csr = graph.get_csr()
+        arrays['canon'] = array('i', [node_index[node_id] for node_id in csr.ids])
+        arrays['csr_offsets'] = csr.offsets
+        arrays['csr_targets'] = csr.targets
+        arrays['csr_weights'] = csr.weights
+        arrays['csr_edge_ids'] = csr.edge_ids
+        if graph.is_directed:
+            arrays['csr_rev_offsets'] = csr.rev_offsets
+            arrays['csr_rev_sources'] = csr.rev_sources
+            arrays['csr_rev_edge_ids'] = csr.rev_edge_ids
+        properties = {
+            'is_directed': graph.is_directed,
+            'is_weighted': graph.is_weighted,
+            'has_negative_weights': graph.has_negative_weights,
+            'has_loops': graph.has_loops,
+            'has_multiple_edges': graph.has_multiple_edges,
+        }
+
+        try:
+            key = GraphCache.source_key(file_path)
+        except OSError:
+            return None
+
+        # Offsety sekcí závisí na délce hlavičky, proto ji počítáme, dokud se neustálí
+        header = {'version': GraphCache.VERSION, 'byteorder': sys.byteorder, 'key': key,
+                  'properties': properties, 'warnings': list(warnings),
+                  'sections': {}, 'blob': [0, len(blob)]}
+        header_bytes = b''
+        while True:
+            offset = GraphCache._align(8 + len(header_bytes))
+            for name, arr in arrays.items():
+                header['sections'][name] = [arr.typecode, offset, len(arr)]
+                offset = GraphCache._align(offset + len(arr) * arr.itemsize)
+            header['blob'] = [offset, len(blob)]
+            new_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+            if new_bytes == header_bytes:
+                break
+            header_bytes = new_bytes
+
+        path = GraphCache.cache_path(file_path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(GraphCache.MAGIC)
+                f.write(struct.pack('<I', len(header_bytes)))
+                f.write(header_bytes)
+                for name, arr in arrays.items():
+                    GraphCache._pad_to(f, header['sections'][name][1])
+                    arr.tofile(f)
+                GraphCache._pad_to(f, header['blob'][0])
+                f.write(blob)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+        return path
+
+    @staticmethod
+    def _align(offset, alignment=8):
+        """Zarovná offset nahoru na násobek `alignment`."""
+        return (offset + alignment - 1) // alignment * alignment
+
+    @staticmethod
+    def _pad_to(f, offset):
+        """Doplní soubor nulami až na zadaný offset."""
+        pos = f.tell()
+        if pos < offset:
+            f.write(b'\0' * (offset - pos))
@@ -2,6 +2,11 @@
 Parser pro načítání grafů z textových souborů.
 """
 
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
 from ..models import Node, Edge
 
 class GraphParser:
@@ -9,13 +14,20 @@ class GraphParser:
     Třída pro parsování grafů z textového formátu.
     """
     
+    NODE = 'node'
+    EDGE = 'edge'
+
+    # Pod touto velikostí souboru se paralelní režim nevyplatí
+    PARALLEL_MIN_BYTES = 1 << 20
+
     @staticmethod
-    def parse_file(file_path):
+    def parse_file(file_path, jobs=1):
         """
         Načte graf z textového souboru.
         
         Args:
             file_path (str): Cesta k souboru
+            jobs (int): Počet procesů pro paralelní parsování (1 = sériově)
             
         Returns:
             tuple: (nodes_dict, edges_list) kde nodes_dict je slovník uzlů a edges_list je seznam hran
@@ -24,13 +36,7 @@ class GraphParser:
             FileNotFoundError: Pokud soubor neexistuje
             ValueError: Pokud je formát souboru neplatný
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Soubor '{file_path}' nebyl nalezen.")
-        
-        return GraphParser.parse_lines(lines)
+        return GraphParser.collect(GraphParser.iter_records(file_path, jobs))
     
     @staticmethod
     def parse_lines(lines):
@@ -38,18 +44,98 @@ class GraphParser:
         Parsuje řádky s definicí grafu.
         
         Args:
-            lines (list): Seznam řádků s definicí grafu
+            lines (iterable): Řádky s definicí grafu
             
+        Returns:
+            tuple: (nodes_dict, edges_list)
+        """
+        return GraphParser.collect(GraphParser.iter_line_records(lines))
+
+    @staticmethod
+    def collect(records):
+        """
+        Sestaví (nodes_dict, edges_list) z proudu záznamů.
+
+        Args:
+            records (iterable): Záznamy (druh, objekt) z `iter_records`
+
         Returns:
             tuple: (nodes_dict, edges_list)
         """
         nodes_dict = {}
         edges_list = []
-        position_counter = 0
+        for kind, item in records:
+            if kind == GraphParser.NODE:
+                nodes_dict[item.identifier] = item
+            else:
+                edges_list.append(item)
+        return nodes_dict, edges_list
 
-        has_asterisks = any('*' in line for line in lines 
-            if line.strip() and line.strip().startswith('u '))
-        
+    @staticmethod
+    def iter_records(file_path, jobs=1, warnings=None):
+        """
+        Postupně čte soubor a vrací záznamy uzlů a hran (generátor).
+
+        Soubor se čte po řádcích, takže paměť roste s velikostí grafu,
+        nikoli s velikostí textu. Pro `jobs > 1` se velký soubor rozdělí
+        na bloky podle hranic řádků, které se parsují paralelně v procesech.
+
+        Args:
+            file_path (str): Cesta k souboru
+            jobs (int): Počet procesů pro paralelní parsování (1 = sériově)
+            warnings (list): Volitelný seznam, do kterého se kromě výpisu
+                přidávají texty varování (např. pro uložení do cache)
+
+        Yields:
+            tuple: ('node', Node) nebo ('edge', Edge)
+
+        Raises:
+            FileNotFoundError: Pokud soubor neexistuje
+        """
+        if jobs and jobs > 1:
+            yield from GraphParser._iter_records_parallel(file_path, jobs, warnings)
+            return
+        try:
+            f = open(file_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Soubor '{file_path}' nebyl nalezen.")
+        with f:
+            yield from GraphParser.iter_line_records(f, warnings)
+
+    @staticmethod
+    def iter_line_records(lines, warnings=None):
+        """
+        Jednoprůchodový parser nad libovolným iterátorem řádků.
+
+        Uzly a explicitní hrany se vrací hned při přečtení. Pokud některý řádek
+        uzlu obsahuje '*', jde o binární strom v level-order zápisu: hrany
+        rodič -> dítě se skládají průběžně s příchodem dětí a vrátí se na konci
+        (za explicitními hranami, ve stejném pořadí jako dříve), protože
+        o režimu stromu rozhoduje až celý soubor.
+
+        Args:
+            lines (iterable): Řádky s definicí grafu
+            warnings (list): Volitelný seznam pro texty varování (viz `iter_records`)
+
+        Yields:
+            tuple: ('node', Node) nebo ('edge', Edge)
+        """
+        return GraphParser._resolve_raw([(0, GraphParser._scan_lines(lines))], warnings)
+
+    @staticmethod
+    def _scan_lines(lines):
+        """
+        Rozloží řádky na surové záznamy bez vazby na tabulku uzlů.
+
+        Tato část nezávisí na předchozích řádcích, a proto ji lze spouštět
+        paralelně nad bloky souboru. Čísla řádků jsou relativní k bloku.
+
+        Yields:
+            tuple: ('u', řádek, obsahuje_hvězdičku, identifikátor|None, hodnota)
+                   ('h', řádek, (u_id, symbol, v_id, směr, váha, popisek))
+                   ('f', řádek, specifikace_hrany)  - neplatný formát hrany
+                   ('x', řádek, text_chyby)        - výjimka při parsování
+        """
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
             if not line or line.startswith('#'):  # Prázdné řádky a komentáře
@@ -60,67 +146,209 @@ class GraphParser:
                 command = parts[0].strip()
                 
                 if command.startswith('u '):
-                    if has_asterisks:
-                        node = GraphParser._parse_node_with_position(command, position_counter)
-                        position_counter += 1
+                    if command[2:].strip() == '*':
+                        # Placeholder - identifikátor závisí na pozici v celém souboru
+                        yield 'u', line_num, True, None, None
                     else:
                         node = GraphParser._parse_node(command)
-                
-                    nodes_dict[node.identifier] = node
+                        yield 'u', line_num, '*' in line, node.identifier, node.value
                     
                 elif command.startswith('h '):
-                    edge = GraphParser._parse_edge(command, nodes_dict)
-                    if edge:
-                        edges_list.append(edge)
+                    fields = GraphParser._split_edge(command)
+                    if fields is None:
+                        yield 'f', line_num, command[2:].strip()
+                    else:
+                        yield 'h', line_num, fields
                         
             except Exception as e:
-                print(f"Varování: Chyba na řádku {line_num}: {e}")
-                continue
+                yield 'x', line_num, str(e)
+
+    @staticmethod
+    def _resolve_raw(chunks, warnings=None):
+        """
+        Převede surové záznamy na uzly a hrany v pořadí souboru.
+
+        Zde se řeší vše, co závisí na předchozích řádcích: tabulka uzlů,
+        hledání koncových uzlů hran, pozice v binárním stromu a varování.
+
+        Args:
+            chunks (iterable): Dvojice (posun_čísel_řádků, surové záznamy)
+            warnings (list): Volitelný seznam pro texty varování
+
+        Yields:
+            tuple: ('node', Node) nebo ('edge', Edge)
+        """
+        nodes_dict = {}
+        node_sequence = []   # level-order identifikátory uzlů (pro binární strom)
+        tree_edges = []      # (parent_id, child_id, label) pro binární strom
+        has_asterisks = False
+
+        for line_offset, raw_records in chunks:
+            for record in raw_records:
+                kind = record[0]
+                try:
+                    if kind == 'h':
+                        # Nejčastější případ - hledání uzlů je vloženo přímo
+                        fields = record[2]
+                        u_node = nodes_dict.get(fields[0])
+                        v_node = nodes_dict.get(fields[2])
+                        if u_node is None or v_node is None:
+                            GraphParser._warn(f"Varování: Uzel(y) pro hranu {fields[0]} {fields[1]} {fields[2]} nebyly nalezeny. Přeskakuji hranu.", warnings)
+                        else:
+                            yield GraphParser.EDGE, Edge(u_node, v_node, fields[3], fields[4], fields[5])
+
+                    elif kind == 'u':
+                        _, _, star, identifier, value = record
+                        if star:
+                            has_asterisks = True
+                        position = len(node_sequence)
+                        if identifier is None:
+                            node = Node(f"*_{position}", None)
+                        else:
+                            node = Node(identifier, value)
+                        nodes_dict[node.identifier] = node
+                        node_sequence.append(node.identifier)
+
+                        # Hrana z rodiče (level-order: rodič pozice p má děti 2p+1 a 2p+2)
+                        if position > 0:
+                            parent_id = node_sequence[(position - 1) // 2]
+                            if (not parent_id.startswith('*_') and
+                                    not node.identifier.startswith('*_')):
+                                label = 'left' if position % 2 == 1 else 'right'
+                                tree_edges.append((parent_id, node.identifier, label))
+
+                        yield GraphParser.NODE, node
+
+                    elif kind == 'f':
+                        GraphParser._warn(f"Varování: Neplatný formát hrany: {record[2]}", warnings)
+
+                    else:
+                        GraphParser._warn(f"Varování: Chyba na řádku {line_offset + record[1]}: {record[2]}", warnings)
+
+                except Exception as e:
+                    GraphParser._warn(f"Varování: Chyba na řádku {line_offset + record[1]}: {e}", warnings)
+                    continue
         
         # Automatické vytvoření hran pro binární strom
         if has_asterisks:
-            # Vytvoř level-order sekvenci uzlů  
-            node_sequence = []
-            temp_position = 0
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('u '):
-                    node_spec = line[2:].split(';')[0].strip()
-                    if node_spec == '*':
-                        node_sequence.append(f"*_{temp_position}")
+            for parent_id, child_id, label in tree_edges:
+                yield GraphParser.EDGE, Edge(nodes_dict[parent_id], nodes_dict[child_id], '>', None, label)
+
+    @staticmethod
+    def _iter_records_parallel(file_path, jobs, warnings=None):
+        """
+        Paralelní varianta `iter_records`.
+
+        Soubor se rozdělí na `jobs` bloků zarovnaných na konce řádků, které
+        se v `ProcessPoolExecutor` zpracují ve dvou fázích:
+
+        1. procesy v blocích najdou řádky uzlů a spočítají řádky; z nich se
+           v pořadí souboru sestaví tabulka uzlů (identifikátor -> pozice),
+        2. procesy rozloží hrany bloku, koncové uzly vyhledají v tabulce
+           platné na začátku bloku a vrátí kompaktní pole (`_parse_edge_chunk`).
+
+        Zde se už jen z polí vytvoří objekty `Edge` nad sdílenými uzly.
+        Pořadí záznamů, varování i čísla řádků odpovídají sériovému parseru.
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Soubor '{file_path}' nebyl nalezen.")
+
+        if size < GraphParser.PARALLEL_MIN_BYTES:
+            # Malý soubor: režie procesů by převážila
+            yield from GraphParser.iter_records(file_path, warnings=warnings)
+            return
+
+        bounds = GraphParser._chunk_bounds(file_path, size, jobs)
+        chunks = [(file_path, start, end) for start, end in zip(bounds, bounds[1:])]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            nodes = []           # uzly v pořadí definic (pozice = level-order pro binární strom)
+            table = {}           # identifikátor -> pozice poslední definice
+            tree_edges = []      # (parent_id, child_id, label) pro binární strom
+            has_asterisks = False
+            tasks = []
+            line_offset = 0
+            for chunk, (node_records, line_count) in zip(chunks, executor.map(_scan_node_chunk, chunks)):
+                # Blok dostane tabulku platnou na svém začátku, uzly bloku si doplní sám
+                tasks.append(chunk + (line_offset, len(nodes), dict(table)))
+                line_offset += line_count
+                for star, identifier, value in node_records:
+                    if star:
+                        has_asterisks = True
+                    position = len(nodes)
+                    node = Node(f"*_{position}", None) if identifier is None else Node(identifier, value)
+                    table[node.identifier] = position
+                    nodes.append(node)
+
+                    # Hrana z rodiče (level-order: rodič pozice p má děti 2p+1 a 2p+2)
+                    if position > 0:
+                        parent_id = nodes[(position - 1) // 2].identifier
+                        if (not parent_id.startswith('*_') and
+                                not node.identifier.startswith('*_')):
+                            label = 'left' if position % 2 == 1 else 'right'
+                            tree_edges.append((parent_id, node.identifier, label))
+
+            position = 0
+            for edges in executor.map(_parse_edge_chunk, tasks):
+                # Uzly a varování bloku se vloží mezi hrany podle počtu hran před nimi
+                done = 0
+                for edge_count, message in edges[-1]:
+                    yield from GraphParser._chunk_edges(nodes, edges, done, edge_count)
+                    done = edge_count
+                    if message is None:
+                        yield GraphParser.NODE, nodes[position]
+                        position += 1
                     else:
-                        node_sequence.append(node_spec)
-                    temp_position += 1
-            
-            # Vytvoř hrany podle binární struktury
-            for i, parent_id in enumerate(node_sequence):
-                left_child_idx = 2 * i + 1
-                right_child_idx = 2 * i + 2
-                
-                # Levé dítě
-                if left_child_idx < len(node_sequence):
-                    child_id = node_sequence[left_child_idx] 
-                    if (not parent_id.startswith('*_') and 
-                        not child_id.startswith('*_')):
-                        from ..models import Edge
-                        parent_node = nodes_dict[parent_id]
-                        child_node = nodes_dict[child_id]
-                        edge = Edge(parent_node, child_node, '>', None, 'left')
-                        edges_list.append(edge)
-                
-                # Pravé dítě  
-                if right_child_idx < len(node_sequence):
-                    child_id = node_sequence[right_child_idx]
-                    if (not parent_id.startswith('*_') and 
-                        not child_id.startswith('*_')):
-                        from ..models import Edge  
-                        parent_node = nodes_dict[parent_id]
-                        child_node = nodes_dict[child_id]
-                        edge = Edge(parent_node, child_node, '>', None, 'right')
-                        edges_list.append(edge)
+                        GraphParser._warn(message, warnings)
+                yield from GraphParser._chunk_edges(nodes, edges, done, len(edges[0]))
 
-        return nodes_dict, edges_list
+        # Automatické vytvoření hran pro binární strom
+        if has_asterisks:
+            for parent_id, child_id, label in tree_edges:
+                yield GraphParser.EDGE, Edge(nodes[table[parent_id]], nodes[table[child_id]], '>', None, label)
+
+    @staticmethod
+    def _warn(message, warnings):
+        """Vypíše varování a případně ho přidá do seznamu `warnings`."""
+        print(message)
+        if warnings is not None:
+            warnings.append(message)
+
+    @staticmethod
+    def _chunk_edges(nodes, edges, start, end):
+        """
+        Vytvoří hrany start..end-1 z polí vrácených `_parse_edge_chunk`.
+
+        Yields:
+            tuple: ('edge', Edge)
+        """
+        sources, targets, directions, weights, other_weights, label_index, label_values, _ = edges
+        for i in range(start, end):
+            weight = weights[i] if weights else None
+            if weight != weight:  # NaN = bez váhy, nebo váha uložená v other_weights
+                weight = other_weights.get(i)
+            label = label_values[label_index[i]] if label_index else None
+            yield GraphParser.EDGE, Edge(nodes[sources[i]], nodes[targets[i]], directions[i], weight, label)
+
+    @staticmethod
+    def _chunk_bounds(file_path, size, jobs):
+        """Vrátí bajtové hranice bloků; každý blok (kromě posledního) končí znakem nového řádku."""
+        bounds = [0]
+        with open(file_path, 'rb') as f:
+            for i in range(1, jobs):
+                target = max(size * i // jobs, bounds[-1])
+                f.seek(target)
+                if target > 0:
+                    f.readline()  # dočti rozpracovaný řádek
+                pos = f.tell()
+                if pos >= size:
+                    break
+                if pos > bounds[-1]:
+                    bounds.append(pos)
+        bounds.append(size)
+        return bounds
     
     @staticmethod
     def _parse_node(command):
@@ -162,51 +390,25 @@ class GraphParser:
         return Node(identifier, value)
     
     @staticmethod
-    def _parse_node_with_position(command, position):
-        """
-        Parsuje uzel s pozičním trackingem pro binární stromy.
+    def _split_edge(command):
         """
-        node_spec = command[2:].strip()
-        
-        if node_spec == '*':
-            # Vytvoří unikátní identifikátor pro placeholder uzel
-            identifier = f"*_{position}"
-            return Node(identifier, None)
-        else:
-            # Standardní zpracování skutečných uzlů
-            return GraphParser._parse_node(command)
-
-    
-    @staticmethod
-    def _parse_edge(command, nodes_dict):
-        """
-        Parsuje definici hrany.
+        Rozloží definici hrany na jednotlivá pole (bez vazby na uzly).
         
         Args:
             command (str): Řádek s definicí hrany
-            nodes_dict (dict): Slovník existujících uzlů
             
         Returns:
-            Edge: Objekt hrany nebo None při chybě
+            tuple: (u_id, direction_symbol, v_id, direction, weight, label) nebo None při neplatném formátu
         """
         edge_spec = command[2:].strip()
         
         # Split by spaces, but be careful with weight and label
         parts = edge_spec.split()
         if len(parts) < 3:
-            print(f"Varování: Neplatný formát hrany: {edge_spec}")
             return None
         
-        u_id = parts[0].strip()
-        direction_symbol = parts[1].strip()
-        v_id = parts[2].strip()
-
-        u_node = nodes_dict.get(u_id)
-        v_node = nodes_dict.get(v_id)
-
-        if not u_node or not v_node:
-            print(f"Varování: Uzel(y) pro hranu {u_id} {direction_symbol} {v_id} nebyly nalezeny. Přeskakuji hranu.")
-            return None
+        # str.split() bez argumentu vrací již oříznuté části
+        u_id, direction_symbol, v_id = parts[0], parts[1], parts[2]
 
         weight = None
         label = None
@@ -234,12 +436,105 @@ class GraphParser:
                         # If it's not a number, it might be a string weight
                         weight = weight_str
 
-        # Determine direction for internal representation
-        if direction_symbol == '>':
-            direction = '>'
-        elif direction_symbol == '<':
-            direction = '<'
-        else:  # '-'
-            direction = '-'
+        # Determine direction for internal representation ('-' for anything else)
+        direction = direction_symbol if direction_symbol in ('>', '<') else '-'
+
+        return u_id, direction_symbol, v_id, direction, weight, label
+
+
+def _read_chunk_lines(file_path, start, end):
+    """Přečte bajtový rozsah souboru a vrátí jeho řádky."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # TextIOWrapper zachová stejné dělení řádků jako sériové čtení v textovém režimu
+    return list(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+
+
+def _scan_node_chunk(task):
+    """
+    Úloha pro pracovní proces (1. fáze): najde v bloku souboru definice uzlů.
+
+    Args:
+        task (tuple): (file_path, start, end) - bajtový rozsah bloku
+
+    Returns:
+        tuple: (seznam (obsahuje_hvězdičku, identifikátor|None, hodnota), počet řádků v bloku)
+    """
+    lines = _read_chunk_lines(*task)
+    # Předfiltr: řádek uzlu po oříznutí vždy začíná 'u ', ostatní řádky se nerozkládají
+    node_lines = (line for line in lines if line.lstrip().startswith('u '))
+    records = [record[2:] for record in GraphParser._scan_lines(node_lines) if record[0] == 'u']
+    return records, len(lines)
+
+
+def _parse_edge_chunk(task):
+    """
+    Úloha pro pracovní proces (2. fáze): rozloží hrany bloku nad tabulkou uzlů.
+
+    Uzly definované v bloku se do tabulky doplňují průběžně, takže hrana vidí
+    právě uzly definované před ní (stejně jako v sériovém parseru).
+
+    Args:
+        task (tuple): (file_path, start, end, posun_čísel_řádků, pozice prvního
+                      uzlu bloku, tabulka {identifikátor: pozice} na začátku bloku)
+
+    Returns:
+        tuple: (sources, targets, directions, weights, other_weights, label_index, label_values, marks)
+               - sources/targets: array('i') pozic koncových uzlů hran
+               - directions: řetězec směrů ('>', '<', '-'), jeden znak na hranu
+               - weights: array('d') vah (NaN = bez váhy nebo viz other_weights),
+                 prázdné, pokud žádná hrana bloku nemá váhu
+               - other_weights: {index hrany: váha} pro textové váhy a NaN
+               - label_index: array('i') indexů do label_values (prázdné bez popisků)
+               - label_values: různé popisky bloku, na indexu 0 je None
+               - marks: [(počet hran před záznamem, varování|None pro uzel)]
+    """
+    file_path, start, end, line_offset, position, table = task
+    sources, targets, weights, label_index = array('i'), array('i'), array('d'), array('i')
+    directions = []
+    other_weights = {}
+    label_ids = {None: 0}
+    marks = []
+    nan = float('nan')
+
+    for record in GraphParser._scan_lines(_read_chunk_lines(file_path, start, end)):
+        kind = record[0]
+        if kind == 'h':
+            u_id, direction_symbol, v_id, direction, weight, label = record[2]
+            u = table.get(u_id)
+            v = table.get(v_id)
+            if u is None or v is None:
+                marks.append((len(sources), f"Varování: Uzel(y) pro hranu {u_id} {direction_symbol} {v_id} nebyly nalezeny. Přeskakuji hranu."))
+                continue
+            index = len(sources)
+            sources.append(u)
+            targets.append(v)
+            directions.append(direction)
+            # Pole vah a popisků vzniknou až s první hranou, která je potřebuje
+            # (hrany před ní se doplní jako bez váhy / bez popisku)
+            if weights or weight is not None:
+                weights.extend([nan] * (index - len(weights)))
+                if type(weight) is float and weight == weight:
+                    weights.append(weight)
+                else:
+                    weights.append(nan)
+                    if weight is not None:
+                        other_weights[index] = weight
+            if label_index or label is not None:
+                label_index.extend([0] * (index - len(label_index)))
+                label_index.append(label_ids.setdefault(label, len(label_ids)))
+
+        elif kind == 'u':
+            identifier = record[3]
+            table[f"*_{position}" if identifier is None else identifier] = position
+            position += 1
+            marks.append((len(sources), None))
+
+        elif kind == 'f':
+            marks.append((len(sources), f"Varování: Neplatný formát hrany: {record[2]}"))
+
+        else:
+            marks.append((len(sources), f"Varování: Chyba na řádku {line_offset + record[1]}: {record[2]}"))
 
-        return Edge(u_node, v_node, direction, weight, label)
+    return sources, targets, ''.join(directions), weights, other_weights, label_index, list(label_ids), marks
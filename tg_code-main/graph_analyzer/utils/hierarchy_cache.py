@@ -0,0 +1,131 @@
+"""
+Perzistentní contraction hierarchy (.tgch) uložená vedle souboru grafu.
+
+Soubor `graf.tg.tgch` má stejné rozložení jako cache grafu (.tgc):
+    MAGIC (4 B) | délka hlavičky (uint32) | JSON hlavička | sekce polí
+Hierarchie je platná jen pro stejný zdrojový soubor (cesta, velikost, čas
+modifikace, SHA-256) a stejný počet uzlů i hran CSR.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+
+from ..models import ContractionHierarchy
+from .graph_cache import GraphCache
+
+
+class HierarchyCache:
+    """
+    Třída pro ukládání a načítání contraction hierarchy (.tgch).
+    """
+
+    MAGIC = b'TGH1'
+    VERSION = 1
+    SUFFIX = '.tgch'
+
+    # Názvy sekcí polí dopředného (up) a zpětného (down) horního grafu
+    PARTS = ('offsets', 'ends', 'weights', 'mids', 'slots')
+
+    @staticmethod
+    def cache_path(file_path):
+        """Vrátí cestu k souboru hierarchie pro daný zdrojový soubor."""
+        return file_path + HierarchyCache.SUFFIX
+
+    @staticmethod
+    def load(file_path, csr):
+        """
+        Načte hierarchii, pokud existuje a odpovídá zdrojovému souboru i grafu.
+
+        Args:
+            file_path (str): Cesta ke zdrojovému souboru grafu
+            csr (CSRGraph): CSR načteného grafu
+
+        Returns:
+            ContractionHierarchy: Načtená hierarchie nebo None (chybí / je zastaralá)
+        """
+        path = HierarchyCache.cache_path(file_path)
+        try:
+            with open(path, 'rb') as f:
+                if f.read(4) != HierarchyCache.MAGIC:
+                    return None
+                (header_len,) = struct.unpack('<I', f.read(4))
+                header = json.loads(f.read(header_len).decode('utf-8'))
+                if (header.get('version') != HierarchyCache.VERSION
+                        or header.get('byteorder') != sys.byteorder
+                        or header.get('nodes') != csr.node_count()
+                        or header.get('slots') != csr.slot_count()):
+                    return None
+                if header['key'] != GraphCache.source_key(file_path):
+                    return None
+                sections = {}
+                for name, (typecode, offset, count) in header['sections'].items():
+                    f.seek(offset)
+                    arr = array(typecode)
+                    arr.fromfile(f, count)
+                    sections[name] = arr
+        except (OSError, ValueError, KeyError, TypeError, EOFError, struct.error):
+            return None
+
+        up = tuple(sections['up_' + part] for part in HierarchyCache.PARTS)
+        down = tuple(sections['down_' + part] for part in HierarchyCache.PARTS)
+        return ContractionHierarchy(csr.ids, sections['rank'], up, down, header['shortcuts'])
+
+    @staticmethod
+    def save(file_path, hierarchy, csr):
+        """
+        Uloží hierarchii vedle zdrojového souboru (atomicky, chyba zápisu se přeskočí).
+
+        Args:
+            file_path (str): Cesta ke zdrojovému souboru grafu
+            hierarchy (ContractionHierarchy): Sestavená hierarchie
+            csr (CSRGraph): CSR grafu, ze kterého hierarchie vznikla
+
+        Returns:
+            str: Cesta k souboru hierarchie nebo None pokud se nepodařilo uložit
+        """
+        try:
+            key = GraphCache.source_key(file_path)
+        except OSError:
+            return None
+
+        arrays = {'rank': hierarchy.rank}
+        for prefix, graph in (('up_', hierarchy.up), ('down_', hierarchy.down)):
+            for part, arr in zip(HierarchyCache.PARTS, graph):
+                arrays[prefix + part] = arr
+
+        header = {'version': HierarchyCache.VERSION, 'byteorder': sys.byteorder, 'key': key,
+                  'nodes': csr.node_count(), 'slots': csr.slot_count(),
+                  'shortcuts': hierarchy.shortcut_count, 'sections': {}}
+        # Offsety sekcí závisí na délce hlavičky, proto ji počítáme, dokud se neustálí
+        header_bytes = b''
+        while True:
+            offset = GraphCache._align(8 + len(header_bytes))
+            for name, arr in arrays.items():
+                header['sections'][name] = [arr.typecode, offset, len(arr)]
+                offset = GraphCache._align(offset + len(arr) * arr.itemsize)
+            new_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+            if new_bytes == header_bytes:
+                break
+            header_bytes = new_bytes
+
+        path = HierarchyCache.cache_path(file_path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(HierarchyCache.MAGIC)
+                f.write(struct.pack('<I', len(header_bytes)))
+                f.write(header_bytes)
+                for name, arr in arrays.items():
+                    GraphCache._pad_to(f, header['sections'][name][1])
+                    arr.tofile(f)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+        return path